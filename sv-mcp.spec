@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=['yaml'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
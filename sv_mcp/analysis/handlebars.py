@@ -0,0 +1,311 @@
+"""
+Local checks of the Handlebars templates accepted by the VS runtime (WireMock response templating plus the
+BlazeMeter helpers), run before a template is sent to the validation endpoint.
+Errors are the problems the runtime certainly rejects: tags, comments and string literals that are never
+closed and unbalanced blocks. Every other finding is a warning, as the runtime may still accept the template.
+"""
+import bisect
+import json
+import re
+from typing import List, Optional, Tuple
+
+# Block helpers nested deeper than this are reported
+MAX_BLOCK_DEPTH = 2
+
+KNOWN_HELPERS = {
+    # Handlebars built-ins
+    "if", "unless", "each", "with", "lookup", "log",
+    # Conditionals and comparisons
+    "eq", "neq", "gt", "gte", "lt", "lte", "and", "or", "not", "contains", "matches", "startsWith", "endsWith",
+    "isOdd", "isEven", "yesno",
+    # Values and variables
+    "assign", "val", "size", "first", "last", "math", "abs", "numberFormat", "toInteger", "toDecimal",
+    "randomValue", "randomInt", "randomDecimal", "pickRandom", "hostname", "systemValue", "base64", "urlEncode",
+    "formData", "parseJson", "toJson", "formatJson", "formatXml", "jsonPath", "jsonMerge", "jsonRemove",
+    "jsonArrayAdd", "jsonSort", "xPath", "xpath", "soapXPath", "regexExtract", "split",
+    # Arrays and ranges
+    "array", "arrayAdd", "arrayRemove", "arrayJoin", "range",
+    # Strings
+    "join", "replace", "upper", "lower", "capitalize", "capitalizeFirst", "defaultIfEmpty", "cut", "slugify",
+    "stripTags", "substring", "ljust", "rjust", "center", "trim", "abbreviate", "wordWrap",
+    # Dates
+    "now", "date", "dateFormat", "parseDate", "truncateDate",
+}
+
+# Block helpers whose content is not rendered in place
+SILENT_BLOCKS = {"assign"}
+
+# Block helpers rendering their content any number of times, possibly none
+LOOP_BLOCKS = {"each"}
+
+NAME = re.compile(r"[^\s()]+")
+
+
+class TemplateIssue:
+    """
+    A problem found in a template, at a 1-based line and column.
+    """
+
+    def __init__(self, line: int, column: int, message: str):
+        self.line = line
+        self.column = column
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"Line {self.line}, column {self.column}: {self.message}"
+
+
+class TemplateCheck:
+    """
+    Errors and warnings found in a template.
+    """
+
+    def __init__(self):
+        self.errors: List[TemplateIssue] = []
+        self.warnings: List[TemplateIssue] = []
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+
+class _Block:
+
+    def __init__(self, name: str, offset: int):
+        self.name = name
+        self.offset = offset
+        self.has_else = False
+
+
+class _Checker:
+
+    def __init__(self, template: str):
+        self.template = template
+        self.line_starts = [0] + [match.end() for match in re.finditer("\n", template)]
+        self.result = TemplateCheck()
+        self.blocks: List[_Block] = []
+        # JSON outline: the text outside tags, with a placeholder value for every expression, only the first
+        # branch of every block, loops rendered zero times (only their else branch) and nothing of silent blocks
+        # or partial blocks. (outline offset, template offset) pairs map outline positions back.
+        self.outline: List[str] = []
+        self.outline_length = 0
+        self.outline_offsets: List[Tuple[int, int]] = []
+        self.skip_depth: Optional[int] = None
+
+    def issue(self, offset: int, message: str, error: bool = True) -> None:
+        line = bisect.bisect_right(self.line_starts, offset)
+        issue = TemplateIssue(line, offset - self.line_starts[line - 1] + 1, message)
+        (self.result.errors if error else self.result.warnings).append(issue)
+
+    def emit(self, text: str, offset: int) -> None:
+        if self.skip_depth is None and text:
+            self.outline_offsets.append((self.outline_length, offset))
+            self.outline.append(text)
+            self.outline_length += len(text)
+
+    def check(self) -> TemplateCheck:
+        template = self.template
+        position = 0
+        while True:
+            start = template.find("{{", position)
+            if start < 0:
+                break
+            if start > 0 and template[start - 1] == "\\":
+                # Escaped mustache, rendered as is
+                self.emit(template[position:start + 2], position)
+                position = start + 2
+                continue
+            self.emit(template[position:start], position)
+            end = self.tag_end(start)
+            if end is None:
+                return self.result
+            position = end
+        self.emit(template[position:], position)
+        for block in self.blocks:
+            self.issue(block.offset, f"{{{{#{block.name}}}}} is never closed with {{{{/{block.name}}}}}")
+        if not self.result.errors:
+            self.check_json()
+        return self.result
+
+    def tag_end(self, start: int) -> Optional[int]:
+        """
+        Check the tag starting at `start` and return the offset after it, or None when it is not closed.
+        """
+        template = self.template
+        if template.startswith("{{!--", start):
+            end = template.find("--}}", start + 5)
+            if end < 0:
+                self.issue(start, "Comment is never closed with --}}")
+                return None
+            return end + 4
+        if template.startswith("{{!", start):
+            end = template.find("}}", start + 3)
+            if end < 0:
+                self.issue(start, "Comment is never closed with }}")
+                return None
+            return end + 2
+
+        triple = template.startswith("{{{", start)
+        close = "}}}" if triple else "}}"
+        index = start + len(close)
+        quote = None
+        depth = 0
+        while index < len(template):
+            character = template[index]
+            if quote:
+                if character == quote:
+                    quote = None
+            elif character in "'\"":
+                quote = character
+            elif template.startswith(close, index):
+                break
+            elif template.startswith("{{", index):
+                self.issue(start, "Tag is not closed before the next {{")
+                return None
+            elif character == "(":
+                depth += 1
+            elif character == ")":
+                depth -= 1
+                if depth < 0:
+                    self.issue(index, "Unbalanced ) in tag", error=False)
+                    depth = 0
+            index += 1
+        else:
+            self.issue(start, "String literal is never closed" if quote else f"Tag is never closed with {close}")
+            return None
+        if depth > 0:
+            self.issue(start, "Unbalanced ( in tag", error=False)
+        self.tag(start, template[start + len(close):index].strip("~ \t\r\n"), triple)
+        return index + len(close)
+
+    def tag(self, start: int, content: str, triple: bool) -> None:
+        if not content:
+            self.issue(start, "Empty tag", error=False)
+            return
+        kind = content[0]
+        if content == "^" and not triple:
+            # Standalone {{^}} is a shorthand of {{else}}
+            self.branch(start, "else")
+        elif content.startswith(("#>", "#*")) and not triple:
+            # Partial blocks and inline partials are closed by their name and render their content elsewhere
+            name = self.name(content[2:])
+            if not name:
+                self.issue(start, "Partial block without name", error=False)
+                return
+            if content[1] == ">":
+                self.emit("0", start)
+            self.open(start, name, silent=True)
+        elif kind in "#^" and not triple:
+            name = self.name(content[1:])
+            if not name:
+                self.issue(start, "Block helper without name", error=False)
+            elif name == "else":
+                self.issue(start, "{{#else}} is not valid, use {{else}}", error=False)
+            else:
+                self.helper(start, name, block=True)
+                self.subexpressions(start, content[1:])
+                self.open(start, name, silent=name in SILENT_BLOCKS or name in LOOP_BLOCKS)
+        elif kind == "/" and not triple:
+            self.close(start, self.name(content[1:]))
+        elif content == "else" or content.startswith("else "):
+            self.branch(start, content)
+        elif kind == ">":
+            self.emit("0", start)
+        else:
+            if kind == "&":
+                content = content[1:].strip()
+            name = self.name(content)
+            if name and len(content) > len(name):
+                self.helper(start, name, block=False)
+            self.subexpressions(start, content)
+            self.emit("0", start)
+
+    def open(self, start: int, name: str, silent: bool) -> None:
+        self.blocks.append(_Block(name, start))
+        if silent and self.skip_depth is None:
+            self.skip_depth = len(self.blocks)
+        if len(self.blocks) > MAX_BLOCK_DEPTH:
+            self.issue(start, f"Block helpers are nested more than {MAX_BLOCK_DEPTH} levels deep", error=False)
+
+    def close(self, start: int, name: str) -> None:
+        if name == "else":
+            self.issue(start, "{{/else}} is not valid, {{else}} has no closing tag")
+            return
+        if not self.blocks:
+            self.issue(start, f"{{{{/{name}}}}} has no opening {{{{#{name}}}}}")
+            return
+        block = self.blocks[-1]
+        if block.name != name:
+            self.issue(start, f"{{{{/{name}}}}} closes {{{{#{block.name}}}}} opened at line "
+                              f"{bisect.bisect_right(self.line_starts, block.offset)}")
+            if all(open_block.name != name for open_block in self.blocks):
+                return
+            while self.blocks[-1].name != name:
+                self.blocks.pop()
+        if self.skip_depth is not None and self.skip_depth >= len(self.blocks):
+            self.skip_depth = None
+        self.blocks.pop()
+
+    def branch(self, start: int, content: str) -> None:
+        if not self.blocks:
+            self.issue(start, "{{else}} outside a block helper", error=False)
+            return
+        block = self.blocks[-1]
+        if content == "else":
+            if block.has_else:
+                self.issue(start, f"More than one {{{{else}}}} in {{{{#{block.name}}}}}", error=False)
+            block.has_else = True
+        else:
+            chained = self.name(content[4:])
+            if chained:
+                self.helper(start, chained, block=True)
+        if block.name in LOOP_BLOCKS and self.skip_depth == len(self.blocks):
+            # The else branch of a loop is what renders when it runs zero times
+            self.skip_depth = None
+        elif self.skip_depth is None:
+            self.skip_depth = len(self.blocks)
+
+    def helper(self, start: int, name: str, block: bool) -> None:
+        if name not in KNOWN_HELPERS and not name.startswith("@"):
+            kind = "block helper" if block else "helper"
+            self.issue(start, f"Unknown {kind} '{name}'", error=False)
+
+    def subexpressions(self, start: int, content: str) -> None:
+        quote = None
+        for index, character in enumerate(content):
+            if quote:
+                if character == quote:
+                    quote = None
+            elif character in "'\"":
+                quote = character
+            elif character == "(":
+                name = self.name(content[index + 1:])
+                if name:
+                    self.helper(start, name, block=False)
+
+    @staticmethod
+    def name(content: str) -> str:
+        match = NAME.match(content.strip())
+        return match.group(0) if match else ""
+
+    def check_json(self) -> None:
+        outline = "".join(self.outline)
+        if not outline.strip().startswith(("{", "[")):
+            return
+        try:
+            json.loads(outline)
+        except ValueError as e:
+            position = getattr(e, "pos", 0)
+            index = bisect.bisect_right([offset for offset, _ in self.outline_offsets], position) - 1
+            outline_offset, offset = self.outline_offsets[max(index, 0)]
+            offset = min(offset + position - outline_offset, len(self.template) - 1)
+            message = getattr(e, "msg", str(e))
+            self.issue(max(offset, 0), f"Not valid JSON outside helpers: {message}", error=False)
+
+
+def check_template(template: str) -> TemplateCheck:
+    """
+    Check block balance, {{else}} usage, helper names, nesting depth and, for JSON templates, that the text
+    outside helpers is valid JSON.
+    """
+    return _Checker(template).check()
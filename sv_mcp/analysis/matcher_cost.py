@@ -0,0 +1,190 @@
+"""
+Static cost analysis of the request matchers of transactions. Every matcher gets a relative evaluation cost from
+its name and, for regular expressions, the shape of the pattern; patterns prone to catastrophic backtracking
+(ReDoS) are flagged, as are XPath and JSONPath expressions scanning the whole body. When a regular expression is a
+plain or case insensitive literal, or a literal surrounded by .*, the cheaper equals, equals_insensitive or
+contains matcher is suggested.
+"""
+import re
+from typing import Optional, List, Iterable, Tuple
+
+from re import _constants as constants
+
+from sv_mcp.analysis import regex
+from sv_mcp.analysis.matching import decode_base64
+from sv_mcp.models.vs.http_transaction import HttpTransaction
+from sv_mcp.models.vs.matcher_dsl import MatcherDsl
+from sv_mcp.models.vs.matcher_lint import MatcherLint
+
+# Relative cost of evaluating a matcher on a request, before looking at its expression
+MATCHER_COSTS = {
+    "absent": 1,
+    "equals": 1,
+    "equals_url": 1,
+    "equals_insensitive": 1,
+    "contains": 2,
+    "matches": 3,
+    "not_matches": 3,
+    "matches_url": 3,
+    "equals_json": 5,
+    "matches_json": 6,
+    "equals_xml": 8,
+    "matches_xml": 10,
+    "matches_xml_cdata": 15,
+    "matches_xml_schema": 20,
+}
+
+DEFAULT_COST = 3
+
+REGEX_MATCHERS = ("matches", "not_matches", "matches_url")
+
+# Added to the cost of a regular expression
+UNBOUNDED_REPEAT_COST = 1
+POLYNOMIAL_COST = 10
+CATASTROPHIC_COST = 50
+
+# Matchers at least this costly are reported even without another issue
+EXPENSIVE_COST = 15
+
+SEVERITIES = ("info", "warning", "error")
+
+
+def _literal(items: List[Tuple]) -> Optional[str]:
+    """
+    The text matched by a parsed pattern made only of literal characters and anchors, else None.
+    """
+    text = []
+    for opcode, value in items:
+        if opcode is constants.LITERAL:
+            text.append(chr(value))
+        elif opcode is not constants.AT:
+            return None
+    return "".join(text)
+
+
+def _any_text(opcode, value) -> bool:
+    return opcode is constants.MAX_REPEAT and value[0] == 0 and value[1] == constants.MAXREPEAT \
+        and list(value[2]) == [(constants.ANY, None)]
+
+
+def _suggestion(matcher_name: str, tree) -> Optional[str]:
+    if matcher_name == "not_matches":
+        return None
+    items = [item for item in tree if item[0] is not constants.AT]
+    insensitive = bool(tree.state.flags & re.IGNORECASE)
+    text = _literal(items)
+    if text is not None and text:
+        if matcher_name == "matches_url":
+            return None if insensitive else f"equals_url with value '{text}'"
+        if insensitive:
+            return f"equals_insensitive with value '{text}'"
+        return f"equals with value '{text}'"
+    if not insensitive and len(items) > 2 and _any_text(*items[0]) and _any_text(*items[-1]) \
+            and matcher_name != "matches_url":
+        inner = _literal(items[1:-1])
+        if inner:
+            return f"contains with value '{inner}'"
+    return None
+
+
+def _unbounded_repeats(items) -> int:
+    count = 0
+    for opcode, value in items:
+        if opcode in regex.REPEATS or opcode is constants.POSSESSIVE_REPEAT:
+            count += (value[1] == constants.MAXREPEAT) + _unbounded_repeats(value[2])
+        elif opcode is constants.SUBPATTERN:
+            count += _unbounded_repeats(value[-1])
+        elif opcode is constants.ATOMIC_GROUP:
+            count += _unbounded_repeats(value)
+        elif opcode is constants.BRANCH:
+            count += sum(_unbounded_repeats(branch) for branch in value[1])
+    return count
+
+
+def _regex_lint(matcher_name: str, pattern: str) -> Tuple[int, str, List[str], Optional[str]]:
+    tree = regex.parse(pattern)
+    if tree is None:
+        return 0, "error", [f"Invalid regular expression: {pattern}"], None
+    cost = 0
+    severity = "info"
+    issues = []
+    for description, catastrophic in regex.backtracking_risks(tree):
+        cost += CATASTROPHIC_COST if catastrophic else POLYNOMIAL_COST
+        severity = "error" if catastrophic else max(severity, "warning", key=SEVERITIES.index)
+        issues.append(f"{description}{' (catastrophic backtracking)' if catastrophic else ''}")
+    cost += UNBOUNDED_REPEAT_COST * _unbounded_repeats(tree)
+    return cost, severity, issues, _suggestion(matcher_name, tree)
+
+
+def _path_issues(matcher: MatcherDsl, expression: str) -> List[str]:
+    name = matcher.matcherName
+    issues = []
+    if name == "matches_json" and (".." in expression or "[?" in expression):
+        issues.append(f"JSONPath {expression} uses a recursive descent or a filter, scanning the whole document")
+    if name == "matches_xml" and "//" in expression:
+        issues.append(f"XPath {expression} uses the descendant axis //, scanning the whole document")
+    if name == "matches_xml_cdata":
+        issues.append("Parses the body and then its CDATA section as XML on every request")
+        if matcher.cdataXpath and "//" in matcher.cdataXpath:
+            issues.append(f"CDATA XPath {matcher.cdataXpath} uses the descendant axis //")
+    if name == "matches_xml_schema":
+        issues.append("Validates the whole body against an XML Schema on every request")
+    return issues
+
+
+def lint_matcher(field: str, matcher: MatcherDsl, transaction: Optional[HttpTransaction] = None) -> MatcherLint:
+    """
+    Cost, issues and cheaper equivalent of a matcher of the given request field (url, header, query or body).
+    """
+    name = matcher.matcherName
+    value = matcher.matchingValue or ""
+    if field == "body":
+        # Body matching values are stored Base64 encoded
+        value = decode_base64(value) or ""
+    cost = MATCHER_COSTS.get(name, DEFAULT_COST)
+    severity = "info"
+    issues: List[str] = []
+    suggestion = None
+    if name in REGEX_MATCHERS:
+        extra, severity, issues, suggestion = _regex_lint(name, value)
+        cost += extra
+    else:
+        issues = _path_issues(matcher, value)
+        if issues:
+            severity = "warning"
+    return MatcherLint(
+        transactionId=transaction.id if transaction else None,
+        transactionName=transaction.name if transaction else None,
+        field=field,
+        key=None if field in ("url", "body") else matcher.key,
+        matcherName=name,
+        cost=cost,
+        severity=severity,
+        issues=issues,
+        suggestion=suggestion,
+    )
+
+
+def transaction_matchers(transaction: HttpTransaction) -> Iterable[Tuple[str, MatcherDsl]]:
+    request_dsl = transaction.dsl.requestDsl
+    if request_dsl.url is not None:
+        yield "url", request_dsl.url
+    for field, matchers in (("header", request_dsl.headers), ("query", request_dsl.queryParams),
+                            ("body", request_dsl.body)):
+        for matcher in matchers or []:
+            yield field, matcher
+
+
+def lint_transactions(transactions: Iterable[HttpTransaction]) -> List[MatcherLint]:
+    """
+    Matchers of the transactions worth changing: with an issue, a cheaper equivalent or a high cost,
+    the most severe first, then the most expensive.
+    """
+    lints = []
+    for transaction in transactions:
+        for field, matcher in transaction_matchers(transaction):
+            lint = lint_matcher(field, matcher, transaction)
+            if lint.issues or lint.suggestion or lint.cost >= EXPENSIVE_COST:
+                lints.append(lint)
+    lints.sort(key=lambda lint: (-SEVERITIES.index(lint.severity), -lint.cost))
+    return lints
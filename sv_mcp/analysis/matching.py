@@ -0,0 +1,361 @@
+"""
+Local simulation of the request matching of a virtual service. Every transaction's RequestDsl is compiled once
+into predicates, so a batch of sample requests can be checked without placing transactions in the sandbox.
+Transactions are tried by priority (lower value first, then in the order given) and the first one whose
+matchers are all satisfied answers the request, as the VS runtime does.
+Matchers that need a full XPath, JSONPath or XML Schema engine are reported 'unknown' when the expression
+is outside the subset evaluated here; a transaction whose other matchers pass is then an uncertain match.
+"""
+import base64
+import binascii
+import json
+import re
+import xml.etree.ElementTree as ElementTree
+from typing import Optional, Dict, Any, List, Callable, Tuple, Iterable
+from urllib.parse import urlencode, parse_qsl
+
+from sv_mcp.models.vs.http_transaction import HttpTransaction
+from sv_mcp.models.vs.match_simulation import SimulatedMatch, MatcherOutcome
+from sv_mcp.models.vs.matcher_dsl import MatcherDsl
+from sv_mcp.models.vs.sandbox_request import SandboxRequest
+
+DEFAULT_PRIORITY = 10
+
+ANY_METHOD = {"ANY", "*", ""}
+
+OUTCOMES = {True: "match", False: "no_match", None: "unknown"}
+
+_UNPARSED = object()
+_INVALID = object()
+
+# A predicate returns (True, False or None when it can't be evaluated locally, detail)
+Predicate = Callable[["SampleRequest"], Tuple[Optional[bool], Optional[str]]]
+
+
+def decode_base64(value: Optional[str]) -> Optional[str]:
+    """
+    Text of a Base64 encoded value, or the value itself when it is not Base64.
+    """
+    if not value:
+        return value
+    try:
+        return base64.b64decode(value, validate=True).decode("utf-8")
+    except (binascii.Error, ValueError):
+        return value
+
+
+class SampleRequest:
+    """
+    A sandbox request prepared for matching: headers by lower-cased name, query parameters by name, the decoded
+    body and, on first use, the body parsed as JSON or XML.
+    """
+
+    def __init__(self, request: SandboxRequest):
+        path, _, query = request.path.partition("?")
+        self.method = request.method.upper()
+        self.path = path
+        self.query: Dict[str, List[str]] = {}
+        for name, value in parse_qsl(query, keep_blank_values=True):
+            self.query.setdefault(name, []).append(value)
+        for parameter in request.queryParameters or []:
+            self.query.setdefault(parameter.name, []).append(parameter.value)
+        pairs = [(name, value) for name, values in self.query.items() for value in values]
+        self.url = f"{path}?{urlencode(pairs)}" if pairs else path
+        self.headers: Dict[str, List[str]] = {}
+        for header in request.headers or []:
+            self.headers.setdefault(header.name.lower(), []).append(header.value)
+        self.body = decode_base64(request.content)
+        self._json = _UNPARSED
+        self._xml = _UNPARSED
+
+    def json(self) -> Any:
+        if self._json is _UNPARSED:
+            try:
+                self._json = json.loads(self.body or "")
+            except ValueError:
+                self._json = _INVALID
+        return self._json
+
+    def xml(self) -> Any:
+        if self._xml is _UNPARSED:
+            try:
+                self._xml = ElementTree.fromstring(self.body or "")
+            except ElementTree.ParseError:
+                self._xml = _INVALID
+        return self._xml
+
+
+JSON_PATH_STEP = re.compile(r"\.\.(\w+|\*)|\.(\w+|\*)|\[(\*|-?\d+|'[^']*'|\"[^\"]*\")\]")
+
+
+def _children(node: Any) -> List[Any]:
+    if isinstance(node, dict):
+        return list(node.values())
+    return list(node) if isinstance(node, list) else []
+
+
+def _descendants(node: Any) -> Iterable[Any]:
+    yield node
+    for child in _children(node):
+        yield from _descendants(child)
+
+
+def _select(node: Any, key: str) -> List[Any]:
+    if key == "*":
+        return _children(node)
+    if isinstance(node, dict):
+        return [node[key]] if key in node else []
+    if isinstance(node, list) and re.fullmatch(r"-?\d+", key):
+        index = int(key)
+        return [node[index]] if -len(node) <= index < len(node) else []
+    return []
+
+
+def json_path(document: Any, expression: str) -> Optional[List[Any]]:
+    """
+    Values selected by a JSONPath expression made of child (.name, ['name'], [n]), wildcard and recursive
+    descent (..name) steps, or None when the expression uses anything else (e.g. filters).
+    """
+    expression = expression.strip()
+    if not expression.startswith("$"):
+        return None
+    nodes = [document]
+    position = 1
+    while position < len(expression):
+        step = JSON_PATH_STEP.match(expression, position)
+        if not step:
+            return None
+        descendant, child, bracket = step.groups()
+        if descendant:
+            nodes = [selected for node in nodes for inner in _descendants(node)
+                     for selected in _select(inner, descendant)]
+        else:
+            key = child or bracket
+            if key[0] in "'\"":
+                key = key[1:-1]
+            nodes = [selected for node in nodes for selected in _select(node, key)]
+        position = step.end()
+    return nodes
+
+
+def xml_path(root: Any, expression: str, namespaces: Dict[str, str]) -> Optional[bool]:
+    """
+    Whether an XPath expression selects something, for the subset supported by ElementTree, or None.
+    """
+    expression = expression.strip().replace("text()=", ".=")
+    if expression.endswith("/text()"):
+        expression = expression[:-len("/text()")]
+    if not expression.startswith("/"):
+        return None
+    wrapper = ElementTree.Element("document")
+    wrapper.append(root)
+    try:
+        return bool(wrapper.findall("." + expression, namespaces))
+    except (SyntaxError, KeyError, ValueError):
+        return None
+
+
+def _same_xml(expected: Any, actual: Any) -> bool:
+    return (expected.tag == actual.tag and expected.attrib == actual.attrib
+            and (expected.text or "").strip() == (actual.text or "").strip()
+            and len(expected) == len(actual)
+            and all(_same_xml(e, a) for e, a in zip(expected, actual)))
+
+
+def _text_test(matcher_name: str, expected: str) -> Optional[Callable[[str], bool]]:
+    if matcher_name == "equals":
+        return lambda value: value == expected
+    if matcher_name == "equals_insensitive":
+        lowered = expected.lower()
+        return lambda value: value.lower() == lowered
+    if matcher_name == "contains":
+        return lambda value: expected in value
+    if matcher_name in ("matches", "not_matches"):
+        pattern = re.compile(expected, re.DOTALL)
+        return lambda value: pattern.fullmatch(value) is not None
+    return None
+
+
+def _compile_url(matcher: MatcherDsl) -> Predicate:
+    if matcher.matcherName == "matches_url":
+        try:
+            pattern = re.compile(matcher.matchingValue)
+        except re.error as e:
+            error = f"Invalid regular expression: {e}"
+            return lambda request: (None, error)
+        return lambda request: (pattern.fullmatch(request.url) is not None
+                                or pattern.fullmatch(request.path) is not None, request.url)
+    expected = matcher.matchingValue
+    return lambda request: (expected in (request.url, request.path), request.url)
+
+
+def _compile_field(matcher: MatcherDsl, values: Callable[["SampleRequest"], List[str]]) -> Predicate:
+    name = matcher.matcherName
+    if name == "absent":
+        return lambda request: (not values(request), None)
+    try:
+        test = _text_test(name, matcher.matchingValue)
+    except re.error as e:
+        error = f"Invalid regular expression: {e}"
+        return lambda request: (None, error)
+    if test is None:
+        return lambda request: (None, f"Matcher {name} is not supported for this field")
+    negate = name == "not_matches"
+
+    def predicate(request: SampleRequest) -> Tuple[Optional[bool], Optional[str]]:
+        found = values(request)
+        if not found:
+            return matcher.optional, "missing"
+        if negate:
+            return all(not test(value) for value in found), ", ".join(found)
+        return any(test(value) for value in found), ", ".join(found)
+
+    return predicate
+
+
+def _compile_body(matcher: MatcherDsl) -> Predicate:
+    name = matcher.matcherName
+    # Body matching values are stored Base64 encoded
+    expected = decode_base64(matcher.matchingValue) or ""
+    if name == "absent":
+        return lambda request: (not request.body, None)
+
+    def present(check: Callable[[SampleRequest], Tuple[Optional[bool], Optional[str]]]) -> Predicate:
+        return lambda request: check(request) if request.body else (matcher.optional, "missing")
+
+    if name == "equals_json":
+        try:
+            document = json.loads(expected)
+        except ValueError:
+            return lambda request: (None, "Matching value is not valid JSON")
+        return present(lambda request: (request.json() == document,
+                                        None if request.json() is not _INVALID else "Body is not valid JSON"))
+    if name == "matches_json":
+        def matches_json(request: SampleRequest) -> Tuple[Optional[bool], Optional[str]]:
+            if request.json() is _INVALID:
+                return False, "Body is not valid JSON"
+            selected = json_path(request.json(), expected)
+            if selected is None:
+                return None, f"JSONPath {expected} is not evaluated locally"
+            return bool(selected), None
+        return present(matches_json)
+    if name == "equals_xml":
+        try:
+            document = ElementTree.fromstring(expected)
+        except ElementTree.ParseError:
+            return lambda request: (None, "Matching value is not valid XML")
+        return present(lambda request: (request.xml() is not _INVALID and _same_xml(document, request.xml()), None))
+    if name == "matches_xml":
+        namespaces = {namespace.prefix: namespace.uri for namespace in matcher.namespaces or []}
+
+        def matches_xml(request: SampleRequest) -> Tuple[Optional[bool], Optional[str]]:
+            if request.xml() is _INVALID:
+                return False, "Body is not valid XML"
+            selected = xml_path(request.xml(), expected, namespaces)
+            return selected, None if selected is not None else f"XPath {expected} is not evaluated locally"
+        return present(matches_xml)
+    if name in ("matches_xml_schema", "matches_xml_cdata"):
+        return lambda request: (None, f"Matcher {name} is not evaluated locally")
+    return _compile_field(MatcherDsl(key="body", matcherName=name, matchingValue=expected, optional=matcher.optional),
+                          lambda request: [request.body] if request.body else [])
+
+
+def _header_values(name: str) -> Callable[[SampleRequest], List[str]]:
+    return lambda request: request.headers.get(name, [])
+
+
+def _query_values(name: str) -> Callable[[SampleRequest], List[str]]:
+    return lambda request: request.query.get(name, [])
+
+
+class CompiledTransaction:
+    """
+    The matchers of a transaction compiled into predicates.
+    """
+
+    def __init__(self, transaction: HttpTransaction, priority: int, order: int):
+        self.id = transaction.id
+        self.name = transaction.name
+        self.priority = priority
+        self.order = order
+        request_dsl = transaction.dsl.requestDsl
+        self.method = (request_dsl.method or "ANY").upper()
+        method = self.method
+        self.checks: List[Tuple[str, Optional[str], str, Predicate]] = [
+            ("method", None, "equals", lambda request: (method in ANY_METHOD or request.method == method,
+                                                        request.method)),
+        ]
+        url = request_dsl.url or MatcherDsl(key="url", matcherName="equals_url", matchingValue=request_dsl.path)
+        self.checks.append(("url", None, url.matcherName, _compile_url(url)))
+        for matcher in request_dsl.headers or []:
+            self.checks.append(("header", matcher.key, matcher.matcherName,
+                                _compile_field(matcher, _header_values(matcher.key.lower()))))
+        for matcher in request_dsl.queryParams or []:
+            self.checks.append(("query", matcher.key, matcher.matcherName,
+                                _compile_field(matcher, _query_values(matcher.key))))
+        for matcher in request_dsl.body or []:
+            self.checks.append(("body", None, matcher.matcherName, _compile_body(matcher)))
+
+    def matches(self, request: SampleRequest) -> Optional[bool]:
+        """
+        True when every matcher is satisfied, None when none fails but some can't be evaluated, else False.
+        """
+        certain = True
+        for _, _, _, predicate in self.checks:
+            outcome, _ = predicate(request)
+            if outcome is False:
+                return False
+            if outcome is None:
+                certain = False
+        return True if certain else None
+
+    def explain(self, request: SampleRequest) -> List[MatcherOutcome]:
+        outcomes = []
+        for field, key, matcher_name, predicate in self.checks:
+            outcome, detail = predicate(request)
+            outcomes.append(MatcherOutcome(field=field, key=key, matcherName=matcher_name,
+                                           outcome=OUTCOMES[outcome], detail=detail))
+        return outcomes
+
+
+class RequestMatcher:
+    """
+    Finds the transaction answering each request among (transaction, priority) pairs.
+    """
+
+    def __init__(self, transactions: Iterable[Tuple[HttpTransaction, Optional[int]]]):
+        self.transactions = sorted(
+            (CompiledTransaction(transaction, DEFAULT_PRIORITY if priority is None else priority, order)
+             for order, (transaction, priority) in enumerate(transactions)),
+            key=lambda compiled: (compiled.priority, compiled.order)
+        )
+        self._by_method: Dict[str, List[CompiledTransaction]] = {}
+
+    def candidates(self, method: str) -> List[CompiledTransaction]:
+        if method not in self._by_method:
+            self._by_method[method] = [compiled for compiled in self.transactions
+                                       if compiled.method in ANY_METHOD or compiled.method == method]
+        return self._by_method[method]
+
+    def match(self, request: SandboxRequest, index: int = 0) -> SimulatedMatch:
+        sample = SampleRequest(request)
+        result = SimulatedMatch(index=index, request=f"{sample.method} {sample.url}")
+        for compiled in self.candidates(sample.method):
+            outcome = compiled.matches(sample)
+            if outcome is not False:
+                result.transactionId = compiled.id
+                result.transactionName = compiled.name
+                result.priority = compiled.priority
+                result.certain = outcome is True
+                result.matchers = compiled.explain(sample)
+                return result
+
+        best_score = -1.0
+        for compiled in self.transactions:
+            outcomes = compiled.explain(sample)
+            score = sum(outcome.outcome != "no_match" for outcome in outcomes) / len(outcomes)
+            if score > best_score:
+                best_score = score
+                result.closestTransactionId = compiled.id
+                result.matchers = outcomes
+        return result
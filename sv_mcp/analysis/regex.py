@@ -0,0 +1,304 @@
+"""
+Helpers over the parse tree of Python regular expressions (re._parser), used to reason about matcher patterns
+without running them against real traffic.
+"""
+import re
+import string
+from re import _constants as constants
+from re import _parser as parser
+from typing import List, Any, Optional, Tuple
+
+# Characters tried, in order, for negated classes and wildcards
+FILLER_CHARACTERS = "a0x_-Z9"
+
+CATEGORY_CHARACTERS = {
+    constants.CATEGORY_DIGIT: "0",
+    constants.CATEGORY_NOT_DIGIT: "a",
+    constants.CATEGORY_WORD: "a",
+    constants.CATEGORY_NOT_WORD: "-",
+    constants.CATEGORY_SPACE: " ",
+    constants.CATEGORY_NOT_SPACE: "a",
+}
+
+SAMPLE_VARIANTS = 6
+
+# Repetitions generated for an unbounded quantifier
+MAX_SAMPLE_REPEAT = 3
+
+
+def parse(pattern: str) -> Optional[Any]:
+    """
+    Parse tree of a pattern, or None when it is not a valid regular expression.
+    """
+    try:
+        return parser.parse(pattern)
+    except (re.error, RecursionError, OverflowError):
+        return None
+
+
+def _class_character(items: List[Any], variant: int) -> str:
+    if items and items[0][0] is constants.NEGATE:
+        allowed = re.compile(f"[{''.join(_class_source(items))}]")
+        return next((c for c in FILLER_CHARACTERS if allowed.match(c)), "a")
+    options = []
+    for opcode, value in items:
+        if opcode is constants.LITERAL:
+            options.append(chr(value))
+        elif opcode is constants.RANGE:
+            options.append(chr(value[0] if variant % 2 == 0 else value[1]))
+        elif opcode is constants.CATEGORY:
+            options.append(CATEGORY_CHARACTERS.get(value, "a"))
+    return options[variant % len(options)] if options else "a"
+
+
+def _class_source(items: List[Any]) -> List[str]:
+    source = []
+    for opcode, value in items:
+        if opcode is constants.NEGATE:
+            source.append("^")
+        elif opcode is constants.LITERAL:
+            source.append(re.escape(chr(value)))
+        elif opcode is constants.RANGE:
+            source.append(f"{re.escape(chr(value[0]))}-{re.escape(chr(value[1]))}")
+        elif opcode is constants.CATEGORY:
+            source.append({constants.CATEGORY_DIGIT: r"\d", constants.CATEGORY_NOT_DIGIT: r"\D",
+                           constants.CATEGORY_WORD: r"\w", constants.CATEGORY_NOT_WORD: r"\W",
+                           constants.CATEGORY_SPACE: r"\s", constants.CATEGORY_NOT_SPACE: r"\S"}.get(value, ""))
+    return source
+
+
+def generate(items: Any, variant: int = 0) -> str:
+    """
+    A string matched by the parsed pattern. Different variants take other branches and repetition counts.
+    """
+    text = []
+    for opcode, value in items:
+        if opcode is constants.LITERAL:
+            text.append(chr(value))
+        elif opcode is constants.NOT_LITERAL:
+            text.append("a" if value != ord("a") else "b")
+        elif opcode is constants.ANY:
+            text.append(FILLER_CHARACTERS[variant % len(FILLER_CHARACTERS)])
+        elif opcode is constants.IN:
+            text.append(_class_character(value, variant))
+        elif opcode in (constants.MAX_REPEAT, constants.MIN_REPEAT, constants.POSSESSIVE_REPEAT):
+            low, high, sub = value
+            count = low if variant % 2 == 0 else max(low, 1) + variant // 2
+            count = min(count, high, low + MAX_SAMPLE_REPEAT)
+            text.extend(generate(sub, variant) for _ in range(count))
+        elif opcode is constants.SUBPATTERN:
+            text.append(generate(value[-1], variant))
+        elif opcode is constants.ATOMIC_GROUP:
+            text.append(generate(value, variant))
+        elif opcode is constants.BRANCH:
+            branches = value[1]
+            text.append(generate(branches[variant % len(branches)], variant))
+        elif opcode is constants.CATEGORY:
+            text.append(CATEGORY_CHARACTERS.get(value, "a"))
+    return "".join(text)
+
+
+def samples(pattern: str, count: int = SAMPLE_VARIANTS) -> List[str]:
+    """
+    Distinct strings generated from a pattern that the pattern fully matches.
+    """
+    tree = parse(pattern)
+    if tree is None:
+        return []
+    compiled = re.compile(pattern)
+    found = []
+    for variant in range(count):
+        try:
+            sample = generate(tree, variant)
+        except (ValueError, TypeError, OverflowError):
+            continue
+        if sample not in found and compiled.fullmatch(sample):
+            found.append(sample)
+    return found
+
+
+def can_match(items: Any, character: str) -> bool:
+    """
+    Whether some part of the parsed pattern can consume the character.
+    """
+    code = ord(character)
+    for opcode, value in items:
+        if opcode is constants.LITERAL and value == code:
+            return True
+        if opcode is constants.NOT_LITERAL and value != code:
+            return True
+        if opcode is constants.ANY:
+            return True
+        if opcode is constants.IN and re.match(f"[{''.join(_class_source(value))}]", character):
+            return True
+        if opcode in (constants.MAX_REPEAT, constants.MIN_REPEAT, constants.POSSESSIVE_REPEAT):
+            if value[1] > 0 and can_match(value[2], character):
+                return True
+        elif opcode is constants.SUBPATTERN and can_match(value[-1], character):
+            return True
+        elif opcode is constants.ATOMIC_GROUP and can_match(value, character):
+            return True
+        elif opcode is constants.BRANCH and any(can_match(branch, character) for branch in value[1]):
+            return True
+    return False
+
+
+# Characters probed when comparing what two parts of a pattern can consume
+PROBE_CHARACTERS = string.printable + "é中"
+
+# Bounded repetitions above this are treated as unbounded
+LARGE_REPEAT = 32
+
+REPEATS = (constants.MAX_REPEAT, constants.MIN_REPEAT)
+
+
+def min_width(items: Any) -> int:
+    width = 0
+    for opcode, value in items:
+        if opcode in (constants.LITERAL, constants.NOT_LITERAL, constants.ANY, constants.IN, constants.CATEGORY):
+            width += 1
+        elif opcode in REPEATS or opcode is constants.POSSESSIVE_REPEAT:
+            width += value[0] * min_width(value[2])
+        elif opcode is constants.SUBPATTERN:
+            width += min_width(value[-1])
+        elif opcode is constants.ATOMIC_GROUP:
+            width += min_width(value)
+        elif opcode is constants.BRANCH:
+            width += min(min_width(branch) for branch in value[1])
+    return width
+
+
+def characters(items: Any) -> frozenset:
+    """
+    Probe characters that some part of the parsed pattern can consume.
+    """
+    return frozenset(character for character in PROBE_CHARACTERS if can_match(items, character))
+
+
+def first_characters(items: Any) -> frozenset:
+    """
+    Probe characters a match of the parsed pattern can start with.
+    """
+    found = set()
+    for item in items:
+        opcode, value = item
+        if opcode in REPEATS or opcode is constants.POSSESSIVE_REPEAT:
+            found |= first_characters(value[2])
+        elif opcode is constants.SUBPATTERN:
+            found |= first_characters(value[-1])
+        elif opcode is constants.ATOMIC_GROUP:
+            found |= first_characters(value)
+        elif opcode is constants.BRANCH:
+            for branch in value[1]:
+                found |= first_characters(branch)
+        elif opcode is not constants.AT:
+            found |= characters([item])
+        if min_width([item]) > 0:
+            break
+    return frozenset(found)
+
+
+def _unbounded(opcode: Any, value: Any) -> bool:
+    return opcode in REPEATS and (value[1] == constants.MAXREPEAT or value[1] > LARGE_REPEAT)
+
+
+def _nested_repeat(items: Any) -> Optional[Any]:
+    """
+    An unbounded repeat inside the items (not below atomic groups or possessive repeats), if any.
+    """
+    for opcode, value in items:
+        if _unbounded(opcode, value):
+            return opcode, value
+        if opcode in REPEATS:
+            found = _nested_repeat(value[2])
+        elif opcode is constants.SUBPATTERN:
+            found = _nested_repeat(value[-1])
+        elif opcode is constants.BRANCH:
+            found = next((repeat for repeat in map(_nested_repeat, value[1]) if repeat), None)
+        else:
+            found = None
+        if found:
+            return found
+    return None
+
+
+def backtracking_risks(items: Any) -> List[Tuple[str, bool]]:
+    """
+    (description, catastrophic) of the constructs of a parsed pattern that make the backtracking engine try an
+    exponential (catastrophic) or polynomial number of ways to match a failing input:
+    - an unbounded repeat of something that itself contains an unbounded repeat, without a mandatory delimiter
+      the inner repeat can't consume, e.g. (a+)+ or (\\w+\\s?)*
+    - an unbounded repeat of a group that can match the same text in more than one way, e.g. (a|aa)+
+    - adjacent unbounded repeats that can consume the same characters, e.g. \\d+\\d+ or .*.*
+    """
+    risks: List[Tuple[str, bool]] = []
+    previous_repeat = None
+    for opcode, value in items:
+        if _unbounded(opcode, value):
+            body = value[2]
+            inner = _nested_repeat(body)
+            if inner is not None:
+                inner_characters = characters(inner[1][2])
+                delimited = any(min_width([item]) > 0 and not (characters([item]) & inner_characters)
+                                for item in _flatten(body) if item[0] not in REPEATS)
+                if not delimited:
+                    risks.append(("Nested quantifiers: a repeated group contains another unbounded repeat", True))
+            if _ambiguous(body):
+                risks.append(("A repeated group can match the same text in more than one way", True))
+            if previous_repeat is not None and characters(previous_repeat) & characters(body):
+                risks.append(("Adjacent unbounded repeats can consume the same characters", False))
+            previous_repeat = body
+        elif min_width([(opcode, value)]) > 0:
+            previous_repeat = None
+        if opcode in REPEATS or opcode is constants.SUBPATTERN or opcode is constants.BRANCH:
+            for nested in _children(opcode, value):
+                risks.extend(backtracking_risks(nested))
+    unique = []
+    for risk in risks:
+        if risk not in unique:
+            unique.append(risk)
+    return unique
+
+
+def _children(opcode: Any, value: Any) -> List[Any]:
+    if opcode in REPEATS:
+        return [value[2]]
+    if opcode is constants.SUBPATTERN:
+        return [value[-1]]
+    return list(value[1])
+
+
+def _flatten(items: Any) -> List[Any]:
+    """
+    The items of a pattern with groups expanded into their contents.
+    """
+    flat = []
+    for opcode, value in items:
+        if opcode is constants.SUBPATTERN:
+            flat.extend(_flatten(value[-1]))
+        else:
+            flat.append((opcode, value))
+    return flat
+
+
+def _ambiguous(body: Any) -> bool:
+    """
+    Whether a repeated body has alternatives starting with the same character, or ends with an optional part
+    that can also start the next repetition, e.g. (ab|a.)+ or (aa?)+.
+    """
+    flat = _flatten(body)
+    start = first_characters(body)
+    for position, (opcode, value) in enumerate(flat):
+        if opcode is constants.BRANCH and _overlapping(value[1]):
+            return True
+        optional = (opcode is constants.BRANCH and min_width([(opcode, value)]) == 0) or \
+                   (opcode in REPEATS and value[0] < value[1])
+        trailing = all(min_width([item]) == 0 for item in flat[position + 1:])
+        if optional and trailing and first_characters([(opcode, value)]) & start:
+            return True
+    return False
+
+
+def _overlapping(branches: List[Any]) -> bool:
+    starts = [first_characters(branch) for branch in branches]
+    return any(starts[i] & starts[j] for i in range(len(starts)) for j in range(i + 1, len(starts)))
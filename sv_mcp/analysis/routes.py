@@ -0,0 +1,296 @@
+"""
+Overlap analysis of the request matchers of a service's transactions.
+Transactions are indexed in a trie of URL path segments (literal segments, single-segment wildcards and
+patterns open to any suffix), so only transactions sharing a route are compared with each other.
+Two transactions overlap when some request is matched by both URL matchers and their other matchers don't
+exclude each other. The one tried first (lower priority value) answers those requests:
+- duplicate: both match exactly the same requests
+- shadowed: the first one matches every request of the second one, which is never answered
+- ambiguous: they overlap with the same priority, so either may answer
+Regex containment is checked on strings generated from the pattern, such findings are marked not certain.
+"""
+import re
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Set
+
+from re import _constants as constants
+
+from sv_mcp.analysis import regex
+from sv_mcp.models.vs.http_transaction import HttpTransaction
+from sv_mcp.models.vs.route_finding import RouteFinding
+
+DEFAULT_PRIORITY = 10
+
+ANY_METHOD = {"ANY", "*", ""}
+
+# Marks a route segment matching the rest of the URL, whatever its number of segments
+OPEN = "**"
+
+SLASH = ord("/")
+QUERY = ord("?")
+
+
+def _literal_segments(url: str) -> List[Optional[str]]:
+    return url.partition("?")[0].split("/")
+
+
+def _optional_query(opcode: Any, value: Any) -> bool:
+    """
+    Whether a parsed item is an optional group starting with '?', such as (\\?.*)?
+    """
+    if opcode is not constants.MAX_REPEAT or value[0] != 0 or len(value[2]) != 1:
+        return False
+    group_opcode, group = value[2][0]
+    if group_opcode is not constants.SUBPATTERN or not group[-1]:
+        return False
+    first_opcode, first_value = group[-1][0]
+    return first_opcode is constants.LITERAL and first_value == QUERY
+
+
+def _regex_segments(tree: Any) -> List[Optional[str]]:
+    """
+    Path segments of a parsed URL pattern: the literal text of a segment, None for a segment with a
+    pattern, or OPEN once the pattern can match a '/'. Parsing stops at the query string.
+    """
+    segments: List[Optional[str]] = []
+    current: Optional[List[str]] = []
+    for opcode, value in tree:
+        if opcode is constants.AT:
+            continue
+        if opcode is constants.LITERAL and value == SLASH:
+            segments.append(None if current is None else "".join(current))
+            current = []
+        elif opcode is constants.LITERAL and value == QUERY:
+            break
+        elif _optional_query(opcode, value):
+            break
+        elif regex.can_match([(opcode, value)], "/"):
+            segments.append(OPEN)
+            return segments
+        elif opcode is constants.LITERAL and current is not None:
+            current.append(chr(value))
+        else:
+            current = None
+    segments.append(None if current is None else "".join(current))
+    return segments
+
+
+class _Route:
+    """
+    A transaction prepared for comparison: method, URL matcher, segments and the set of its other matchers.
+    """
+
+    def __init__(self, transaction: HttpTransaction, priority: int, order: int):
+        self.transaction = transaction
+        self.priority = priority
+        self.order = order
+        request_dsl = transaction.dsl.requestDsl
+        self.method = (request_dsl.method or "ANY").upper()
+        url = request_dsl.url
+        self.url = url.matchingValue if url else request_dsl.path
+        self.pattern: Optional[re.Pattern] = None
+        self.segments: List[Optional[str]] = [OPEN]
+        if url is not None and url.matcherName == "matches_url":
+            tree = regex.parse(self.url)
+            if tree is not None:
+                self.pattern = re.compile(self.url)
+                self.segments = _regex_segments(tree)
+        else:
+            self.segments = _literal_segments(self.url)
+        self.url_key = ("regex" if self.pattern else "literal", self.url)
+        self.matchers = frozenset(
+            (field, (matcher.key or "").lower() if field == "header" else matcher.key, matcher.matcherName,
+             matcher.matchingValue, matcher.optional)
+            for field, matchers in (("header", request_dsl.headers), ("query", request_dsl.queryParams),
+                                    ("body", request_dsl.body))
+            for matcher in matchers or []
+        )
+        self._samples: Optional[List[str]] = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.method} {self.url}"
+
+    def samples(self) -> List[str]:
+        if self._samples is None:
+            self._samples = regex.samples(self.url) if self.pattern else [self.url]
+        return self._samples
+
+    def matches(self, url: str) -> bool:
+        if self.pattern is None:
+            return url == self.url
+        path = url.partition("?")[0]
+        return self.pattern.fullmatch(url) is not None or self.pattern.fullmatch(path) is not None
+
+    def covers(self, other: "_Route") -> Optional[bool]:
+        """
+        True when this URL matcher matches every URL the other one does, None when it is only likely
+        (every string generated from the other pattern matches), else False.
+        """
+        if self.method not in ANY_METHOD and self.method != other.method:
+            return False
+        if not self.matchers <= other.matchers:
+            return False
+        if self.url_key == other.url_key:
+            return True
+        if self.pattern is None:
+            return False
+        if other.pattern is None:
+            return self.matches(other.url)
+        other_samples = other.samples()
+        return None if other_samples and all(self.matches(sample) for sample in other_samples) else False
+
+    def overlaps(self, other: "_Route") -> bool:
+        if not (self.method in ANY_METHOD or other.method in ANY_METHOD or self.method == other.method):
+            return False
+        if self.excludes(other):
+            return False
+        if self.url_key == other.url_key:
+            return True
+        if self.pattern is None or other.pattern is None:
+            literal, route = (self, other) if self.pattern is None else (other, self)
+            return route.matches(literal.url)
+        return any(other.matches(sample) for sample in self.samples()) or \
+            any(self.matches(sample) for sample in other.samples())
+
+    def excludes(self, other: "_Route") -> bool:
+        """
+        Whether a required matcher of each one tells their requests apart: equals with different values,
+        or absent against equals, on the same header or query parameter.
+        """
+        required = {}
+        for field, key, name, value, optional in self.matchers:
+            if not optional and name in ("equals", "absent") and field != "body":
+                required[(field, key)] = (name, value)
+        for field, key, name, value, optional in other.matchers:
+            if optional or name not in ("equals", "absent") or (field, key) not in required:
+                continue
+            if required[(field, key)] != (name, value):
+                return True
+        return False
+
+
+class _Node:
+    __slots__ = ("children", "wildcard", "routes", "open_routes")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.wildcard: Optional["_Node"] = None
+        self.routes: List[int] = []
+        self.open_routes: List[int] = []
+
+    def subtree(self) -> Iterable[int]:
+        yield from self.routes
+        yield from self.open_routes
+        for child in self.children.values():
+            yield from child.subtree()
+        if self.wildcard is not None:
+            yield from self.wildcard.subtree()
+
+
+class RouteIndex:
+    """
+    Trie of route segments giving, for a route, the routes that may match the same URLs.
+    """
+
+    def __init__(self, routes: List[_Route]):
+        self.root = _Node()
+        for index, route in enumerate(routes):
+            node = self.root
+            for segment in route.segments:
+                if segment == OPEN:
+                    node.open_routes.append(index)
+                    break
+                if segment is None:
+                    node.wildcard = node.wildcard or _Node()
+                    node = node.wildcard
+                else:
+                    node = node.children.setdefault(segment, _Node())
+            else:
+                node.routes.append(index)
+
+    def candidates(self, route: _Route) -> Set[int]:
+        found: Set[int] = set()
+        nodes = [self.root]
+        for segment in route.segments:
+            for node in nodes:
+                found.update(node.open_routes)
+            if segment == OPEN:
+                for node in nodes:
+                    found.update(node.subtree())
+                return found
+            following = []
+            for node in nodes:
+                if segment is None:
+                    following.extend(node.children.values())
+                elif segment in node.children:
+                    following.append(node.children[segment])
+                if node.wildcard is not None:
+                    following.append(node.wildcard)
+            nodes = following
+        for node in nodes:
+            found.update(node.routes)
+            found.update(node.open_routes)
+        return found
+
+
+def _finding(kind: str, route: _Route, other: _Route, certain: bool, detail: str) -> RouteFinding:
+    return RouteFinding(
+        kind=kind,
+        transactionId=route.transaction.id,
+        transactionName=route.transaction.name,
+        priority=route.priority,
+        otherTransactionId=other.transaction.id,
+        otherTransactionName=other.transaction.name,
+        otherPriority=other.priority,
+        certain=certain,
+        detail=detail,
+    )
+
+
+def _compare(first: _Route, second: _Route) -> Optional[RouteFinding]:
+    """
+    Finding for two overlapping routes, `first` being tried before `second` when their priorities differ.
+    """
+    first_covers = first.covers(second)
+    second_covers = second.covers(first)
+    tied = first.priority == second.priority
+    if first_covers is not False and second_covers is not False:
+        certain = first_covers is True and second_covers is True
+        decided = "either may answer" if tied else f"priority {first.priority} answers first"
+        return _finding("duplicate", second, first, certain, f"{second.label} matches the same requests as "
+                                                             f"{first.label}, {decided}")
+    if first_covers is not False and not tied:
+        return _finding("shadowed", second, first, first_covers is True,
+                        f"Every request of {second.label} is answered first by {first.label} "
+                        f"(priority {first.priority} < {second.priority})")
+    if tied:
+        return _finding("ambiguous", second, first, True,
+                        f"{second.label} and {first.label} match some of the same requests with the same priority "
+                        f"{first.priority}")
+    return None
+
+
+def analyze_routes(transactions: Iterable[Tuple[HttpTransaction, Optional[int]]]) -> List[RouteFinding]:
+    """
+    Duplicate, shadowed and ambiguous transactions among (transaction, priority) pairs; a missing priority
+    is the default one.
+    """
+    routes = [_Route(transaction, DEFAULT_PRIORITY if priority is None else priority, order)
+              for order, (transaction, priority) in enumerate(transactions)]
+    index = RouteIndex(routes)
+    findings = []
+    compared: Set[Tuple[int, int]] = set()
+    for position, route in enumerate(routes):
+        for other_position in sorted(index.candidates(route)):
+            pair = (min(position, other_position), max(position, other_position))
+            if other_position == position or pair in compared:
+                continue
+            compared.add(pair)
+            other = routes[other_position]
+            if not route.overlaps(other):
+                continue
+            first, second = sorted((route, other), key=lambda r: (r.priority, r.order))
+            finding = _compare(first, second)
+            if finding is not None:
+                findings.append(finding)
+    return findings
@@ -23,3 +23,90 @@ VS_ASSETS_ENDPOINT: str = "assets"
 VS_CONFIGURATIONS_ENDPOINT: str = "service-mock-configurations"
 VS_VALIDATIONS_ENDPOINT: str = "/system/validations/handlebars"
 VS_CONVERT_ENDPOINT: str = "/system/validations/handlebars/convert"
+
+# Every numeric setting below can be overridden by an environment variable of the same name. Values are read
+# with env_int/env_float (sv_mcp.config.env): non-numeric values are ignored, and concurrencies, batch and page
+# sizes below 1 are raised to 1
+
+# HTTP connection pool
+HTTP_MAX_CONNECTIONS: int = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+HTTP_KEEPALIVE_EXPIRY: float = 30.0
+
+# API retries
+API_MAX_RETRIES: int = 3
+API_RETRY_BASE_DELAY: float = 0.5
+API_RETRY_MAX_DELAY: float = 20.0
+API_RETRY_BUDGET_RATIO: float = 0.2
+API_RETRY_BUDGET_RESERVE: float = 10.0
+
+# Response cache: maximum number of entries and time to live in seconds per entity
+RESPONSE_CACHE_MAX_SIZE: int = 1024
+CACHE_TTL_USER: float = 60.0
+CACHE_TTL_ACCOUNTS: float = 300.0
+CACHE_TTL_WORKSPACES: float = 300.0
+CACHE_TTL_LOCATIONS: float = 600.0
+CACHE_TTL_CONFIGURATIONS: float = 300.0
+CACHE_TTL_SERVICES: float = 300.0
+CACHE_TTL_TRANSACTIONS: float = 300.0
+CACHE_TTL_TEMPLATES: float = 300.0
+# Status of a virtual service changes while it is deployed or stopped, keep it short
+CACHE_TTL_VIRTUAL_SERVICES: float = 15.0
+
+# list_all actions: page size, pages fetched concurrently and default maximum number of items returned
+LIST_ALL_PAGE_SIZE: int = 50
+LIST_ALL_CONCURRENCY: int = 4
+LIST_ALL_MAX_ITEMS: int = 1000
+
+# Route overlap analysis: maximum number of transactions of a service read
+ROUTE_ANALYSIS_MAX_TRANSACTIONS: int = 10000
+
+# AI consent of an account, a denied consent is kept for less time so a newly granted one is noticed soon
+CONSENT_CACHE_MAX_SIZE: int = 256
+CACHE_TTL_CONSENT_GRANTED: float = 300.0
+CACHE_TTL_CONSENT_DENIED: float = 30.0
+
+# Handlebars validation and conversion results, keyed by the SHA-256 of the template. They are kept in
+# TEMPLATE_CACHE_PATH as well when the variable is set, so they survive restarts. Changes made within
+# TEMPLATE_CACHE_SAVE_DELAY seconds are written to the file together
+TEMPLATE_CACHE_MAX_SIZE: int = 512
+TEMPLATE_CACHE_SAVE_DELAY: float = 1.0
+
+# Tracking wait: polling starts every TRACKING_POLL_MIN_INTERVAL seconds and slows down up to
+# TRACKING_POLL_MAX_INTERVAL while nothing changes
+TRACKING_WAIT_TIMEOUT: float = 300.0
+TRACKING_POLL_MIN_INTERVAL: float = 1.0
+TRACKING_POLL_MAX_INTERVAL: float = 10.0
+TRACKING_POLL_BACKOFF: float = 1.5
+TRACKING_FINAL_STATUSES = ("FINISHED", "FAILED")
+# Trackings waited on are polled by a single background task, finished ones are kept for late subscribers
+TRACKING_POLL_CONCURRENCY: int = 10
+TRACKING_RETENTION: float = 60.0
+
+# Bulk virtual service actions: deploy/stop requests sent at the same time
+BULK_ACTION_CONCURRENCY: int = 10
+
+# Manifest apply: entities of the same dependency layer created/updated at the same time
+MANIFEST_APPLY_CONCURRENCY: int = 8
+
+# Workspace snapshots: transactions whose actions are read at the same time while exporting
+SNAPSHOT_ACTION_CONCURRENCY: int = 8
+SNAPSHOT_VERSION: int = 1
+# Snapshot import: entities created at the same time and transactions created per request
+SNAPSHOT_IMPORT_CONCURRENCY: int = 8
+SNAPSHOT_IMPORT_BATCH_SIZE: int = 50
+
+# Batch transaction creation: transactions per request and requests sent at the same time
+TRANSACTION_BATCH_SIZE: int = 50
+TRANSACTION_BATCH_CONCURRENCY: int = 4
+
+# Sandbox suites: test requests of the same transaction sent at the same time
+SANDBOX_TEST_CONCURRENCY: int = 8
+
+# Sandbox placements: transaction placed in the sandbox per API key, init is skipped while it doesn't
+# change. Placements are forgotten when the transaction is updated
+SANDBOX_PLACEMENT_TTL: float = 600.0
+SANDBOX_PLACEMENT_MAX_SIZE: int = 256
+
+# WireMock conversion: worker threads reading, converting and writing mapping files
+CONVERTER_THREADS: int = 8
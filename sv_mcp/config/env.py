@@ -0,0 +1,34 @@
+"""
+Numeric settings read from environment variables, falling back to the defaults of sv_mcp.config.blazemeter.
+"""
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def env_int(name: str, default: int, minimum: int = 1) -> int:
+    """
+    Integer value of the environment variable `name`, or `default` when it is unset or not an integer.
+    Values below `minimum` are raised to it, so a concurrency of 0 can't block every request.
+    """
+    return max(minimum, _env_number(name, default, int))
+
+
+def env_float(name: str, default: float, minimum: float = 0.0) -> float:
+    """
+    Float value of the environment variable `name`, or `default` when it is unset or not a number.
+    Values below `minimum` are raised to it.
+    """
+    return max(minimum, _env_number(name, default, float))
+
+
+def _env_number(name: str, default, parse):
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return parse(raw.strip())
+    except ValueError:
+        logger.warning("Ignoring %s=%r, it is not a valid number. Using %s", name, raw, default)
+        return default
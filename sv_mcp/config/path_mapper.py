@@ -65,3 +65,8 @@ class PathMapperFactory:
             return DockerPathMappingStrategy(source_dir)
         else:
             return BinaryPathMappingStrategy()
+
+
+def map_path(file_path: str) -> str:
+    """Map a single user supplied path to the path readable by the server."""
+    return PathMapperFactory.create_strategy().map_paths([file_path])[0]
@@ -0,0 +1 @@
+# Converters package
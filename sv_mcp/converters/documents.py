@@ -0,0 +1,18 @@
+import json
+from typing import Any
+
+import yaml
+
+
+def parse_document(text: str, description: str = "document") -> Any:
+    """
+    Parse JSON or YAML text.
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        return yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        raise ValueError(f"The {description} is neither valid JSON nor valid YAML: {e}")
@@ -0,0 +1,254 @@
+"""
+Conversion of HAR recordings into HTTP transactions.
+HAR files are parsed as a stream, one entry at a time, so recordings of any size can be imported.
+"""
+import asyncio
+import base64
+import codecs
+import hashlib
+import itertools
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterator, Tuple, BinaryIO, AsyncIterator
+from urllib.parse import urlsplit, parse_qsl
+
+from sv_mcp.models.vs.generic_dsl import GenericDsl
+from sv_mcp.models.vs.http_header import HttpHeader
+from sv_mcp.models.vs.matcher_dsl import MatcherDsl
+from sv_mcp.models.vs.request_dsl import RequestDsl
+from sv_mcp.models.vs.response_dsl import ResponseDsl
+
+CHUNK_SIZE = 1024 * 1024
+
+# Largest HAR entry read, in characters: bodies are embedded in the entries, Base64 encoded
+MAX_ITEM_SIZE = 256 * 1024 * 1024
+
+# Transactions converted per call to the reading thread
+READ_AHEAD = 64
+
+STRUCTURE = re.compile(r'["{}\[\]]')
+STRING_END = re.compile(r'["\\]')
+SCALAR_END = re.compile(r'[\s,\]]')
+
+# Response headers describing the recorded transfer rather than the content
+EXCLUDED_RESPONSE_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "connection", "keep-alive",
+                             "date", "set-cookie"}
+
+
+class JsonArrayStream:
+    """
+    Iterates the items of the first array stored under `key` in a JSON document, decoding one item at a time.
+    The end of an item is found by scanning only the characters read since the previous chunk, so an item
+    spanning many chunks is decoded once, and an item larger than `max_item_size` characters is an error rather
+    than a buffer growing with the file.
+    """
+
+    def __init__(self, file: BinaryIO, key: str, chunk_size: int = CHUNK_SIZE, max_item_size: int = MAX_ITEM_SIZE):
+        self.file = file
+        self.start = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+        self.chunk_size = chunk_size
+        self.max_item_size = max_item_size
+        self.decoder = json.JSONDecoder()
+        self.utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.bytes_read = 0
+        self.eof = False
+        # Scan state of the current item: next character to look at, nesting depth, inside a string
+        self._offset = 0
+        self._depth = 0
+        self._in_string = False
+
+    def _read(self, size: Optional[int] = None) -> str:
+        chunk = self.file.read(max(size or 0, self.chunk_size))
+        self.bytes_read += len(chunk)
+        if not chunk:
+            self.eof = True
+        return self.utf8.decode(chunk, final=not chunk)
+
+    def _item_end(self, buffer: str, start: int) -> Optional[int]:
+        """
+        End of the item starting at buffer[start], or None when it continues past the buffer. The scan resumes
+        where the previous call stopped.
+        """
+        if buffer[start] not in '{["':
+            match = SCALAR_END.search(buffer, start + 1)
+            return match.start() if match else None
+        position = self._offset
+        while True:
+            if self._in_string:
+                match = STRING_END.search(buffer, position)
+                if match is None:
+                    self._offset = len(buffer)
+                    return None
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        # The escaped character is in the next chunk
+                        self._offset = match.start()
+                        return None
+                    position = match.end() + 1
+                    continue
+                self._in_string = False
+                position = match.end()
+                if self._depth == 0:
+                    return position
+                continue
+            match = STRUCTURE.search(buffer, position)
+            if match is None:
+                self._offset = len(buffer)
+                return None
+            position = match.end()
+            character = match.group()
+            if character == '"':
+                self._in_string = True
+            elif character in "{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return position
+
+    def __iter__(self) -> Iterator[Any]:
+        buffer = ""
+        while True:
+            match = self.start.search(buffer)
+            if match:
+                buffer = buffer[match.end():]
+                break
+            if self.eof:
+                return
+            # Keep a tail in case the key is split between chunks
+            buffer = buffer[-256:] + self._read()
+
+        position = 0
+        item_started = False
+        while True:
+            if not item_started:
+                while position < len(buffer) and buffer[position] in " \t\r\n,":
+                    position += 1
+                if position == len(buffer):
+                    if self.eof:
+                        raise ValueError("Unexpected end of file inside the array")
+                    buffer, position = self._read(), 0
+                    continue
+                if buffer[position] == "]":
+                    return
+                item_started = True
+                self._offset, self._depth, self._in_string = position, 0, False
+            end = self._item_end(buffer, position)
+            if end is None:
+                if self.eof:
+                    raise ValueError("Unexpected end of file inside the array")
+                if len(buffer) - position > self.max_item_size:
+                    raise ValueError(f"An item is larger than {self.max_item_size} characters")
+                # The item continues in the next chunk, read as much as was buffered so copies stay linear
+                self._offset -= position
+                buffer, position = buffer[position:] + self._read(len(buffer) - position), 0
+                continue
+            item, _ = self.decoder.raw_decode(buffer[position:end])
+            yield item
+            position, item_started = end, False
+
+
+def request_signature(method: str, path: str, query: list, body: Optional[str]) -> Tuple:
+    return method, path, tuple(sorted(query)), hashlib.sha256((body or "").encode("utf-8")).hexdigest()
+
+
+def har_entry_to_transaction(entry: Dict[str, Any]) -> Optional[Tuple[Tuple, Dict[str, Any]]]:
+    """
+    (request signature, transaction) for a HAR entry, or None when it can't be replayed.
+    """
+    request = entry.get("request") or {}
+    response = entry.get("response") or {}
+    url = urlsplit(request.get("url", ""))
+    if url.scheme not in ("http", "https") or not response.get("status"):
+        return None
+
+    method = request.get("method", "GET").upper()
+    path = url.path or "/"
+    query = parse_qsl(url.query, keep_blank_values=True)
+    post_data = request.get("postData") or {}
+    body = post_data.get("text")
+
+    body_matchers = []
+    if body:
+        json_body = "json" in (post_data.get("mimeType") or "")
+        body_matchers.append(MatcherDsl(key="body", matcherName="equals_json" if json_body else "equals",
+                                        matchingValue=body))
+    content = response.get("content") or {}
+    text = content.get("text")
+    if text is not None and content.get("encoding") != "base64":
+        text = base64.b64encode(text.encode("utf-8")).decode("utf-8")
+
+    dsl = GenericDsl(
+        requestDsl=RequestDsl(
+            method=method,
+            path=path,
+            url=MatcherDsl(key="url", matcherName="equals_url", matchingValue=path),
+            queryParams=[MatcherDsl(key=name, matcherName="equals", matchingValue=value) for name, value in query],
+            body=body_matchers,
+        ),
+        responseDsl=ResponseDsl(
+            status=response["status"],
+            headers=[HttpHeader(name=header["name"], value=header.get("value", ""))
+                     for header in response.get("headers") or []
+                     if header.get("name", "").lower() not in EXCLUDED_RESPONSE_HEADERS
+                     and not header.get("name", "").startswith(":")],
+            content=text,
+        ),
+    )
+    return request_signature(method, path, query, body), {"name": f"{method} {path}", "dsl": dsl}
+
+
+class HarReader:
+    """
+    Transactions of a HAR file, without the entries repeating the request of a previous one.
+    Counters tell how many entries were read, deduplicated or skipped. Iterated asynchronously, the file is
+    read and converted in a thread, READ_AHEAD transactions at a time.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.entries = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self._stream: Optional[JsonArrayStream] = None
+
+    @property
+    def bytes_read(self) -> int:
+        return self._stream.bytes_read if self._stream else 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        signatures = set()
+        names: Dict[str, int] = {}
+        with open(self.path, "rb") as har_file:
+            self._stream = JsonArrayStream(har_file, "entries")
+            for entry in self._stream:
+                self.entries += 1
+                converted = har_entry_to_transaction(entry)
+                if converted is None:
+                    self.skipped += 1
+                    continue
+                signature, transaction = converted
+                if signature in signatures:
+                    self.duplicates += 1
+                    continue
+                signatures.add(signature)
+                # Requests to the same path with other parameters or bodies get numbered names
+                count = names.get(transaction["name"], 0) + 1
+                names[transaction["name"]] = count
+                if count > 1:
+                    transaction["name"] = f"{transaction['name']} ({count})"
+                yield transaction
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        transactions = iter(self)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="har") as pool:
+            while True:
+                batch = await loop.run_in_executor(pool, lambda: list(itertools.islice(transactions, READ_AHEAD)))
+                if not batch:
+                    return
+                for transaction in batch:
+                    yield transaction
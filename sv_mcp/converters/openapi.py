@@ -0,0 +1,193 @@
+"""
+Conversion of OpenAPI 3 documents into HTTP transactions. The request of every response of an operation is the same,
+so only the first one is reachable: by default a single transaction is created per operation.
+"""
+import base64
+import json
+import re
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+from urllib.parse import urlsplit
+
+from sv_mcp.converters.documents import parse_document
+from sv_mcp.models.vs.generic_dsl import GenericDsl
+from sv_mcp.models.vs.http_header import HttpHeader
+from sv_mcp.models.vs.matcher_dsl import MatcherDsl
+from sv_mcp.models.vs.request_dsl import RequestDsl
+from sv_mcp.models.vs.response_dsl import ResponseDsl
+
+HTTP_METHODS = ("get", "put", "post", "delete", "patch", "head", "options", "trace")
+
+# Nesting followed when generating an example from a schema
+MAX_SCHEMA_DEPTH = 6
+
+PATH_PARAMETER = re.compile(r"\{[^/{}]+\}")
+
+SCHEMA_EXAMPLES = {
+    "string": "string",
+    "integer": 0,
+    "number": 0.0,
+    "boolean": True,
+}
+
+FORMAT_EXAMPLES = {
+    "date": "2024-01-01",
+    "date-time": "2024-01-01T00:00:00Z",
+    "uuid": "00000000-0000-0000-0000-000000000000",
+    "email": "user@example.com",
+    "uri": "https://example.com",
+}
+
+
+def resolve_reference(spec: Dict[str, Any], value: Any) -> Any:
+    """
+    Follow local $ref pointers (#/components/...) until a value without one.
+    """
+    seen = set()
+    while isinstance(value, dict) and "$ref" in value:
+        reference = value["$ref"]
+        if not reference.startswith("#/") or reference in seen:
+            return {}
+        seen.add(reference)
+        value = spec
+        for part in reference[2:].split("/"):
+            value = value.get(part.replace("~1", "/").replace("~0", "~"), {}) if isinstance(value, dict) else {}
+    return value
+
+
+def example_from_schema(spec: Dict[str, Any], schema: Any, depth: int = 0) -> Any:
+    schema = resolve_reference(spec, schema)
+    if not isinstance(schema, dict) or depth > MAX_SCHEMA_DEPTH:
+        return None
+    for key in ("example", "default"):
+        if key in schema:
+            return schema[key]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    for key in ("allOf", "oneOf", "anyOf"):
+        if schema.get(key):
+            if key != "allOf":
+                return example_from_schema(spec, schema[key][0], depth + 1)
+            merged = {}
+            for part in schema[key]:
+                example = example_from_schema(spec, part, depth + 1)
+                if isinstance(example, dict):
+                    merged.update(example)
+            return merged
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        schema_type = next((t for t in schema_type if t != "null"), None)
+    if schema_type == "object" or "properties" in schema:
+        return {name: example_from_schema(spec, property_schema, depth + 1)
+                for name, property_schema in (schema.get("properties") or {}).items()}
+    if schema_type == "array":
+        item = example_from_schema(spec, schema.get("items"), depth + 1)
+        return [item] if item is not None else []
+    if schema_type == "string" and schema.get("format") in FORMAT_EXAMPLES:
+        return FORMAT_EXAMPLES[schema["format"]]
+    return SCHEMA_EXAMPLES.get(schema_type)
+
+
+def response_examples(spec: Dict[str, Any], response: Dict[str, Any]) -> List[Tuple[Optional[str], Optional[str], Any]]:
+    """
+    (example name, media type, body) of every example of a response. Responses without content have a
+    single example without body.
+    """
+    content = response.get("content") or {}
+    if not content:
+        return [(None, None, None)]
+    media_type, media = next(iter(content.items()))
+    media = resolve_reference(spec, media) or {}
+    if media.get("examples"):
+        return [(name, media_type, resolve_reference(spec, example).get("value"))
+                for name, example in media["examples"].items()]
+    if "example" in media:
+        return [(None, media_type, media["example"])]
+    return [(None, media_type, example_from_schema(spec, media.get("schema")))]
+
+
+def status_code(code: str) -> Optional[int]:
+    if code == "default":
+        return None
+    if re.fullmatch(r"[1-5]XX", code, re.IGNORECASE):
+        return int(code[0]) * 100
+    return int(code) if code.isdigit() else None
+
+
+def url_matcher(path: str) -> MatcherDsl:
+    if PATH_PARAMETER.search(path):
+        parts = PATH_PARAMETER.split(path)
+        return MatcherDsl(key="url", matcherName="matches_url",
+                          matchingValue="^" + "[^/]+".join(re.escape(part) for part in parts) + "(\\?.*)?$")
+    return MatcherDsl(key="url", matcherName="equals_url", matchingValue=path)
+
+
+def encode_body(body: Any) -> Optional[str]:
+    if body is None:
+        return None
+    text = body if isinstance(body, str) else json.dumps(body)
+    return base64.b64encode(text.encode("utf-8")).decode("utf-8")
+
+
+class OpenApiReader:
+    """
+    Transactions of an OpenAPI 3 document. Counters tell how many response examples were found, skipped and left
+    out because they repeat the request of another one. With `all_responses` every response example is converted,
+    `unreachable` tells how many of them can never be matched.
+    """
+
+    def __init__(self, text: str, all_responses: bool = False):
+        spec = parse_document(text, "OpenAPI document")
+        if not isinstance(spec, dict) or not str(spec.get("openapi", "")).startswith("3"):
+            raise ValueError("Only OpenAPI 3 documents are supported")
+        self.spec = spec
+        self.all_responses = all_responses
+        self.entries = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self.unreachable = 0
+        servers = spec.get("servers") or []
+        self.base_path = urlsplit(servers[0].get("url", "")).path.rstrip("/") if servers else ""
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for path, path_item in (self.spec.get("paths") or {}).items():
+            path_item = resolve_reference(self.spec, path_item)
+            for method in HTTP_METHODS:
+                operation = path_item.get(method)
+                if not isinstance(operation, dict):
+                    continue
+                yield from self._operation_transactions(self.base_path + path, method.upper(), operation)
+
+    def _operation_transactions(self, path: str, method: str, operation: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        url = url_matcher(path)
+        operation_name = operation.get("operationId") or f"{method} {path}"
+        responses = []
+        for code, response in (operation.get("responses") or {}).items():
+            status = status_code(str(code))
+            examples = response_examples(self.spec, resolve_reference(self.spec, response))
+            self.entries += len(examples)
+            if status is None:
+                self.skipped += len(examples)
+            else:
+                responses.append((status, examples))
+        if not self.all_responses and responses:
+            # The first success response, or the first response of operations without one
+            first = next((response for response in responses if 200 <= response[0] < 300), responses[0])
+            self.duplicates += sum(len(examples) for _, examples in responses) - 1
+            responses = [(first[0], first[1][:1])]
+        created = 0
+        for status, examples in responses:
+            for example_name, media_type, body in examples:
+                name = f"{operation_name} {status}"
+                if len(examples) > 1 and example_name:
+                    name += f" {example_name}"
+                dsl = GenericDsl(
+                    requestDsl=RequestDsl(method=method, path=url.matchingValue, url=url),
+                    responseDsl=ResponseDsl(
+                        status=status,
+                        headers=[HttpHeader(name="Content-Type", value=media_type)] if media_type else [],
+                        content=encode_body(body),
+                    ),
+                )
+                created += 1
+                yield {"name": name, "dsl": dsl}
+        self.unreachable += max(created - 1, 0)
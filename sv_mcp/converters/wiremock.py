@@ -0,0 +1,246 @@
+"""
+Conversion between WireMock stub mappings and HTTP transactions.
+A WireMock directory has stub mappings in mappings/ (one or many per file) and response bodies in __files/.
+"""
+import asyncio
+import base64
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator
+
+from sv_mcp.models.vs.generic_dsl import GenericDsl
+from sv_mcp.models.vs.http_header import HttpHeader
+from sv_mcp.models.vs.http_transaction import HttpTransaction
+from sv_mcp.models.vs.matcher_dsl import MatcherDsl
+from sv_mcp.models.vs.request_dsl import RequestDsl
+from sv_mcp.models.vs.response_dsl import ResponseDsl
+
+# WireMock pattern operator -> matcher name, for headers, query parameters and bodies
+PATTERN_MATCHERS = {
+    "equalTo": "equals",
+    "contains": "contains",
+    "matches": "matches",
+    "doesNotMatch": "not_matches",
+    "absent": "absent",
+    "equalToJson": "equals_json",
+    "matchesJsonPath": "matches_json",
+    "equalToXml": "equals_xml",
+    "matchesXPath": "matches_xml",
+}
+MATCHER_PATTERNS = {matcher: pattern for pattern, matcher in PATTERN_MATCHERS.items()}
+MATCHER_PATTERNS["equals_insensitive"] = "equalTo"
+
+URL_MATCHERS = {
+    "url": "equals_url",
+    "urlPath": "equals_url",
+    "urlPattern": "matches_url",
+    "urlPathPattern": "matches_url",
+}
+
+
+def mapping_files(directory: str) -> List[str]:
+    """
+    Stub mapping files of a WireMock directory, or of a directory of mappings itself.
+    """
+    mappings = os.path.join(directory, "mappings")
+    root = mappings if os.path.isdir(mappings) else directory
+    files = []
+    for current, _, names in os.walk(root):
+        files.extend(os.path.join(current, name) for name in names if name.endswith(".json"))
+    return sorted(files)
+
+
+def _pattern_matcher(key: str, pattern: Any) -> Optional[MatcherDsl]:
+    if not isinstance(pattern, dict):
+        return None
+    for operator, matcher_name in PATTERN_MATCHERS.items():
+        if operator in pattern:
+            value = pattern[operator]
+            if operator == "absent":
+                value = ""
+            elif operator == "equalTo" and pattern.get("caseInsensitive"):
+                matcher_name = "equals_insensitive"
+            elif operator == "matchesJsonPath" and isinstance(value, dict):
+                value = value.get("expression", "")
+            if not isinstance(value, str):
+                value = json.dumps(value)
+            return MatcherDsl(key=key, matcherName=matcher_name, matchingValue=value)
+    return None
+
+
+def _body_file_path(files_directory: str, file_name: str) -> str:
+    """
+    Path of a body file, which must be inside __files once links, absolute paths and .. are resolved.
+    """
+    root = os.path.realpath(files_directory)
+    path = os.path.realpath(os.path.join(root, file_name))
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError(f"bodyFileName {file_name} is outside __files")
+    return path
+
+
+def _response_content(response: Dict[str, Any], files_directory: str) -> Optional[str]:
+    if "base64Body" in response:
+        return response["base64Body"]
+    if "jsonBody" in response:
+        body = json.dumps(response["jsonBody"]).encode("utf-8")
+    elif "body" in response:
+        body = str(response["body"]).encode("utf-8")
+    elif "bodyFileName" in response:
+        with open(_body_file_path(files_directory, response["bodyFileName"]), "rb") as body_file:
+            body = body_file.read()
+    else:
+        return None
+    return base64.b64encode(body).decode("utf-8")
+
+
+def mapping_to_transaction(mapping: Dict[str, Any], files_directory: str) -> Optional[Dict[str, Any]]:
+    """
+    Transaction item (name, dsl, delay) for a stub mapping, or None when it has no URL matcher.
+    """
+    request = mapping.get("request") or {}
+    response = mapping.get("response") or {}
+    url_key = next((key for key in URL_MATCHERS if key in request), None)
+    if url_key is None:
+        return None
+    method = request.get("method", "ANY").upper()
+    url = MatcherDsl(key="url", matcherName=URL_MATCHERS[url_key], matchingValue=request[url_key])
+
+    headers = [_pattern_matcher(name, pattern) for name, pattern in (request.get("headers") or {}).items()]
+    query = [_pattern_matcher(name, pattern) for name, pattern in (request.get("queryParameters") or {}).items()]
+    body = [_pattern_matcher("body", pattern) for pattern in request.get("bodyPatterns") or []]
+    dsl = GenericDsl(
+        requestDsl=RequestDsl(
+            method=method,
+            path=request[url_key],
+            url=url,
+            headers=[matcher for matcher in headers if matcher],
+            queryParams=[matcher for matcher in query if matcher],
+            body=[matcher for matcher in body if matcher],
+        ),
+        responseDsl=ResponseDsl(
+            status=response.get("status", 200),
+            headers=[HttpHeader(name=name, value=", ".join(value) if isinstance(value, list) else str(value))
+                     for name, value in (response.get("headers") or {}).items()],
+            content=_response_content(response, files_directory),
+        ),
+    )
+    return {
+        "name": mapping.get("name") or f"{method} {request[url_key]}",
+        "dsl": dsl,
+        "delay": response.get("fixedDelayMilliseconds"),
+    }
+
+
+def convert_mapping_file(path: str, files_directory: str) -> Tuple[List[Dict[str, Any]], int, List[str]]:
+    """
+    (transactions, skipped stubs, errors) of a mapping file. Runs in a worker thread.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as mapping_file:
+            document = json.load(mapping_file)
+        mappings = document.get("mappings", [document]) if isinstance(document, dict) else document
+        transactions, skipped = [], 0
+        for mapping in mappings:
+            transaction = mapping_to_transaction(mapping, files_directory)
+            if transaction is None:
+                skipped += 1
+            else:
+                transactions.append(transaction)
+        return transactions, skipped, []
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        return [], 1, [f"{os.path.basename(path)}: {e}"]
+
+
+def _decode(value: str) -> str:
+    try:
+        return base64.b64decode(value, validate=True).decode("utf-8")
+    except ValueError:
+        return value
+
+
+def transaction_to_mapping(transaction: HttpTransaction) -> Dict[str, Any]:
+    """
+    WireMock stub mapping of an HTTP transaction as returned by the API.
+    """
+    request_dsl = transaction.dsl.requestDsl
+    response_dsl = transaction.dsl.responseDsl
+
+    def pattern(matcher: MatcherDsl, value: str) -> Dict[str, Any]:
+        operator = MATCHER_PATTERNS.get(matcher.matcherName, "equalTo")
+        if operator == "absent":
+            return {"absent": True}
+        result = {operator: value}
+        if matcher.matcherName == "equals_insensitive":
+            result["caseInsensitive"] = True
+        return result
+
+    request: Dict[str, Any] = {"method": request_dsl.method or "ANY"}
+    url_value = request_dsl.url.matchingValue if request_dsl.url else request_dsl.path
+    matches = request_dsl.url is not None and request_dsl.url.matcherName == "matches_url"
+    request["urlPattern" if matches else "url"] = url_value
+    if request_dsl.headers:
+        request["headers"] = {m.key: pattern(m, m.matchingValue) for m in request_dsl.headers}
+    if request_dsl.queryParams:
+        request["queryParameters"] = {m.key: pattern(m, m.matchingValue) for m in request_dsl.queryParams}
+    if request_dsl.body:
+        # Body matchers are stored Base64 encoded
+        request["bodyPatterns"] = [pattern(m, _decode(m.matchingValue)) for m in request_dsl.body]
+
+    response: Dict[str, Any] = {"status": response_dsl.status}
+    if response_dsl.headers:
+        response["headers"] = {header.name: header.value for header in response_dsl.headers}
+    if response_dsl.content:
+        body = _decode(response_dsl.content)
+        response["body" if body != response_dsl.content else "base64Body"] = body
+    delay = getattr(response_dsl, "responseDelay", None)
+    if isinstance(delay, dict) and delay.get("duration"):
+        response["fixedDelayMilliseconds"] = delay["duration"]
+    return {"name": transaction.name, "request": request, "response": response}
+
+
+def mapping_file_name(transaction: HttpTransaction) -> str:
+    return f"{re.sub(r'[^A-Za-z0-9._-]+', '-', transaction.name).strip('-') or 'transaction'}-{transaction.id}.json"
+
+
+def write_mapping_file(directory: str, transaction: HttpTransaction) -> str:
+    """
+    Write the stub mapping of a transaction to the directory. Runs in a worker thread.
+    """
+    path = os.path.join(directory, mapping_file_name(transaction))
+    with open(path, "w", encoding="utf-8") as mapping_file:
+        json.dump(transaction_to_mapping(transaction), mapping_file, indent=2)
+    return path
+
+
+class WireMockReader:
+    """
+    Transactions of the stub mappings of a WireMock directory. Files are read and converted in a pool of
+    threads, a few of them ahead of the transactions consumed.
+    """
+
+    def __init__(self, directory: str, threads: int):
+        self.directory = directory
+        self.files_directory = os.path.join(directory, "__files")
+        self.files = mapping_files(directory)
+        self.threads = max(1, threads)
+        self.entries = 0
+        self.skipped = 0
+        self.errors: List[str] = []
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        window = self.threads * 4
+        with ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="wiremock") as pool:
+            for start in range(0, len(self.files), window):
+                conversions = await asyncio.gather(*(
+                    loop.run_in_executor(pool, convert_mapping_file, path, self.files_directory)
+                    for path in self.files[start:start + window]))
+                for transactions, skipped, errors in conversions:
+                    self.entries += len(transactions) + skipped
+                    self.skipped += skipped
+                    self.errors.extend(errors)
+                    for transaction in transactions:
+                        yield transaction
@@ -7,7 +7,10 @@ from typing import Literal, cast
 from mcp.server.fastmcp import FastMCP
 
 from sv_mcp.config.token import BzmToken, BzmTokenError
+from sv_mcp.config.blazemeter import HTTP_KEEPALIVE_EXPIRY
+from sv_mcp.config.env import env_float
 from sv_mcp.config.version import __version__, __executable__
+from sv_mcp.tools.utils import api_clients
 from server import register_tools
 
 BLAZEMETER_API_KEY_FILE_PATH = os.getenv('API_KEY_PATH')
@@ -77,7 +80,8 @@ def run(log_level: str = "DEBUG", mode: str = "stdio"):
             unless user requested a specific workspace.
     """
     if mode == "stdio":
-        mcp = FastMCP("blazemeter-mcp", instructions=instructions, log_level="DEBUG")
+        mcp = FastMCP("blazemeter-mcp", instructions=instructions, log_level="DEBUG",
+                      lifespan=api_clients.lifespan())
         register_tools(mcp, token)
         mcp.run(transport="stdio")
     elif mode in ("http", "http-stateless"):
@@ -94,7 +98,9 @@ def run(log_level: str = "DEBUG", mode: str = "stdio"):
             log_level=cast(LOG_LEVELS, log_level),
             stateless_http=(mode == "http-stateless"),
             host=host,
-            port=port
+            port=port,
+            # Keep pooled API connections warm between sessions for the keep-alive period
+            lifespan=api_clients.lifespan(env_float("HTTP_KEEPALIVE_EXPIRY", HTTP_KEEPALIVE_EXPIRY))
         )
         register_tools(mcp, token)
         mcp.run(transport="streamable-http")
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class BatchItemResult(BaseModel):
+    index: int = Field(..., description="Position of the item in the request")
+    name: Optional[str] = Field(None, description="Name of the item")
+    id: Optional[int] = Field(None, description="Id of the created entity")
+    error: Optional[str] = Field(None, description="Error creating the item")
+
+    class Config:
+        extra = "ignore"
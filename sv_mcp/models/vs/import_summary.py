@@ -0,0 +1,28 @@
+from typing import Optional, List
+
+from pydantic import BaseModel, Field
+
+
+class ImportSummary(BaseModel):
+    source: str = Field(..., description="Imported file")
+    entries: int = Field(0, description="Number of requests found in the file")
+    created: int = Field(0, description="Number of transactions created")
+    duplicates: int = Field(0, description="Number of requests skipped because they repeat a previous one")
+    skipped: int = Field(0, description="Number of requests that could not be converted")
+    failed: int = Field(0, description="Number of transactions that failed to be created")
+    errors: Optional[List[str]] = Field(None, description="First errors found")
+    elapsedSeconds: float = Field(..., description="Time spent")
+
+    class Config:
+        extra = "ignore"
+
+
+class ExportSummary(BaseModel):
+    destination: str = Field(..., description="Directory the files were written to")
+    exported: int = Field(0, description="Number of files written")
+    failed: int = Field(0, description="Number of entities that could not be exported")
+    errors: Optional[List[str]] = Field(None, description="First errors found")
+    elapsedSeconds: float = Field(..., description="Time spent")
+
+    class Config:
+        extra = "ignore"
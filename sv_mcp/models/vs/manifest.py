@@ -0,0 +1,75 @@
+from typing import Optional, List, Dict, Any, Union
+
+from pydantic import BaseModel, Field
+
+
+class ManifestService(BaseModel):
+    name: str = Field(..., description="The name of the service")
+
+    class Config:
+        extra = "forbid"
+
+
+class ManifestTransaction(BaseModel):
+    name: str = Field(..., description="The name of the transaction, unique within its service")
+    service: str = Field(..., description="The name of the service the transaction belongs to")
+    type: str = Field("HTTP", description="'HTTP' for HTTP transactions, any other value for messaging transactions")
+    dsl: Dict[str, Any] = Field(..., description="Transaction DSL, as in the transaction tools")
+    delay: Optional[int] = Field(None, description="Response delay in milliseconds")
+
+    class Config:
+        extra = "forbid"
+
+
+class ManifestConfiguration(BaseModel):
+    name: str = Field(..., description="The name of the configuration")
+    values: Dict[str, str] = Field({}, description="Configuration map of names and values")
+
+    class Config:
+        extra = "forbid"
+
+
+class ManifestTransactionReference(BaseModel):
+    name: str = Field(..., description="The name of a transaction of the same service")
+    priority: int = Field(10, description="Transaction Priority. If not specified, defaults to 10.")
+
+    class Config:
+        extra = "forbid"
+
+
+class ManifestTemplate(BaseModel):
+    name: str = Field(..., description="The name of the virtual service template")
+    service: str = Field(..., description="The name of the service the template belongs to")
+    noMatchingRequestPreference: str = Field("return404", description="'return404' or 'bypasslive'")
+    transactions: List[Union[str, ManifestTransactionReference]] = Field(
+        [], description="Transactions of the template, by name or as {name, priority}")
+    configuration: Optional[str] = Field(None, description="The name of the configuration to assign")
+
+    class Config:
+        extra = "forbid"
+
+
+class ManifestVirtualService(ManifestTemplate):
+    harborId: str = Field(..., description="Location harbor identifier")
+    shipId: str = Field(..., description="Location ship identifier")
+    endpointPreference: str = Field("HTTPS", description="'HTTP' or 'HTTPS'")
+
+
+class Manifest(BaseModel):
+    services: List[ManifestService] = Field([], description="Services")
+    configurations: List[ManifestConfiguration] = Field([], description="Configurations")
+    transactions: List[ManifestTransaction] = Field([], description="HTTP and messaging transactions")
+    templates: List[ManifestTemplate] = Field([], description="Virtual service templates")
+    virtual_services: List[ManifestVirtualService] = Field([], description="Virtual services")
+
+    class Config:
+        extra = "forbid"
+
+
+class PlanStep(BaseModel):
+    kind: str = Field(..., description="Entity kind: service, configuration, transaction, template or virtual_service")
+    name: str = Field(..., description="Entity name, prefixed by its service name when it belongs to one")
+    action: str = Field(..., description="'create', 'update' or 'unchanged'")
+    id: Optional[int] = Field(None, description="Id of the existing or created entity")
+    changes: Optional[List[str]] = Field(None, description="Fields that differ from the current state")
+    error: Optional[str] = Field(None, description="Error applying the step")
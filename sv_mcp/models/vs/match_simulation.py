@@ -0,0 +1,40 @@
+from typing import Optional, List
+
+from pydantic import BaseModel, Field
+
+
+class MatcherOutcome(BaseModel):
+    field: str = Field(..., description="Part of the request checked: method, url, header, query or body")
+    key: Optional[str] = Field(None, description="Header or query parameter name")
+    matcherName: str = Field(..., description="Name of the matcher")
+    outcome: str = Field(
+        ...,
+        description="'match', 'no_match', or 'unknown' when the matcher can't be evaluated locally"
+    )
+    detail: Optional[str] = Field(None, description="Value compared or reason of the outcome")
+
+    class Config:
+        extra = "ignore"
+
+
+class SimulatedMatch(BaseModel):
+    index: int = Field(..., description="Position of the request in the input")
+    request: str = Field(..., description="Method and URL of the request")
+    transactionId: Optional[int] = Field(None, description="Id of the transaction answering the request")
+    transactionName: Optional[str] = Field(None, description="Name of the transaction answering the request")
+    priority: Optional[int] = Field(None, description="Priority of the transaction answering the request")
+    certain: bool = Field(
+        True,
+        description="False when some matcher of the transaction could not be evaluated locally"
+    )
+    closestTransactionId: Optional[int] = Field(
+        None,
+        description="When no transaction matches, the transaction with the most matchers satisfied"
+    )
+    matchers: Optional[List[MatcherOutcome]] = Field(
+        None,
+        description="Outcome of every matcher of the matching transaction, or of the closest one"
+    )
+
+    class Config:
+        extra = "ignore"
@@ -0,0 +1,24 @@
+from typing import Optional, List
+
+from pydantic import BaseModel, Field
+
+
+class MatcherLint(BaseModel):
+    transactionId: Optional[int] = Field(None, description="Id of the transaction")
+    transactionName: Optional[str] = Field(None, description="Name of the transaction")
+    field: str = Field(..., description="Part of the request checked: url, header, query or body")
+    key: Optional[str] = Field(None, description="Header or query parameter name")
+    matcherName: str = Field(..., description="Name of the matcher")
+    cost: int = Field(..., description="Estimated relative cost of evaluating the matcher on each request")
+    severity: str = Field(
+        ...,
+        description=(
+            "'error' for invalid expressions and patterns with catastrophic backtracking, 'warning' for other "
+            "expensive constructs, 'info' when only a cheaper equivalent is suggested"
+        )
+    )
+    issues: List[str] = Field(default_factory=list, description="Expensive or invalid constructs found")
+    suggestion: Optional[str] = Field(None, description="Cheaper equivalent matcher, when there is one")
+
+    class Config:
+        extra = "ignore"
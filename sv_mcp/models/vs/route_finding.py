@@ -0,0 +1,28 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class RouteFinding(BaseModel):
+    kind: str = Field(
+        ...,
+        description=(
+            "'duplicate' when both transactions match the same requests, 'shadowed' when the transaction is never "
+            "answered because the other one matches all its requests first, 'ambiguous' when they match some of "
+            "the same requests with the same priority"
+        )
+    )
+    transactionId: Optional[int] = Field(None, description="Id of the affected transaction")
+    transactionName: Optional[str] = Field(None, description="Name of the affected transaction")
+    priority: int = Field(..., description="Priority of the affected transaction")
+    otherTransactionId: Optional[int] = Field(None, description="Id of the transaction answering first")
+    otherTransactionName: Optional[str] = Field(None, description="Name of the transaction answering first")
+    otherPriority: int = Field(..., description="Priority of the transaction answering first")
+    certain: bool = Field(
+        True,
+        description="False when the containment of a URL pattern in another was checked on generated samples"
+    )
+    detail: str = Field(..., description="Description of the finding")
+
+    class Config:
+        extra = "ignore"
@@ -0,0 +1,32 @@
+from typing import Optional, List, Dict
+
+from pydantic import BaseModel, Field
+
+from sv_mcp.models.vs.matching_log_entry import MatchingLogEntry
+from sv_mcp.models.vs.sandbox_request import SandboxRequest
+
+
+class SandboxTestCase(BaseModel):
+    transactionId: int = Field(..., description="Id of the transaction placed in the sandbox for this case")
+    name: Optional[str] = Field(None, description="Name of the case, shown in the report")
+    request: SandboxRequest = Field(..., description="Request sent to the sandbox")
+    expectedStatus: Optional[int] = Field(None, description="Expected HTTP status of the response")
+    expectedBody: Optional[str] = Field(None, description="Expected response body, as plain text")
+    bodyContains: Optional[List[str]] = Field(None, description="Texts the response body must contain")
+    expectedHeaders: Optional[Dict[str, str]] = Field(None, description="Expected response header values by name")
+
+    class Config:
+        extra = "ignore"
+
+
+class SandboxCaseResult(BaseModel):
+    index: int = Field(..., description="Position of the case in the suite")
+    name: Optional[str] = Field(None, description="Name of the case")
+    transactionId: int = Field(..., description="Id of the transaction tested")
+    passed: bool = Field(..., description="Whether every assertion of the case passed")
+    status: Optional[int] = Field(None, description="HTTP status of the sandbox response")
+    failures: Optional[List[str]] = Field(None, description="Failed assertions or the error of the request")
+    matchingLog: Optional[List[MatchingLogEntry]] = Field(None, description="Matching log, only for failed cases")
+
+    class Config:
+        extra = "ignore"
@@ -0,0 +1,16 @@
+from typing import Optional, Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class SnapshotSummary(BaseModel):
+    path: str = Field(..., description="Path of the snapshot file")
+    workspaceId: int = Field(..., description="The id of the exported workspace")
+    counts: Dict[str, int] = Field({}, description="Number of entities of each kind exported or imported")
+    skipped: Optional[Dict[str, int]] = Field(None, description="Number of entities of each kind not imported")
+    errors: Optional[List[str]] = Field(None, description="Entity lists or entities that failed")
+    checkpoint: Optional[str] = Field(None, description="Path of the import checkpoint file")
+    elapsedSeconds: float = Field(..., description="Time spent")
+
+    class Config:
+        extra = "ignore"
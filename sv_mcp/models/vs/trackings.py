@@ -74,3 +74,13 @@ class FileUploadTracking(BaseModel):
 
     class Config:
         extra = "ignore"
+
+
+class StageTiming(BaseModel):
+    serviceMockId: Optional[int] = Field(None, description="Virtual service id.")
+    stage: str = Field(None, description="Stage of the tracked job.")
+    started: Optional[str] = Field(None, description="Datetime when the stage started.")
+    durationSeconds: Optional[float] = Field(None, description="Seconds spent in the stage.")
+
+    class Config:
+        extra = "ignore"
@@ -6,6 +6,7 @@ from sv_mcp.models.vs.assigned_asset import AssignedAsset
 from sv_mcp.models.vs.broker_configuration import BrokerConfiguration
 from sv_mcp.models.vs.mock_service_transaction import MockServiceTransaction
 from sv_mcp.models.vs.proxy_configuration import ProxyConfiguration
+from sv_mcp.models.vs.trackings import StageTiming
 
 
 class Endpoint(BaseModel):
@@ -70,3 +71,30 @@ class ActionResult(BaseModel):
 
     class Config:
         extra = "ignore"
+
+
+class DeploymentResult(BaseModel):
+    virtualService: Optional[VirtualService] = Field(None, description="The virtual service, with its endpoints once deployed")
+    trackingId: str = Field(..., description="Deployment tracking id")
+    status: str = Field(None, description="Final status of the deployment tracking: 'FINISHED' or 'FAILED'")
+    errors: Optional[List[str]] = Field(None, description="List of deployment errors")
+    warnings: Optional[List[str]] = Field(None, description="List of deployment warnings")
+    stageTimings: Optional[List[StageTiming]] = Field(None, description="Time spent in each deployment stage")
+
+    class Config:
+        extra = "ignore"
+
+
+class BulkActionOutcome(BaseModel):
+    id: int = Field(..., description="The unique identifier of the virtual service")
+    name: Optional[str] = Field(None, description="The name of the virtual service")
+    trackingId: Optional[str] = Field(None, description="Action tracking id")
+    status: Optional[str] = Field(None, description="Final status of the action tracking: 'FINISHED' or 'FAILED', "
+                                                    "or the last one seen if it didn't finish in time")
+    errors: Optional[List[str]] = Field(None, description="List of errors of the action")
+    endpoints: Optional[List[Endpoint]] = Field(None, description="Virtual service endpoints after a deployment")
+    durationSeconds: Optional[float] = Field(None, description="Seconds from the action request to its final status")
+    stageTimings: Optional[List[StageTiming]] = Field(None, description="Time spent in each stage of the action")
+
+    class Config:
+        extra = "ignore"
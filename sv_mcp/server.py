@@ -14,6 +14,8 @@ from sv_mcp.tools.vs.sandbox_manager import register as register_sandbox_manager
 from sv_mcp.tools.vs.action_manager import register as register_action_manager
 from sv_mcp.tools.vs.configuration_manager import register as register_configuration_manager
 from sv_mcp.tools.vs.asset_manager import register as register_asset_manager
+from sv_mcp.tools.vs.manifest_manager import register as register_manifest_manager
+from sv_mcp.tools.vs.snapshot_manager import register as register_snapshot_manager
 from sv_mcp.config.token import BzmToken
 from typing import Optional, Dict, Callable
 
@@ -47,6 +49,8 @@ def register_tools(mcp, token: Optional[BzmToken]):
         "virtual_services_action": register_action_manager,
         "virtual_services_configuration": register_configuration_manager,
         "virtual_services_asset": register_asset_manager,
+        "virtual_services_manifest": register_manifest_manager,
+        "virtual_services_snapshot": register_snapshot_manager,
     }
 
     for name, register_fn in registry.items():
@@ -3,10 +3,11 @@ from typing import Optional, Dict, Any
 import httpx
 from mcp.server.fastmcp import Context
 
-from sv_mcp.config.blazemeter import ACCOUNTS_ENDPOINT, TOOLS_PREFIX
+from sv_mcp.config.blazemeter import ACCOUNTS_ENDPOINT, TOOLS_PREFIX, CACHE_TTL_ACCOUNTS
 from sv_mcp.config.token import BzmToken
 from sv_mcp.formatters.account import format_accounts
 from sv_mcp.models.result import BaseResult
+from sv_mcp.tools.cache import consent_cache
 from sv_mcp.tools.utils import bzm_api_request
 
 
@@ -21,6 +22,7 @@ class AccountManager:
         self.ctx = ctx
 
     async def read(self, account_id: int) -> BaseResult:
+        # Not served from the response cache: the AI consent read here seeds the consent cache
         account_result = await bzm_api_request(
             self.token,
             "GET",
@@ -31,13 +33,32 @@ class AccountManager:
             return account_result
         else:
             ai_consent = account_result.result[0].ai_consent
+            consent_cache.set_consent(self.token, account_id, ai_consent is True)
             if ai_consent is not True:
-                return BaseResult(
-                    error=f"The Account ID {account_id} does not have AI consent. Contact your account manager for more information."
-                )
+                return self.consent_denied(account_id)
             else:
                 return account_result
 
+    async def check_consent(self, account_id: int) -> Optional[BaseResult]:
+        """
+        Verify the AI consent of the account, reading it only when it's not cached.
+        Returns the error result when the account is not allowed, None otherwise.
+        """
+        ai_consent = consent_cache.get_consent(self.token, account_id) if self.token else None
+        if ai_consent is None:
+            account_result = await self.read(account_id)
+            return account_result if account_result.error else None
+        elif ai_consent is not True:
+            return self.consent_denied(account_id)
+        else:
+            return None
+
+    @staticmethod
+    def consent_denied(account_id: int) -> BaseResult:
+        return BaseResult(
+            error=f"The Account ID {account_id} does not have AI consent. Contact your account manager for more information."
+        )
+
     async def list(self, limit: int = 50, offset: int = 0) -> BaseResult:
 
         # Note: Not it's needed to control AI consent at this level
@@ -53,7 +74,8 @@ class AccountManager:
             "GET",
             f"{ACCOUNTS_ENDPOINT}",
             result_formatter=format_accounts,
-            params=parameters
+            params=parameters,
+            cache_ttl=CACHE_TTL_ACCOUNTS
         )
 
 
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from mcp.server.fastmcp import Context
 
 from sv_mcp.config.token import BzmToken
@@ -13,6 +15,33 @@ async def read_account(token: BzmToken, ctx: Context, account_id: int) -> BaseRe
     return await AccountManager(token, ctx).read(account_id)
 
 
+async def check_account_consent(token: BzmToken, ctx: Context, account_id: int) -> Optional[BaseResult]:
+    from sv_mcp.tools.account_manager import AccountManager
+    return await AccountManager(token, ctx).check_consent(account_id)
+
+
 async def read_workspace(token: BzmToken, ctx: Context, workspace_id: int) -> BaseResult:
     from sv_mcp.tools.workspace_manager import WorkspaceManager
     return await WorkspaceManager(token, ctx).read(workspace_id)
+
+
+# VS
+async def wait_tracking(token: BzmToken, ctx: Context, tracking_id: str, timeout: Optional[float] = None) -> BaseResult:
+    from sv_mcp.tools.vs.tracking_manager import TrackingManager
+    return await TrackingManager(token, ctx).wait(tracking_id, timeout)
+
+
+def tracking_stage_timings(token: BzmToken, tracking_id: str) -> list:
+    from sv_mcp.tools.vs.tracking_registry import tracking_registry
+    return tracking_registry.stage_timings(token, tracking_id)
+
+
+async def read_virtual_service(token: BzmToken, ctx: Context, workspace_id: int, vs_id: int) -> BaseResult:
+    from sv_mcp.tools.vs.virtual_service_manager import VirtualServiceManager
+    return await VirtualServiceManager(token, ctx).read(workspace_id, vs_id)
+
+
+async def list_all_http_transactions(token: BzmToken, ctx: Context, workspace_id: int,
+                                     service_id: Optional[int]) -> BaseResult:
+    from sv_mcp.tools.vs.http_transaction_manager import HttpTransactionManager
+    return await HttpTransactionManager(token, ctx).list_all(workspace_id, service_id)
@@ -0,0 +1,411 @@
+"""
+In-memory caches for BlazeMeter/VS API responses.
+"""
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sv_mcp.config.blazemeter import RESPONSE_CACHE_MAX_SIZE, WORKSPACES_ENDPOINT, VS_ENDPOINT, \
+    VS_TRANSACTIONS_ENDPOINT, VS_SERVICES_ENDPOINT, VS_CONFIGURATIONS_ENDPOINT, VS_TEMPLATE_ENDPOINT, \
+    CACHE_TTL_VIRTUAL_SERVICES, CACHE_TTL_TRANSACTIONS, CACHE_TTL_SERVICES, CACHE_TTL_CONFIGURATIONS, \
+    CACHE_TTL_TEMPLATES, CONSENT_CACHE_MAX_SIZE, CACHE_TTL_CONSENT_GRANTED, CACHE_TTL_CONSENT_DENIED, \
+    CACHE_TTL_WORKSPACES, TEMPLATE_CACHE_MAX_SIZE, SANDBOX_PLACEMENT_TTL, \
+    SANDBOX_PLACEMENT_MAX_SIZE, TEMPLATE_CACHE_SAVE_DELAY
+from sv_mcp.config.env import env_int, env_float
+from sv_mcp.config.token import BzmToken
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Dictionary with a time to live per entry and least recently used eviction once max_size is reached.
+    Keeps hit/miss/eviction counters for observability.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        if self.max_size <= 0 or ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class CacheDependency:
+    """
+    Cached reads made stale by a mutating request whose endpoint matches `pattern`.
+    Placeholders ({ws}, {id}, ...) match one path segment, {action} matches the rest of the path.
+    When `write_through` is set, entities returned by the mutation are stored under that read
+    endpoint ({id} taken from each returned entity) instead of being fetched again.
+    """
+
+    def __init__(self, pattern: str, invalidates: List[str], write_through: Optional[str] = None,
+                 ttl: float = 0.0):
+        regex = re.sub(r"\{(\w+)}", lambda m: f"(?P<{m.group(1)}>{'.+' if m.group(1) == 'action' else '[^/]+'})",
+                       pattern)
+        self.pattern = re.compile(f"^{regex}$")
+        self.invalidates = invalidates
+        self.write_through = write_through
+        self.ttl = ttl
+
+
+def _entity_dependencies(collection: str, ttl: float) -> List[CacheDependency]:
+    collection_path = f"{WORKSPACES_ENDPOINT}/{{ws}}/{collection}"
+    entity_path = f"{collection_path}/{{id}}"
+    return [
+        CacheDependency(collection_path, [collection_path], write_through=entity_path, ttl=ttl),
+        CacheDependency(entity_path, [entity_path, collection_path], write_through=entity_path, ttl=ttl),
+        CacheDependency(f"{entity_path}/{{action}}", [entity_path, collection_path]),
+    ]
+
+
+# Mutations of VS entities (including GET actions such as deploy or stop) and the reads they affect,
+# e.g. deploy, assign_transactions or update of a virtual service evict the virtual service read
+# and the workspace virtual services list.
+CACHE_DEPENDENCIES: List[CacheDependency] = [
+    *_entity_dependencies(VS_ENDPOINT, CACHE_TTL_VIRTUAL_SERVICES),
+    *_entity_dependencies(VS_TRANSACTIONS_ENDPOINT, CACHE_TTL_TRANSACTIONS),
+    *_entity_dependencies(VS_SERVICES_ENDPOINT, CACHE_TTL_SERVICES),
+    *_entity_dependencies(VS_CONFIGURATIONS_ENDPOINT, CACHE_TTL_CONFIGURATIONS),
+    *_entity_dependencies(VS_TEMPLATE_ENDPOINT, CACHE_TTL_TEMPLATES),
+]
+
+
+class ResponseCache(TTLCache):
+    """
+    Cache of decoded API responses keyed on (base url, token id, method, endpoint, params).
+    Only used by call sites that opt in passing a cache_ttl to the api request helpers.
+    Mutations keep it fresh: the affected reads are refreshed from the mutation response
+    or evicted following CACHE_DEPENDENCIES.
+    """
+
+    def __init__(self, max_size: int, dependencies: Optional[List[CacheDependency]] = None):
+        super().__init__(max_size)
+        self.dependencies = CACHE_DEPENDENCIES if dependencies is None else dependencies
+
+    @staticmethod
+    def key(base_url: str, token: BzmToken, method: str, endpoint: str, params: Optional[dict] = None) -> tuple:
+        normalized_params = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return base_url, token.id, method.upper(), "/" + endpoint.strip("/"), normalized_params
+
+    def invalidate_endpoints(self, base_url: str, token: BzmToken, endpoints: List[str]) -> int:
+        """
+        Drop the cached reads of the given endpoints, whatever their query parameters.
+        """
+        endpoints = {"/" + endpoint.strip("/") for endpoint in endpoints}
+        return self.invalidate_where(lambda key: key[0] == base_url and key[1] == token.id and key[3] in endpoints)
+
+    def invalidate_entity(self, token: BzmToken, collection: str, entity_id: Any) -> int:
+        """
+        Drop the cached read of an entity and the lists of its collection in any workspace, for changes
+        not made through a request of this process (e.g. a virtual service finishing its deployment).
+        """
+        entity_suffix = f"/{collection}/{entity_id}"
+        collection_suffix = f"/{collection}"
+        return self.invalidate_where(
+            lambda key: key[1] == token.id and (key[3].endswith(entity_suffix) or key[3].endswith(collection_suffix))
+        )
+
+    def invalidate_mutation(self, base_url: str, token: BzmToken, method: str, endpoint: str) -> int:
+        """
+        Drop every cached read under the collection touched by a mutating request: a POST on
+        /workspaces/1/services evicts that collection, a PUT on /workspaces/1/services/2 evicts
+        /workspaces/1/services and everything below it.
+        """
+        collection = "/" + endpoint.strip("/")
+        if method.upper() != "POST" and collection.count("/") > 1:
+            collection = collection.rsplit("/", 1)[0]
+        return self.invalidate_where(
+            lambda key: key[0] == base_url and key[1] == token.id
+                        and (key[3] == collection or key[3].startswith(collection + "/"))
+        )
+
+    def on_mutation(self, base_url: str, token: BzmToken, method: str, endpoint: str, data: dict) -> None:
+        """
+        Keep cached reads consistent with a successful mutating request and its response data.
+        """
+        endpoint = "/" + endpoint.strip("/")
+        for dependency in self.dependencies:
+            match = dependency.pattern.match(endpoint)
+            if not match:
+                continue
+            placeholders = match.groupdict()
+            self.invalidate_endpoints(base_url, token, [t.format(**placeholders) for t in dependency.invalidates])
+            if dependency.write_through and method.upper() != "GET" and not data.get("error"):
+                result = data.get("result")
+                for entity in result if isinstance(result, list) else [result]:
+                    if isinstance(entity, dict) and entity.get("id") is not None:
+                        read_endpoint = dependency.write_through.format(**{**placeholders, "id": entity["id"]})
+                        self.set(self.key(base_url, token, "GET", read_endpoint), {"result": entity},
+                                 dependency.ttl)
+            return
+        self.invalidate_mutation(base_url, token, method, endpoint)
+
+
+response_cache = ResponseCache(env_int("RESPONSE_CACHE_MAX_SIZE", RESPONSE_CACHE_MAX_SIZE, minimum=0))
+
+
+class ConsentCache:
+    """
+    AI consent per account and the account each workspace belongs to, keyed by token id so every
+    session using the same API key shares them. Denied consents expire sooner than granted ones.
+    """
+
+    def __init__(self, max_size: int, granted_ttl: float, denied_ttl: float, workspace_ttl: float):
+        self.consents = TTLCache(max_size)
+        self.workspace_accounts = TTLCache(max_size)
+        self.granted_ttl = granted_ttl
+        self.denied_ttl = denied_ttl
+        self.workspace_ttl = workspace_ttl
+
+    def get_consent(self, token: BzmToken, account_id: int) -> Optional[bool]:
+        return self.consents.get((token.id, account_id))
+
+    def set_consent(self, token: BzmToken, account_id: int, consent: bool) -> None:
+        self.consents.set((token.id, account_id), consent, self.granted_ttl if consent else self.denied_ttl)
+
+    def get_workspace_account(self, token: BzmToken, workspace_id: int) -> Optional[int]:
+        return self.workspace_accounts.get((token.id, workspace_id))
+
+    def set_workspace_account(self, token: BzmToken, workspace_id: int, account_id: int) -> None:
+        self.workspace_accounts.set((token.id, workspace_id), account_id, self.workspace_ttl)
+
+    def clear(self) -> None:
+        self.consents.clear()
+        self.workspace_accounts.clear()
+
+
+consent_cache = ConsentCache(
+    env_int("CONSENT_CACHE_MAX_SIZE", CONSENT_CACHE_MAX_SIZE, minimum=0),
+    env_float("CACHE_TTL_CONSENT_GRANTED", CACHE_TTL_CONSENT_GRANTED),
+    env_float("CACHE_TTL_CONSENT_DENIED", CACHE_TTL_CONSENT_DENIED),
+    CACHE_TTL_WORKSPACES,
+)
+
+
+class SandboxPlacementCache:
+    """
+    The transaction each API key last placed in its sandbox, so placing it again can be skipped. The sandbox holds
+    one transaction at a time, so entries are keyed by (token id, workspace id, transaction id) with one entry per
+    token. Every transaction has a generation, increased when it is updated, so a placement requested before an
+    update can't be remembered after it.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.placements = TTLCache(max_size)
+        self.ttl = ttl
+        self.generations: Dict[int, int] = {}
+
+    def get(self, token: BzmToken, workspace_id: int, transaction_id: int) -> Any:
+        return self.placements.get((token.id, workspace_id, transaction_id))
+
+    def generation(self, transaction_id: int) -> int:
+        return self.generations.get(transaction_id, 0)
+
+    def set(self, token: BzmToken, workspace_id: int, transaction_id: int, sandbox: Any,
+            generation: Optional[int] = None) -> None:
+        """
+        Remember the placement, replacing the previous one of the token, unless the transaction was updated since
+        the given generation was read.
+        """
+        self.forget(token)
+        if generation is None or generation == self.generation(transaction_id):
+            self.placements.set((token.id, workspace_id, transaction_id), sandbox, self.ttl)
+
+    def forget(self, token: BzmToken) -> None:
+        self.placements.invalidate_where(lambda key: key[0] == token.id)
+
+    def invalidate_transaction(self, transaction_id: int) -> int:
+        """
+        Forget every placement of a transaction, whatever the API key: its sandbox copy is outdated.
+        """
+        self.generations[transaction_id] = self.generation(transaction_id) + 1
+        return self.placements.invalidate_where(lambda key: key[2] == transaction_id)
+
+    def clear(self) -> None:
+        self.placements.clear()
+        self.generations.clear()
+
+
+sandbox_placements = SandboxPlacementCache(
+    SANDBOX_PLACEMENT_MAX_SIZE,
+    env_float("SANDBOX_PLACEMENT_TTL", SANDBOX_PLACEMENT_TTL),
+)
+
+
+class TemplateCache:
+    """
+    Results of handlebars template validations and conversions, keyed by the SHA-256 of the endpoint,
+    its parameters and the template. They don't expire, the least recently used one is evicted once
+    max_size is reached. When a path is given, entries are loaded from it on first use and written
+    back after a change: inside an event loop the changes of the next save_delay seconds are written
+    together by a worker thread, otherwise right away. flush() writes pending changes immediately.
+    """
+
+    def __init__(self, max_size: int, path: Optional[str] = None, save_delay: float = TEMPLATE_CACHE_SAVE_DELAY):
+        self.max_size = max_size
+        self.path = path
+        self.save_delay = save_delay
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._loaded = not path
+        # Changes made since the last snapshot written, and the loop a write is scheduled on
+        self._version = 0
+        self._written_version = 0
+        self._scheduled_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._write_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(endpoint: str, template: str, params: Optional[dict] = None) -> str:
+        normalized_params = json.dumps(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        digest = hashlib.sha256()
+        for part in (endpoint, normalized_params, template):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Any:
+        self._load()
+        value = self._entries.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        self._load()
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        self._save()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, "r", encoding="utf-8") as cache_file:
+                entries = json.load(cache_file)
+        except (OSError, ValueError):
+            return
+        if not isinstance(entries, list) or self.max_size <= 0:
+            return
+        for entry in entries[-self.max_size:]:
+            if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], str):
+                self._entries[entry[0]] = entry[1]
+
+    def flush(self) -> None:
+        """
+        Write the pending changes to the file now.
+        """
+        if self.path and self._written_version < self._version:
+            self._write(list(self._entries.items()), self._version)
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        self._version += 1
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        if self._scheduled_loop is not loop:
+            self._scheduled_loop = loop
+            loop.call_later(self.save_delay, self._save_in_background, loop)
+
+    def _save_in_background(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._scheduled_loop is loop:
+            self._scheduled_loop = None
+        # The snapshot is taken in the loop so it is consistent, serializing it happens in a worker thread
+        if self._written_version < self._version:
+            loop.run_in_executor(None, self._write, list(self._entries.items()), self._version)
+
+    def _write(self, entries: List[Tuple[str, Any]], version: int) -> None:
+        with self._write_lock:
+            if version <= self._written_version:
+                # A newer snapshot was written already
+                return
+            temporary_path = f"{self.path}.tmp"
+            try:
+                with open(temporary_path, "w", encoding="utf-8") as cache_file:
+                    json.dump(entries, cache_file)
+                os.replace(temporary_path, self.path)
+            except OSError:
+                # The cache keeps working in memory when the file can't be written
+                return
+            self._written_version = version
+
+template_cache = TemplateCache(
+    env_int("TEMPLATE_CACHE_MAX_SIZE", TEMPLATE_CACHE_MAX_SIZE, minimum=0),
+    os.getenv("TEMPLATE_CACHE_PATH") or None,
+    env_float("TEMPLATE_CACHE_SAVE_DELAY", TEMPLATE_CACHE_SAVE_DELAY),
+)
+atexit.register(template_cache.flush)
@@ -5,7 +5,7 @@ import httpx
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
-from sv_mcp.config.blazemeter import TOOLS_PREFIX, USER_ENDPOINT
+from sv_mcp.config.blazemeter import TOOLS_PREFIX, USER_ENDPOINT, CACHE_TTL_USER
 from sv_mcp.config.token import BzmToken
 from sv_mcp.formatters.user import format_users
 from sv_mcp.models.result import BaseResult
@@ -23,7 +23,8 @@ class UserManager:
             self.token,
             "GET",
             f"{USER_ENDPOINT}",
-            result_formatter=format_users
+            result_formatter=format_users,
+            cache_ttl=CACHE_TTL_USER
         )
 
 
@@ -1,17 +1,29 @@
 """
 Simple utilities for BlazeMeter MCP tools.
 """
+import asyncio
+import copy
 import os
 import platform
-from datetime import datetime
-from typing import Optional, Callable
+import random
+import sys
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from collections import deque
+from typing import Optional, Callable, Dict, Any, Awaitable, Hashable, Tuple, Union, AsyncIterator, List
 
 import httpx
 
-from sv_mcp.config.blazemeter import BZM_API_BASE_URL, VS_API_BASE_URL
+from sv_mcp.config.blazemeter import BZM_API_BASE_URL, VS_API_BASE_URL, HTTP_MAX_CONNECTIONS, \
+    HTTP_MAX_KEEPALIVE_CONNECTIONS, HTTP_KEEPALIVE_EXPIRY, API_MAX_RETRIES, API_RETRY_BASE_DELAY, \
+    API_RETRY_MAX_DELAY, API_RETRY_BUDGET_RATIO, API_RETRY_BUDGET_RESERVE, LIST_ALL_PAGE_SIZE, \
+    LIST_ALL_CONCURRENCY, LIST_ALL_MAX_ITEMS
+from sv_mcp.config.env import env_int, env_float
 from sv_mcp.config.token import BzmToken
 from sv_mcp.config.version import __version__
 from sv_mcp.models.result import BaseResult
+from sv_mcp.tools.cache import response_cache
 
 # Collect system info once
 ua_part = f"{platform.system()} {platform.release()}; {platform.machine()}"
@@ -22,51 +34,360 @@ def _build_headers(token: BzmToken, extra_headers: Optional[dict] = None) -> dic
     headers["User-Agent"] = f"sv-mcp/{__version__} ({ua_part})"
     return headers
 
+
+class ApiClientPool:
+    """
+    Process-wide HTTP/2 clients, one per API base URL, so every tool call reuses
+    the already negotiated (and multiplexed) connections instead of opening new ones.
+    Clients are created lazily; the server lifespan closes them once the last session ends.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._sessions = 0
+        self._pending_close: Optional[asyncio.TimerHandle] = None
+
+    @staticmethod
+    def _build_limits() -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=env_int("HTTP_MAX_CONNECTIONS", HTTP_MAX_CONNECTIONS),
+            max_keepalive_connections=env_int("HTTP_MAX_KEEPALIVE_CONNECTIONS", HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                                              minimum=0),
+            keepalive_expiry=env_float("HTTP_KEEPALIVE_EXPIRY", HTTP_KEEPALIVE_EXPIRY),
+        )
+
+    def get(self, base_url: str) -> httpx.AsyncClient:
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                http2=True,
+                timeout=httpx.Timeout(connect=15.0, read=60.0, write=15.0, pool=60.0),
+                limits=self._build_limits(),
+            )
+            self._clients[base_url] = client
+        return client
+
+    async def aclose(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
+
+    async def _close_if_idle(self) -> None:
+        self._pending_close = None
+        if self._sessions == 0:
+            await self.aclose()
+
+    def lifespan(self, idle_close_delay: float = 0.0) -> Callable:
+        """
+        Build a FastMCP lifespan bound to this pool.
+        The lifespan runs once per MCP session, so sessions are reference counted and the clients
+        are only closed when no session is left. In HTTP modes a delay keeps the connections warm
+        between short-lived (e.g. stateless) sessions.
+        """
+
+        @asynccontextmanager
+        async def _lifespan(server):
+            self._sessions += 1
+            if self._pending_close is not None:
+                self._pending_close.cancel()
+                self._pending_close = None
+            try:
+                yield self
+            finally:
+                self._sessions -= 1
+                if self._sessions == 0:
+                    if idle_close_delay > 0:
+                        loop = asyncio.get_running_loop()
+                        self._pending_close = loop.call_later(
+                            idle_close_delay, lambda: loop.create_task(self._close_if_idle())
+                        )
+                    else:
+                        await self.aclose()
+
+        return _lifespan
+
+
+api_clients = ApiClientPool()
+
+
+# GET endpoints of the VS API that trigger an action instead of reading data
+SIDE_EFFECT_ACTIONS = ("/deploy", "/stop", "/configure")
+
+
+def is_mutation(method: str, endpoint: str) -> bool:
+    return method.upper() != "GET" or endpoint.rstrip("/").endswith(SIDE_EFFECT_ACTIONS)
+
+
+class RetryBudget:
+    """
+    Token bucket shared by all requests of the process. Every first attempt deposits `ratio` tokens
+    and every retry withdraws one, so retries stay a bounded fraction of the traffic and a degraded
+    upstream does not get a retry storm from us. `reserve` is the burst allowed on a cold start.
+    """
+
+    def __init__(self, ratio: float, reserve: float):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = reserve
+
+    def deposit(self) -> None:
+        self._balance = min(self.reserve, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self._balance < 1:
+            return False
+        self._balance -= 1
+        return True
+
+
+class RetryPolicy:
+    """
+    Retry rules for the BlazeMeter/VS API.
+    - Throttling (429), gateway errors (502, 503, 504) and transport errors are retried.
+    - GET/PUT/PATCH/DELETE are retried; POST (and GET actions with side effects such as deploy)
+      only when the caller supplies an idempotency key. Connection failures are always retried,
+      as the request never reached the server.
+    - Exponential backoff with full jitter, honoring Retry-After when the server sends it.
+    """
+
+    RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"}
+    NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+    def __init__(self, max_retries: int, base_delay: float, max_delay: float, budget: RetryBudget):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        return cls(
+            max_retries=env_int("API_MAX_RETRIES", API_MAX_RETRIES, minimum=0),
+            base_delay=env_float("API_RETRY_BASE_DELAY", API_RETRY_BASE_DELAY),
+            max_delay=env_float("API_RETRY_MAX_DELAY", API_RETRY_MAX_DELAY),
+            budget=RetryBudget(
+                ratio=env_float("API_RETRY_BUDGET_RATIO", API_RETRY_BUDGET_RATIO),
+                reserve=env_float("API_RETRY_BUDGET_RESERVE", API_RETRY_BUDGET_RESERVE),
+            ),
+        )
+
+    def is_idempotent(self, method: str, endpoint: str, idempotency_key: Optional[str]) -> bool:
+        if idempotency_key:
+            return True
+        method = method.upper()
+        if method not in self.IDEMPOTENT_METHODS:
+            return False
+        # GET actions such as deploy are not safe to repeat
+        return method != "GET" or not is_mutation(method, endpoint)
+
+    def should_retry(self, attempt: int, idempotent: bool, error: httpx.HTTPError) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        if isinstance(error, httpx.HTTPStatusError):
+            retryable = error.response.status_code in self.RETRYABLE_STATUS_CODES and idempotent
+        elif isinstance(error, self.NOT_SENT_ERRORS):
+            retryable = True
+        else:
+            retryable = isinstance(error, httpx.TransportError) and idempotent
+        return retryable and self.budget.withdraw()
+
+    def backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> Optional[float]:
+        """
+        Delay before the next attempt, or None if the server asked us to wait longer than max_delay.
+        """
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value, given either in seconds or as an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+api_retry_policy = RetryPolicy.from_env()
+
+
+async def _send(client: httpx.AsyncClient, method: str, endpoint: str, idempotent: bool,
+                **kwargs) -> httpx.Response:
+    """
+    Send the request applying the retry policy. Raises the last error once retries are exhausted.
+    """
+    api_retry_policy.budget.deposit()
+    attempt = 0
+    while True:
+        response = None
+        try:
+            response = await client.request(method, endpoint, **kwargs)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            if not api_retry_policy.should_retry(attempt, idempotent, e):
+                raise
+            delay = api_retry_policy.backoff(attempt, response)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls: while a call for a key is in flight, later callers with the
+    same key await its outcome instead of starting their own. The shared call runs in its own task, so
+    a cancelled caller doesn't cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.collapsed = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Returns the outcome of fn and whether it was shared with a call already in flight.
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+        if shared:
+            self.collapsed += 1
+        else:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._calls),
+            "calls": self.calls,
+            "collapsed": self.collapsed,
+        }
+
+
+api_in_flight = SingleFlight()
+
+
+def _error_message(response: httpx.Response) -> str:
+    try:
+        error = response.json().get("error")
+    except ValueError:
+        error = None
+    return str(error) if error else f"{response.status_code} {response.reason_phrase}"
+
+
+async def _fetch(base_url: str, token: BzmToken, method: str, endpoint: str, idempotency_key: Optional[str],
+                 **kwargs) -> Union[dict, BaseResult]:
+    """
+    Send the request and decode its JSON body, or return a BaseResult with the error.
+    """
+    headers = _build_headers(token, kwargs.pop("headers", {}))
+    if idempotency_key:
+        headers["Idempotency-Key"] = idempotency_key
+    client = api_clients.get(base_url)
+    idempotent = api_retry_policy.is_idempotent(method, endpoint, idempotency_key)
+
+    try:
+        resp = await _send(client, method, endpoint, idempotent, headers=headers, **kwargs)
+        return resp.json()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code in (401, 403):
+            return BaseResult(error="Invalid credentials")
+        return BaseResult(error=_error_message(e.response))
+    except httpx.HTTPError as e:
+        return BaseResult(error=f"Request to {endpoint} failed: {type(e).__name__}: {e}")
+
+
 async def _api_request(base_url: str,
                        token: Optional[BzmToken],
                        method: str,
                        endpoint: str,
                        result_formatter: Optional[Callable] = None,
                        result_formatter_params: Optional[dict] = None,
+                       idempotency_key: Optional[str] = None,
+                       cache_ttl: Optional[float] = None,
                        **kwargs) -> BaseResult:
     """
     Generalized API request for BlazeMeter/VS API with common logic.
+    Transient failures are retried following the api_retry_policy. POST requests are only retried
+    when an idempotency_key is given, which is sent to the API in the Idempotency-Key header.
+    GET requests with a cache_ttl (seconds) are served from the response cache while fresh, and
+    identical GET requests in flight at the same time are sent only once.
     """
     if not token:
         return BaseResult(
             error="No API token. Set API_KEY_PATH env var with file path or API_KEY_ID and API_KEY_SECRET secrets in docker catalog configuration."
         )
 
-    headers = _build_headers(token, kwargs.pop("headers", {}))
-    timeout = httpx.Timeout(connect=15.0, read=60.0, write=15.0, pool=60.0)
+    cache_key = None
+    if cache_ttl and method.upper() == "GET":
+        cache_key = response_cache.key(base_url, token, method, endpoint, kwargs.get("params"))
+    data = response_cache.get(cache_key) if cache_key else None
+    coalesce = method.upper() == "GET" and not is_mutation(method, endpoint) and not kwargs.get("headers")
 
-    async with httpx.AsyncClient(base_url=base_url, http2=True, timeout=timeout) as client:
-        try:
-            resp = await client.request(method, endpoint, headers=headers, **kwargs)
-            resp.raise_for_status()
-            data = resp.json()
-
-            result = data.get("result", [])
-            default_total = 0
-            if not isinstance(result, list):
-                result = [result]
-                default_total = 1
-
-            final_result = result_formatter(result, result_formatter_params) if result_formatter else result
-            total = data.get("total", default_total)
-            skip, limit = data.get("skip", 0), data.get("limit", 0)
-
-            return BaseResult(
-                result=final_result,
-                error=data.get("error"),
-                total=total,
-                has_more=(total - (skip + limit)) > 0
+    if data is None:
+        if coalesce:
+            # Identical GETs in flight at the same time (e.g. several sessions polling the same tracking)
+            # share a single upstream request
+            flight_key = cache_key or response_cache.key(base_url, token, method, endpoint, kwargs.get("params"))
+            data, _ = await api_in_flight.do(
+                flight_key,
+                lambda: _fetch(base_url, token, method, endpoint, idempotency_key, **kwargs)
             )
-        except httpx.HTTPError as e:
-            if e.response.status_code in (401, 403):
-                return BaseResult(error="Invalid credentials")
-            data = e.response.json()
-            return BaseResult(error=str(data.get("error")))
+        else:
+            data = await _fetch(base_url, token, method, endpoint, idempotency_key, **kwargs)
+        if isinstance(data, BaseResult):
+            # Callers add warnings and info to error results. Every caller of a coalesced request gets its own
+            # copy, the first one included: it resumes first and could change the result before the others copy it
+            return data.model_copy(deep=True) if coalesce else data
+
+        if is_mutation(method, endpoint):
+            response_cache.on_mutation(base_url, token, method, endpoint, data)
+        elif cache_key and not data.get("error"):
+            response_cache.set(cache_key, data, cache_ttl)
+
+    if (cache_key or coalesce) and not result_formatter:
+        # Raw results are handed to the caller, don't let it modify the cached or shared copy
+        data = copy.deepcopy(data)
+
+    result = data.get("result", [])
+    default_total = 0
+    if not isinstance(result, list):
+        result = [result]
+        default_total = 1
+
+    final_result = result_formatter(result, result_formatter_params) if result_formatter else result
+    total = data.get("total", default_total)
+    skip, limit = data.get("skip", 0), data.get("limit", 0)
+
+    return BaseResult(
+        result=final_result,
+        error=data.get("error"),
+        total=total,
+        has_more=(total - (skip + limit)) > 0
+    )
 
 # Thin wrappers
 async def bzm_api_request(token: Optional[BzmToken], method: str, endpoint: str,
@@ -83,5 +404,109 @@ async def vs_api_request(token: Optional[BzmToken], method: str, endpoint: str,
     return await _api_request(os.getenv('VS_URL', VS_API_BASE_URL), token, method, endpoint,
                               result_formatter, result_formatter_params, **kwargs)
 
+class PageError(Exception):
+    """
+    A page requested by iterate_pages returned an error.
+    """
+
+    def __init__(self, result: BaseResult):
+        super().__init__(result.error)
+        self.result = result
+
+
+async def iterate_pages(fetch_page: Callable[[int, int], Awaitable[BaseResult]],
+                        max_items: Optional[int] = None,
+                        page_size: Optional[int] = None,
+                        concurrency: Optional[int] = None) -> AsyncIterator[Any]:
+    """
+    Yield, in order, the items of a skip/limit paginated list. fetch_page(limit, offset) returns one page.
+    Once the first page reveals the total, the remaining pages are fetched concurrently keeping at most
+    `concurrency` requests in flight. Raises PageError when a page fails.
+    """
+    page_size = page_size or env_int("LIST_ALL_PAGE_SIZE", LIST_ALL_PAGE_SIZE)
+    concurrency = max(1, concurrency or env_int("LIST_ALL_CONCURRENCY", LIST_ALL_CONCURRENCY))
+    end = max_items if max_items is not None else sys.maxsize
+
+    first_page = await fetch_page(page_size, 0)
+    if first_page.error:
+        raise PageError(first_page)
+    items = first_page.result or []
+    for item in items[:end]:
+        yield item
+    if len(items) < page_size or len(items) >= end:
+        return
+
+    total = first_page.total or 0
+    if total <= len(items):
+        # Total not reported, walk the pages one after the other until a short one
+        offset = len(items)
+        while offset < end:
+            page = await fetch_page(page_size, offset)
+            if page.error:
+                raise PageError(page)
+            items = page.result or []
+            for item in items[:end - offset]:
+                yield item
+            offset += len(items)
+            if len(items) < page_size:
+                return
+        return
+
+    end = min(total, end)
+    offsets = iter(range(page_size, end, page_size))
+    pending: deque = deque()
+    try:
+        for offset in offsets:
+            pending.append((offset, asyncio.ensure_future(fetch_page(page_size, offset))))
+            if len(pending) >= concurrency:
+                break
+        while pending:
+            offset, task = pending.popleft()
+            page = await task
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append((next_offset, asyncio.ensure_future(fetch_page(page_size, next_offset))))
+            if page.error:
+                raise PageError(page)
+            for item in (page.result or [])[:end - offset]:
+                yield item
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+async def collect_pages(fetch_page: Callable[[int, int], Awaitable[BaseResult]],
+                        max_items: Optional[int] = None) -> BaseResult:
+    """
+    Gather the items of a paginated list in a single result, up to max_items (LIST_ALL_MAX_ITEMS by default).
+    has_more tells whether the list was cut at max_items. When a page fails the items read so far are
+    returned along with the error.
+    """
+    if max_items is None:
+        max_items = env_int("LIST_ALL_MAX_ITEMS", LIST_ALL_MAX_ITEMS)
+    items: List[Any] = []
+    total = 0
+
+    async def tracked_page(limit: int, offset: int) -> BaseResult:
+        nonlocal total
+        page = await fetch_page(limit, offset)
+        if offset == 0:
+            total = page.total or 0
+        return page
+
+    error = None
+    try:
+        async for item in iterate_pages(tracked_page, max_items=max_items):
+            items.append(item)
+    except PageError as e:
+        error = e.result.error
+    return BaseResult(
+        result=items,
+        error=error,
+        total=max(total, len(items)),
+        has_more=error is not None or total > len(items)
+    )
+
+
 def get_date_time_iso(timestamp: Optional[int]) -> Optional[str]:
     return datetime.fromtimestamp(timestamp).isoformat() if timestamp is not None else None
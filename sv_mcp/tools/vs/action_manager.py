@@ -18,6 +18,14 @@ class ActionManager:
         self.token = token
         self.ctx = ctx
 
+    async def list(self, workspace_id: int, transaction_id: int) -> BaseResult:
+        return await vs_api_request(
+            self.token,
+            "GET",
+            f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TRANSACTIONS_ENDPOINT}/{transaction_id}/{VS_ACTIONS_ENDPOINT}",
+            result_formatter=format_actions
+        )
+
     async def create_http_call(self, action_name: str, workspace_id: int, transaction_id: int,
                                action: WebAction) -> BaseResult:
         action_dict = action.model_dump() if isinstance(action, WebAction) else action
@@ -73,6 +81,10 @@ def register(mcp, token: Optional[BzmToken]) -> None:
         Operations on actions. 
         Use this when a user needs to create an action for transaction.
         Actions:
+        - list: List the actions of a transaction.
+            args(dict): Dictionary with the following required parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                transaction_id (int): Mandatory. The id of the transaction.
         - create_http_call: Creates an http call action for transaction. This action is executed synchronously.
             args(dict): Dictionary with the following required parameters:
                 action_name (str): Mandatory. The name of the action.
@@ -105,6 +117,8 @@ def register(mcp, token: Optional[BzmToken]) -> None:
         action_manager = ActionManager(token, ctx)
         try:
             match action:
+                case "list":
+                    return await action_manager.list(args["workspace_id"], args["transaction_id"])
                 case "create_http_call":
                     return await action_manager.create_http_call(args["action_name"], args["workspace_id"],
                                                                  args["transaction_id"], args["action"])
@@ -13,7 +13,7 @@ from sv_mcp.formatters.virtual_service import format_virtual_services_action
 from sv_mcp.models.result import BaseResult
 from sv_mcp.models.vs.asset import Asset
 from sv_mcp.models.vs.virtual_service import ActionResult
-from sv_mcp.tools.utils import vs_api_request
+from sv_mcp.tools.utils import vs_api_request, collect_pages
 
 
 class AssetManager:
@@ -44,6 +44,9 @@ class AssetManager:
             params=parameters
         )
 
+    async def list_all(self, workspace_id: int, max_items: Optional[int] = None) -> BaseResult:
+        return await collect_pages(lambda limit, offset: self.list(workspace_id, limit, offset), max_items)
+
     async def set_keystore_passwords(self, workspace_id: int, asset_id: int, keystore_password: str,
                                      key_passwords: Dict[str, str]) -> BaseResult:
         encoded_key_passwords = {}
@@ -116,6 +119,10 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 workspace_id (int): Mandatory. The id of the workspace to list services from.
                 limit (int, default=10, valid=[1 to 50]): The number of assets to list.
                 offset (int, default=0): Number of assets to skip.
+        - list_all: List all assets at once, reading every page.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace to list assets from.
+                max_items (int, default=1000): Maximum number of assets to return.
         - set_keystore_passwords: Sets keystore password for the keystore asset.
             args(dict): Dictionary with the following required parameters:
                 workspace_id (int): Mandatory. The id of the workspace to list asset from.
@@ -123,7 +130,7 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 keystore_password (str): Optional. The keystore password.
                 key_passwords (dict): Optional. The dictionary of key alias x password.
         - upload: Create a new asset from file.
-            Action result contains tracking id to track the create asset process. Use tracking tool to track it.
+            Action result contains tracking id to track the create asset process. Use the wait action of the tracking tool with asset set to true to wait for it.
             Creation of the asset is finished, when tracking status is 'FINISHED'. If creation fails, tracking status is 'FAILED'.
             args(dict): Dictionary with the following required parameters:
                 workspace_id (int): Mandatory. The id of the workspace to store the asset.
@@ -142,6 +149,8 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 case "list":
                     return await assert_manager.list(args["workspace_id"], args.get("limit", 50),
                                                      args.get("offset", 0))
+                case "list_all":
+                    return await assert_manager.list_all(args["workspace_id"], args.get("max_items"))
                 case "upload":
                     return await assert_manager.upload(args["workspace_id"], args['file_path'])
                 case "set_keystore_passwords":
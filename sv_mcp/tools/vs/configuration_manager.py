@@ -4,12 +4,13 @@ from typing import Optional, Dict, Any
 import httpx
 from mcp.server.fastmcp import Context
 
-from sv_mcp.config.blazemeter import VS_CONFIGURATIONS_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX
+from sv_mcp.config.blazemeter import VS_CONFIGURATIONS_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX, \
+    CACHE_TTL_CONFIGURATIONS
 from sv_mcp.config.token import BzmToken
 from sv_mcp.formatters.configuration import format_configurations
 from sv_mcp.models.result import BaseResult
 from sv_mcp.models.vs.configuration import Configuration
-from sv_mcp.tools.utils import vs_api_request
+from sv_mcp.tools.utils import vs_api_request, collect_pages
 
 
 class ConfigurationManager:
@@ -23,10 +24,11 @@ class ConfigurationManager:
             self.token,
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_CONFIGURATIONS_ENDPOINT}/{configuration_id}",
-            result_formatter=format_configurations
+            result_formatter=format_configurations,
+            cache_ttl=CACHE_TTL_CONFIGURATIONS
         )
 
-    async def list(self, workspace_id: int, limit: int = 50, offset: int = 0) -> BaseResult:
+    async def list(self, workspace_id: int, limit: int = 50, offset: int = 0, cached: bool = True) -> BaseResult:
         parameters = {
             "limit": limit,
             "skip": offset
@@ -37,9 +39,13 @@ class ConfigurationManager:
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_CONFIGURATIONS_ENDPOINT}",
             result_formatter=format_configurations,
-            params=parameters
+            params=parameters,
+            cache_ttl=CACHE_TTL_CONFIGURATIONS if cached else None
         )
 
+    async def list_all(self, workspace_id: int, max_items: Optional[int] = None) -> BaseResult:
+        return await collect_pages(lambda limit, offset: self.list(workspace_id, limit, offset), max_items)
+
     async def create(self, workspace_id: int, configuration_name: str, configuration_map: dict) -> BaseResult:
         transformed = {}
         if configuration_map:
@@ -90,6 +96,10 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 workspace_id (int): Mandatory. The id of the workspace to list configurations from.
                 limit (int, default=10, valid=[1 to 50]): The number of configurations to list.
                 offset (int, default=0): Number of configurations to skip.
+        - list_all: List all configurations at once, reading every page.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace to list configurations from.
+                max_items (int, default=1000): Maximum number of configurations to return.
         - create: Create a new configuration.
             args(dict): Dictionary with the following required parameters:
                 workspace_id (int): Mandatory. The ID of the workspace in which to create the configuration.
@@ -113,6 +123,8 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 case "list":
                     return await config_manager.list(args["workspace_id"], args.get("limit", 50),
                                                      args.get("offset", 0))
+                case "list_all":
+                    return await config_manager.list_all(args["workspace_id"], args.get("max_items"))
                 case "create":
                     return await config_manager.create(args["workspace_id"], args["configuration_name"],
                                                        args["configuration_map"])
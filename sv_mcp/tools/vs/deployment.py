@@ -0,0 +1,60 @@
+"""
+Deployment of a virtual service followed by the wait for its tracking, shared by the HTTP and messaging virtual
+service managers.
+"""
+from typing import Optional, Protocol
+
+from mcp.server.fastmcp import Context
+
+from sv_mcp.config.blazemeter import TRACKING_FINAL_STATUSES
+from sv_mcp.config.token import BzmToken
+from sv_mcp.models.result import BaseResult
+from sv_mcp.models.vs.virtual_service import DeploymentResult
+from sv_mcp.tools import bridge
+from sv_mcp.tools.vs.tracking_registry import tracking_registry
+
+
+class VirtualServiceDeployer(Protocol):
+    """
+    Manager of a kind of virtual services, able to deploy and read them.
+    """
+    token: Optional[BzmToken]
+    ctx: Context
+
+    async def deploy(self, workspace_id: int, vs_id: int) -> BaseResult:
+        ...
+
+    async def read(self, workspace_id: int, vs_id: int) -> BaseResult:
+        ...
+
+
+async def deploy_and_wait(vs_manager: VirtualServiceDeployer, workspace_id: int, vs_id: int,
+                          timeout: Optional[float] = None) -> BaseResult:
+    """
+    Deploy a virtual service with the manager of its kind and wait for the deployment. Once it finishes, the
+    virtual service is read again with its endpoints and returned with the time spent in every stage.
+    """
+    deploy_result = await vs_manager.deploy(workspace_id, vs_id)
+    if deploy_result.error:
+        return deploy_result
+    tracking_id = deploy_result.result[0].tracking_id
+    tracking_result = await bridge.wait_tracking(vs_manager.token, vs_manager.ctx, tracking_id, timeout)
+    if tracking_result.error or tracking_result.result[0].status not in TRACKING_FINAL_STATUSES:
+        # Failed to read the tracking or still deploying after the timeout
+        return tracking_result
+    tracking = tracking_result.result[0]
+    vs_result = await vs_manager.read(workspace_id, vs_id)
+    if vs_result.error:
+        return vs_result
+    deployment = DeploymentResult(
+        virtualService=vs_result.result[0],
+        trackingId=tracking_id,
+        status=tracking.status,
+        errors=tracking.errors,
+        warnings=tracking.warnings,
+        stageTimings=tracking_registry.stage_timings(vs_manager.token, tracking_id)
+    )
+    return BaseResult(
+        result=[deployment],
+        error=f"Deployment of virtual service {vs_id} failed: {tracking.errors}" if tracking.status != "FINISHED" else None
+    )
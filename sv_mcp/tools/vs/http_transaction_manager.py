@@ -1,20 +1,37 @@
+import asyncio
 import base64
+import copy
+import os
+import time
 import traceback
-from typing import Optional, Dict, Any, Annotated
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Annotated, List
 
 import httpx
 from mcp.server.fastmcp import Context
 
 from sv_mcp.config.blazemeter import VS_TRANSACTIONS_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX, \
     VS_VALIDATIONS_ENDPOINT, \
-    VS_CONVERT_ENDPOINT
+    VS_CONVERT_ENDPOINT, CACHE_TTL_TRANSACTIONS, CONVERTER_THREADS, ROUTE_ANALYSIS_MAX_TRANSACTIONS
+from sv_mcp.config.env import env_int
+from sv_mcp.analysis.matcher_cost import lint_transactions
+from sv_mcp.analysis.routes import analyze_routes
 from sv_mcp.config.token import BzmToken
+from sv_mcp.config.path_mapper import map_path
+from sv_mcp.converters.har import HarReader
+from sv_mcp.converters.openapi import OpenApiReader
+from sv_mcp.converters.wiremock import WireMockReader, write_mapping_file
 from sv_mcp.formatters.transaction import format_http_transactions
-from sv_mcp.formatters.validations import format_validation_request
 from sv_mcp.models.result import BaseResult
 from sv_mcp.models.vs.generic_dsl import GenericDsl
 from sv_mcp.models.vs.http_transaction import HttpTransaction
-from sv_mcp.tools.utils import vs_api_request
+from sv_mcp.models.vs.import_summary import ImportSummary, ExportSummary
+from sv_mcp.tools import bridge
+from sv_mcp.tools.cache import sandbox_placements
+from sv_mcp.tools.utils import vs_api_request, collect_pages, iterate_pages, PageError
+from sv_mcp.tools.vs.template_validation import template_request
+from sv_mcp.tools.vs.transaction_batch import create_transaction_batches, create_transaction_stream, \
+    StreamUploadResult
 
 
 class HttpTransactionManager:
@@ -28,10 +45,12 @@ class HttpTransactionManager:
             self.token,
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TRANSACTIONS_ENDPOINT}/{transaction_id}",
-            result_formatter=format_http_transactions
+            result_formatter=format_http_transactions,
+            cache_ttl=CACHE_TTL_TRANSACTIONS
         )
 
-    async def list(self, workspace_id: int, service_id: int, limit: int = 50, offset: int = 0) -> BaseResult:
+    async def list(self, workspace_id: int, service_id: int,
+                   limit: int = 50, offset: int = 0, cached: bool = True) -> BaseResult:
         parameters = {
             "limit": limit,
             "skip": offset,
@@ -44,12 +63,105 @@ class HttpTransactionManager:
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TRANSACTIONS_ENDPOINT}",
             result_formatter=format_http_transactions,
-            params=parameters)
+            params=parameters,
+            cache_ttl=CACHE_TTL_TRANSACTIONS if cached else None)
 
-    async def create(self, transaction_name: str, workspace_id: int, service_id,
-                     dsl: GenericDsl, delay: int) -> BaseResult:
+    async def list_all(self, workspace_id: int, service_id: Optional[int], max_items: Optional[int] = None) -> BaseResult:
+        return await collect_pages(lambda limit, offset: self.list(workspace_id, service_id, limit, offset),
+                                   max_items)
+
+    async def analyze_overlaps(self, workspace_id: int, service_id: Optional[int],
+                               vs_id: Optional[int] = None) -> BaseResult:
+        """
+        Report duplicate, shadowed and ambiguous transactions of a service, with the priorities of a virtual
+        service when given (only its transactions are analyzed then).
+        """
+        priorities = None
+        if vs_id is not None:
+            virtual_service = await bridge.read_virtual_service(self.token, self.ctx, workspace_id, vs_id)
+            if virtual_service.error:
+                return virtual_service
+            service_id = virtual_service.result[0].serviceId
+            priorities = {t.txnId: t.priority for t in virtual_service.result[0].mockServiceTransactions or []}
+        elif service_id is None:
+            return BaseResult(error="Either serviceId or virtual_service_id is required")
+
+        max_transactions = env_int("ROUTE_ANALYSIS_MAX_TRANSACTIONS", ROUTE_ANALYSIS_MAX_TRANSACTIONS)
+        transactions = await self.list_all(workspace_id, service_id, max_transactions)
+        if transactions.error:
+            return transactions
+        if priorities is None:
+            candidates = [(transaction, None) for transaction in transactions.result]
+        else:
+            candidates = [(transaction, priorities[transaction.id]) for transaction in transactions.result
+                          if transaction.id in priorities]
+
+        findings = await asyncio.to_thread(analyze_routes, candidates)
+        counts = {kind: sum(finding.kind == kind for finding in findings)
+                  for kind in ("duplicate", "shadowed", "ambiguous")}
+        result = BaseResult(result=findings, total=len(findings))
+        result.append_info([f"{len(candidates)} transactions analyzed: " +
+                            ", ".join(f"{count} {kind}" for kind, count in counts.items())])
+        if transactions.has_more:
+            result.append_warnings(["Not every transaction of the service was read, raise "
+                                    "ROUTE_ANALYSIS_MAX_TRANSACTIONS to analyze them all"])
+        if priorities is None:
+            result.append_warnings(["Without a virtual service every transaction has the default priority"])
+        return result
+
+    async def lint(self, workspace_id: int, transaction_id: Optional[int] = None, service_id: Optional[int] = None,
+                   vs_id: Optional[int] = None) -> BaseResult:
+        """
+        Report the costly, ReDoS prone or replaceable matchers of a transaction, the transactions of a service, or
+        the transactions of a virtual service.
+        """
+        max_transactions = env_int("ROUTE_ANALYSIS_MAX_TRANSACTIONS", ROUTE_ANALYSIS_MAX_TRANSACTIONS)
+        has_more = False
+        if transaction_id is not None:
+            transactions = await self.read(workspace_id, transaction_id)
+            if transactions.error:
+                return transactions
+            candidates = transactions.result
+        elif vs_id is not None:
+            virtual_service = await bridge.read_virtual_service(self.token, self.ctx, workspace_id, vs_id)
+            if virtual_service.error:
+                return virtual_service
+            ids = {t.txnId for t in virtual_service.result[0].mockServiceTransactions or []}
+            transactions = await self.list_all(workspace_id, virtual_service.result[0].serviceId, max_transactions)
+            if transactions.error:
+                return transactions
+            candidates = [transaction for transaction in transactions.result if transaction.id in ids]
+            has_more = transactions.has_more
+        elif service_id is not None:
+            transactions = await self.list_all(workspace_id, service_id, max_transactions)
+            if transactions.error:
+                return transactions
+            candidates = transactions.result
+            has_more = transactions.has_more
+        else:
+            return BaseResult(error="One of id, serviceId or virtual_service_id is required")
+
+        lints = await asyncio.to_thread(lint_transactions, candidates)
+        counts = {severity: sum(lint.severity == severity for lint in lints)
+                  for severity in ("error", "warning", "info")}
+        result = BaseResult(result=lints, total=len(lints))
+        result.append_info([f"{len(candidates)} transactions linted: " +
+                            ", ".join(f"{count} {severity}" for severity, count in counts.items())])
+        if counts["error"]:
+            result.append_warnings(["Fix the matchers with errors before deploying: invalid patterns fail to match "
+                                    "and catastrophic backtracking can stall the virtual service under load"])
+        if has_more:
+            result.append_warnings(["Not every transaction of the service was read, raise "
+                                    "ROUTE_ANALYSIS_MAX_TRANSACTIONS to lint them all"])
+        return result
+
+    @staticmethod
+    def prepare_dsl(dsl: GenericDsl, delay: Optional[int]) -> dict:
+        """
+        DSL as sent to the API: URL matcher key set, body matchers encoded to Base64 and the delay applied.
+        """
         # Convert GenericDsl to dict for JSON serialization
-        dsl_dict = dsl.model_dump() if isinstance(dsl, GenericDsl) else dsl
+        dsl_dict = dsl.model_dump() if isinstance(dsl, GenericDsl) else copy.deepcopy(dsl)
         request = dsl_dict.get("requestDsl")
         if request:
             if request.get("url") is not None:
@@ -66,6 +178,11 @@ class HttpTransactionManager:
                     "type": "FIXED",
                     "duration": delay
                 }
+        return dsl_dict
+
+    async def create(self, transaction_name: str, workspace_id: int, service_id,
+                     dsl: GenericDsl, delay: int) -> BaseResult:
+        dsl_dict = self.prepare_dsl(dsl, delay)
         transaction_body = {
             "transactions": [
                 {
@@ -90,37 +207,187 @@ class HttpTransactionManager:
 
     async def update(self, id: int, transaction_name: str, workspace_id: int,
                      dsl: GenericDsl, delay: int) -> BaseResult:
-        # Convert GenericDsl to dict for JSON serialization
-        dsl_dict = dsl.model_dump() if isinstance(dsl, GenericDsl) else dsl
-        request = dsl_dict.get("requestDsl")
-        if request:
-            if request.get("url") is not None:
-                request["url"]["key"] = "url"
-            body_list = request.get("body", [])
-            for body_matcher in body_list:
-                value = body_matcher.get("matchingValue")
-                if value is not None:
-                    body_matcher["matchingValue"] = HttpTransactionManager.to_base64(value)
-        if delay:
-            response = dsl_dict.get("responseDsl")
-            if response:
-                response["responseDelay"] = {
-                    "type": "FIXED",
-                    "duration": delay
-                }
+        dsl_dict = self.prepare_dsl(dsl, delay)
         transaction_body = {
             "id": id,
             "type": "HTTP",
             "dsl": dsl_dict,
             "name": transaction_name
         }
-        return await vs_api_request(
-            self.token,
-            "PUT",
-            f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TRANSACTIONS_ENDPOINT}/{id}",
-            result_formatter=format_http_transactions,
-            json=transaction_body
+        # A copy of the transaction placed in the sandbox would be outdated. It is forgotten again once the
+        # update is done, as a placement made while the request was in flight copied the old transaction.
+        sandbox_placements.invalidate_transaction(id)
+        try:
+            return await vs_api_request(
+                self.token,
+                "PUT",
+                f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TRANSACTIONS_ENDPOINT}/{id}",
+                result_formatter=format_http_transactions,
+                json=transaction_body
+            )
+        finally:
+            sandbox_placements.invalidate_transaction(id)
+
+    async def create_batch(self, workspace_id: int, service_id: Optional[int], transactions: List[Dict[str, Any]],
+                           batch_size: Optional[int] = None, prepared: bool = False) -> BaseResult:
+        """
+        Create many HTTP transactions with a few requests. Every item has name and dsl, and optionally delay
+        and serviceId (defaults to service_id). prepared tells the DSLs are already as returned by the API.
+        """
+        def prepare(item: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "serviceId": item.get("serviceId") or service_id,
+                "type": "HTTP",
+                "dsl": item["dsl"] if prepared else self.prepare_dsl(item["dsl"], item.get("delay")),
+                "name": item["name"],
+            }
+
+        return await create_transaction_batches(self.token, workspace_id, transactions, prepare,
+                                                format_http_transactions, batch_size)
+
+    async def import_har(self, workspace_id: int, service_id: int, path: str,
+                         batch_size: Optional[int] = None) -> BaseResult:
+        """
+        Create a transaction for every distinct request recorded in a HAR file. The file is read as the
+        transactions are uploaded, so its size doesn't matter.
+        """
+        started = time.monotonic()
+        try:
+            reader = HarReader(map_path(path))
+        except (OSError, ValueError) as e:
+            return BaseResult(error=f"Cannot read HAR file {path}: {e}")
+
+        async def report(upload: StreamUploadResult) -> None:
+            if self.ctx is not None:
+                await self.ctx.report_progress(
+                    reader.bytes_read, reader.size,
+                    f"{upload.created} transactions created, {reader.duplicates} duplicate requests skipped")
+
+        try:
+            upload = await create_transaction_stream(
+                lambda batch: self.create_batch(workspace_id, service_id, batch), reader, batch_size, report)
+        except ValueError as e:
+            return BaseResult(error=f"Invalid HAR file {path}: {e}")
+
+        return self._import_result(path, reader, upload, started)
+
+    async def import_openapi(self, workspace_id: int, service_id: int, path: str,
+                             batch_size: Optional[int] = None, all_responses: bool = False) -> BaseResult:
+        """
+        Create a transaction for every operation of an OpenAPI 3 document, answering its first success response.
+        With `all_responses`, for every response example of every operation.
+        """
+        started = time.monotonic()
+        try:
+            with open(map_path(path), "r", encoding="utf-8") as openapi_file:
+                reader = OpenApiReader(openapi_file.read(), all_responses)
+        except (OSError, ValueError) as e:
+            return BaseResult(error=f"Cannot read OpenAPI document {path}: {e}")
+
+        async def report(upload: StreamUploadResult) -> None:
+            if self.ctx is not None:
+                await self.ctx.report_progress(upload.created + upload.failed, None,
+                                               f"{upload.created} transactions created")
+
+        upload = await create_transaction_stream(
+            lambda batch: self.create_batch(workspace_id, service_id, batch), reader, batch_size, report)
+        result = self._import_result(path, reader, upload, started)
+        if reader.unreachable:
+            result.append_warnings([f"{reader.unreachable} transactions repeat the request of another response of "
+                                    f"their operation and are never matched"])
+        return result
+
+    async def import_wiremock(self, workspace_id: int, service_id: int, directory: str,
+                              batch_size: Optional[int] = None) -> BaseResult:
+        """
+        Create a transaction for every stub mapping of a WireMock directory (mappings/ and __files/).
+        """
+        started = time.monotonic()
+        try:
+            local_directory = map_path(directory)
+        except ValueError as e:
+            return BaseResult(error=str(e))
+        if not os.path.isdir(local_directory):
+            return BaseResult(error=f"{directory} is not a directory")
+        reader = WireMockReader(local_directory, env_int("CONVERTER_THREADS", CONVERTER_THREADS))
+
+        async def report(upload: StreamUploadResult) -> None:
+            if self.ctx is not None:
+                await self.ctx.report_progress(upload.created + upload.failed, None,
+                                               f"{upload.created} transactions created")
+
+        upload = await create_transaction_stream(
+            lambda batch: self.create_batch(workspace_id, service_id, batch), reader, batch_size, report)
+        return self._import_result(directory, reader, upload, started)
+
+    async def export_wiremock(self, workspace_id: int, service_id: Optional[int], directory: str) -> BaseResult:
+        """
+        Write the HTTP transactions of a service, or of the whole workspace, as WireMock stub mappings
+        to the mappings/ folder of a directory.
+        """
+        started = time.monotonic()
+        try:
+            mappings_directory = os.path.join(map_path(directory), "mappings")
+            os.makedirs(mappings_directory, exist_ok=True)
+        except (OSError, ValueError) as e:
+            return BaseResult(error=f"Cannot write to {directory}: {e}")
+
+        threads = env_int("CONVERTER_THREADS", CONVERTER_THREADS)
+        loop = asyncio.get_running_loop()
+        writes = set()
+        exported = 0
+        errors = []
+
+        def collect(done) -> None:
+            nonlocal exported
+            for write in done:
+                if write.exception():
+                    errors.append(str(write.exception()))
+                else:
+                    exported += 1
+
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="wiremock") as pool:
+            try:
+                async for transaction in iterate_pages(
+                        lambda limit, offset: self.list(workspace_id, service_id, limit, offset)):
+                    writes.add(loop.run_in_executor(pool, write_mapping_file, mappings_directory, transaction))
+                    if len(writes) >= threads * 4:
+                        done, writes = await asyncio.wait(writes, return_when=asyncio.FIRST_COMPLETED)
+                        collect(done)
+            except PageError as e:
+                errors.append(e.result.error)
+            if writes:
+                done, _ = await asyncio.wait(writes)
+                collect(done)
+
+        summary = ExportSummary(
+            destination=directory,
+            exported=exported,
+            failed=len(errors),
+            errors=errors[:20] or None,
+            elapsedSeconds=round(time.monotonic() - started, 3)
         )
+        result = BaseResult(result=[summary], total=exported)
+        if errors:
+            result.error = f"{len(errors)} transactions could not be exported"
+        return result
+
+    @staticmethod
+    def _import_result(path: str, reader: Any, upload: StreamUploadResult, started: float) -> BaseResult:
+        summary = ImportSummary(
+            source=path,
+            entries=reader.entries,
+            created=upload.created,
+            duplicates=getattr(reader, "duplicates", 0),
+            skipped=reader.skipped,
+            failed=upload.failed,
+            errors=(getattr(reader, "errors", []) + upload.errors) or None,
+            elapsedSeconds=round(time.monotonic() - started, 3)
+        )
+        result = BaseResult(result=[summary], total=upload.created)
+        if upload.failed:
+            result.error = f"{upload.failed} transactions failed to be created"
+        return result
 
     async def assign_asset(self, id: int, workspace_id: int, type: str, assetId: int, alias: str) -> BaseResult:
         assert_type_body = {
@@ -128,41 +395,26 @@ class HttpTransactionManager:
             "usageType": type,
             "alias": alias
         }
-        return await vs_api_request(
-            self.token,
-            "PATCH",
-            f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TRANSACTIONS_ENDPOINT}/{id}/assign-asset",
-            result_formatter=format_http_transactions,
-            json=assert_type_body
-        )
+        sandbox_placements.invalidate_transaction(id)
+        try:
+            return await vs_api_request(
+                self.token,
+                "PATCH",
+                f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TRANSACTIONS_ENDPOINT}/{id}/assign-asset",
+                result_formatter=format_http_transactions,
+                json=assert_type_body
+            )
+        finally:
+            sandbox_placements.invalidate_transaction(id)
 
     async def validate_template(self, template: str) -> BaseResult:
-        validation_body = {
-            "template": template,
-        }
-        return await vs_api_request(
-            self.token,
-            "POST",
-            f"{VS_VALIDATIONS_ENDPOINT}",
-            result_formatter=format_validation_request,
-            json=validation_body
-        )
+        return await template_request(self.token, VS_VALIDATIONS_ENDPOINT, template)
 
     async def convert_template(self, template: str, encode=True) -> BaseResult:
-        validation_body = {
-            "template": template,
-        }
         parameters = {
             "encode": encode
         }
-        return await vs_api_request(
-            self.token,
-            "POST",
-            f"{VS_CONVERT_ENDPOINT}",
-            result_formatter=format_validation_request,
-            json=validation_body,
-            params=parameters
-        )
+        return await template_request(self.token, VS_CONVERT_ENDPOINT, template, parameters)
 
     def to_base64(input_str: str) -> str:
         encoded_bytes = base64.b64encode(input_str.encode('utf-8'))
@@ -198,6 +450,26 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 virtual_service_id (int): Optional. The id of the virtual service to list transactions from. Without this it will list all transactions in the workspace.
                 limit (int, default=10, valid=[1 to 50]): The number of transactions to list.
                 offset (int, default=0): Number of transactions to skip.
+        - list_all: List all HTTP transactions at once, reading every page.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace to list HTTP transactions from.
+                serviceId (int): Optional. The id of the service to list transactions from.
+                max_items (int, default=1000): Maximum number of HTTP transactions to return.
+        - analyze_overlaps: Find duplicate, shadowed (never answered) and ambiguous transactions, whose URL, method and
+            other matchers overlap, with the priority deciding which one answers.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                serviceId (int): Optional. The id of the service to analyze. Required without virtual_service_id.
+                virtual_service_id (int): Optional. Analyze the transactions of this virtual service with their priorities.
+        - lint: Score the evaluation cost of the request matchers before deploying. Flags regular expressions prone to
+            catastrophic backtracking (ReDoS), invalid patterns and costly XML/JSON matchers, and suggests cheaper
+            equivalents (equals, equals_insensitive, contains) for literal patterns. Give one of id, serviceId or
+            virtual_service_id.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                id (int): Optional. The id of a transaction to lint.
+                serviceId (int): Optional. Lint every transaction of this service.
+                virtual_service_id (int): Optional. Lint the transactions of this virtual service.
         - validate_template: Validate template. Validates template used in transaction definition.
             args:
                 template (str): Mandatory. The handlebars template to validate.
@@ -214,6 +486,40 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 dsl (GenericDsl): Mandatory. The DSL definition of the transaction.
                 workspace_id (int): Mandatory. The id of the workspace.
                 delay (int): Optional. Response delay in milliseconds.
+        - create_batch: Create many HTTP transactions at once. Use it instead of create for more than a few transactions.
+            Returns the id or the error of every transaction, in the same order.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                serviceId (int): Optional. The id of the service of the transactions that don't set their own.
+                transactions (list): Mandatory. Transactions, each with name, dsl and optionally delay and serviceId.
+                batch_size (int, default=50): Optional. Number of transactions sent per request.
+        - import_har: Create transactions from the requests recorded in a HAR file. Repeated requests (same method,
+            path, query parameters and body) are created once.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                serviceId (int): Mandatory. The id of the service to create the transactions in.
+                path (str): Mandatory. Path of the HAR file on the server.
+                batch_size (int, default=50): Optional. Number of transactions sent per request.
+        - import_openapi: Create transactions from an OpenAPI 3 document (JSON or YAML), one for every operation
+            answering its first 2xx response. Paths with parameters use matches_url matchers, other paths equals_url.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                serviceId (int): Mandatory. The id of the service to create the transactions in.
+                path (str): Mandatory. Path of the OpenAPI document.
+                batch_size (int, default=50): Optional. Number of transactions sent per request.
+                all_responses (bool, default=False): Optional. Create a transaction for every response example too.
+                    They share the request of the operation, only the first one is ever matched.
+        - import_wiremock: Create transactions from the stub mappings of a WireMock directory (mappings/ and __files/).
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                serviceId (int): Mandatory. The id of the service to create the transactions in.
+                path (str): Mandatory. Path of the WireMock directory.
+                batch_size (int, default=50): Optional. Number of transactions sent per request.
+        - export_wiremock: Write HTTP transactions as WireMock stub mappings, one file per transaction in path/mappings.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                serviceId (int): Optional. The id of the service to export. Without it every HTTP transaction of the workspace is exported.
+                path (str): Mandatory. Path of the directory to write to.
         - update: Updates a certain transaction.
             Important: before using template in transaction definition validate it and  
             convert it first using validate_template and convert_template actions.
@@ -255,6 +561,25 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                         args.get("limit", 50),
                         args.get("offset", 0)
                     )
+                case "list_all":
+                    return await transaction_manager.list_all(
+                        args["workspace_id"],
+                        args.get("serviceId"),
+                        args.get("max_items"),
+                    )
+                case "analyze_overlaps":
+                    return await transaction_manager.analyze_overlaps(
+                        args["workspace_id"],
+                        args.get("serviceId"),
+                        args.get("virtual_service_id"),
+                    )
+                case "lint":
+                    return await transaction_manager.lint(
+                        args["workspace_id"],
+                        args.get("id"),
+                        args.get("serviceId"),
+                        args.get("virtual_service_id"),
+                    )
                 case "create":
                     return await transaction_manager.create(
                         args["name"],
@@ -263,6 +588,41 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                         args["dsl"],
                         args.get("delay", None),
                     )
+                case "create_batch":
+                    return await transaction_manager.create_batch(
+                        args["workspace_id"],
+                        args.get("serviceId"),
+                        args["transactions"],
+                        args.get("batch_size"),
+                    )
+                case "import_har":
+                    return await transaction_manager.import_har(
+                        args["workspace_id"],
+                        args["serviceId"],
+                        args["path"],
+                        args.get("batch_size"),
+                    )
+                case "import_openapi":
+                    return await transaction_manager.import_openapi(
+                        args["workspace_id"],
+                        args["serviceId"],
+                        args["path"],
+                        args.get("batch_size"),
+                        args.get("all_responses", False),
+                    )
+                case "import_wiremock":
+                    return await transaction_manager.import_wiremock(
+                        args["workspace_id"],
+                        args["serviceId"],
+                        args["path"],
+                        args.get("batch_size"),
+                    )
+                case "export_wiremock":
+                    return await transaction_manager.export_wiremock(
+                        args["workspace_id"],
+                        args.get("serviceId"),
+                        args["path"],
+                    )
                 case "update":
                     return await transaction_manager.update(
                         args["id"],
@@ -4,7 +4,7 @@ from typing import Optional, Dict, Any
 import httpx
 from mcp.server.fastmcp import Context
 
-from sv_mcp.config.blazemeter import VS_LOCATIONS_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX
+from sv_mcp.config.blazemeter import VS_LOCATIONS_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX, CACHE_TTL_LOCATIONS
 from sv_mcp.config.token import BzmToken
 from sv_mcp.formatters.location import format_locations
 from sv_mcp.models.result import BaseResult
@@ -29,7 +29,8 @@ class LocationManager:
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_LOCATIONS_ENDPOINT}",
             result_formatter=format_locations,
-            params=parameters
+            params=parameters,
+            cache_ttl=CACHE_TTL_LOCATIONS
         )
 
 def register(mcp, token: Optional[BzmToken]) -> None:
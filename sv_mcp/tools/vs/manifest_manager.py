@@ -0,0 +1,411 @@
+import asyncio
+import base64
+import copy
+import traceback
+from typing import Optional, Dict, Any, List, Tuple
+
+import httpx
+from mcp.server.fastmcp import Context
+
+from sv_mcp.config.blazemeter import VS_TOOLS_PREFIX, MANIFEST_APPLY_CONCURRENCY
+from sv_mcp.config.env import env_int
+from sv_mcp.config.path_mapper import map_path
+from sv_mcp.config.token import BzmToken
+from sv_mcp.converters.documents import parse_document
+from sv_mcp.models.result import BaseResult
+from sv_mcp.models.vs.manifest import Manifest, ManifestTransactionReference, ManifestTemplate, \
+    ManifestVirtualService, PlanStep
+from sv_mcp.tools.vs.configuration_manager import ConfigurationManager
+from sv_mcp.tools.vs.http_transaction_manager import HttpTransactionManager
+from sv_mcp.tools.vs.messaging_transaction_manager import MessagingTransactionManager
+from sv_mcp.tools.vs.service_manager import ServiceManager
+from sv_mcp.tools.vs.virtual_service_manager import VirtualServiceManager
+from sv_mcp.tools.vs.virtual_service_template_manager import VirtualServiceTemplateManager
+
+
+# Reference to an entity of the manifest that doesn't exist yet
+PENDING = object()
+
+
+class UnresolvedReference(Exception):
+    pass
+
+
+def load_manifest(manifest: Any = None, path: Optional[str] = None) -> Manifest:
+    """
+    Read a manifest given as an object, as JSON/YAML text or as the path of a JSON/YAML file.
+    """
+    if path:
+        with open(map_path(path), "r", encoding="utf-8") as manifest_file:
+            manifest = manifest_file.read()
+    if isinstance(manifest, str):
+        manifest = parse_document(manifest, "manifest")
+    if not isinstance(manifest, dict):
+        raise ValueError("Provide the manifest as an object, as JSON/YAML text or the path of a manifest file")
+    return Manifest(**manifest)
+
+
+def differs(desired: Any, current: Any) -> bool:
+    """
+    Whether the desired value is not contained in the current one. Only the keys set in the desired
+    dictionaries are compared, so fields filled in by the API don't show up as changes.
+    """
+    if isinstance(desired, dict):
+        if not isinstance(current, dict):
+            return True
+        return any(value is not None and differs(value, current.get(key)) for key, value in desired.items())
+    if isinstance(desired, list):
+        if not isinstance(current, list) or len(desired) != len(current):
+            return True
+        return any(differs(d, c) for d, c in zip(desired, current))
+    return desired != current
+
+
+def _decode_bodies(dsl: dict) -> dict:
+    dsl = copy.deepcopy(dsl)
+    for body_matcher in (dsl.get("requestDsl") or {}).get("body") or []:
+        value = body_matcher.get("matchingValue")
+        if isinstance(value, str):
+            try:
+                body_matcher["matchingValue"] = base64.b64decode(value, validate=True).decode("utf-8")
+            except ValueError:
+                pass
+    return dsl
+
+
+class _Step:
+
+    def __init__(self, kind: str, name: str, spec: Any, current: Any):
+        self.kind = kind
+        self.name = name
+        self.spec = spec
+        self.current = current
+        self.references: Dict[str, Any] = {}
+        self.result = PlanStep(kind=kind, name=name, action="create" if current is None else "unchanged",
+                               id=current.id if current is not None else None)
+
+
+class ManifestManager:
+
+    def __init__(self, token: Optional[BzmToken], ctx: Context):
+        self.token = token
+        self.ctx = ctx
+        self.services = ServiceManager(token, ctx)
+        self.configurations = ConfigurationManager(token, ctx)
+        self.http_transactions = HttpTransactionManager(token, ctx)
+        self.messaging_transactions = MessagingTransactionManager(token, ctx)
+        self.templates = VirtualServiceTemplateManager(token, ctx)
+        self.virtual_services = VirtualServiceManager(token, ctx)
+        # Current workspace entities by identity, and ids of the entities created while applying
+        self.state: Dict[str, Dict[Any, Any]] = {}
+        self.pending: set = set()
+        self.created: Dict[Tuple[str, str], int] = {}
+
+    async def plan(self, workspace_id: int, manifest: Manifest) -> BaseResult:
+        layers = await self._build_layers(workspace_id, manifest)
+        if isinstance(layers, BaseResult):
+            return layers
+        steps = [step for layer in layers for step in layer]
+        for step in steps:
+            self._diff(step, pending_allowed=True)
+        return self._result(steps, applied=False)
+
+    async def apply(self, workspace_id: int, manifest: Manifest) -> BaseResult:
+        layers = await self._build_layers(workspace_id, manifest)
+        if isinstance(layers, BaseResult):
+            return layers
+        steps = [step for layer in layers for step in layer]
+        semaphore = asyncio.Semaphore(env_int("MANIFEST_APPLY_CONCURRENCY", MANIFEST_APPLY_CONCURRENCY))
+        done = 0
+
+        async def run(step: _Step) -> None:
+            nonlocal done
+            self._diff(step, pending_allowed=False)
+            if step.result.action != "unchanged" and not step.result.error:
+                async with semaphore:
+                    await self._apply_step(workspace_id, step)
+            done += 1
+            if self.ctx is not None:
+                await self.ctx.report_progress(done, len(steps), f"{step.result.action} {step.kind} {step.name}")
+
+        # Layers depend on the previous ones, entities inside a layer are independent of each other
+        for layer in layers:
+            await asyncio.gather(*(run(step) for step in layer))
+        return self._result(steps, applied=True)
+
+    async def _build_layers(self, workspace_id: int, manifest: Manifest) -> Any:
+        state = await self._read_state(workspace_id)
+        if isinstance(state, BaseResult):
+            return state
+        self.state = state
+        self.created = {}
+
+        services = [_Step("service", s.name, s, state["services"].get(s.name)) for s in manifest.services]
+        configurations = [_Step("configuration", c.name, c, state["configurations"].get(c.name))
+                          for c in manifest.configurations]
+        transactions = [_Step("transaction", f"{t.service}/{t.name}", t,
+                              self._current_by_service("transactions", t.service, t.name))
+                        for t in manifest.transactions]
+        templates = [_Step("template", f"{t.service}/{t.name}", t,
+                           self._current_by_service("templates", t.service, t.name))
+                     for t in manifest.templates]
+        virtual_services = [_Step("virtual_service", f"{v.service}/{v.name}", v,
+                                  self._current_by_service("virtual_services", v.service, v.name))
+                            for v in manifest.virtual_services]
+        layers = [services, configurations + transactions, templates, virtual_services]
+        self.pending = {(step.kind, step.name) for layer in layers for step in layer if step.current is None}
+        return layers
+
+    async def _read_state(self, workspace_id: int) -> Any:
+        results = await asyncio.gather(
+            self.services.list_all(workspace_id),
+            self.configurations.list_all(workspace_id),
+            self.http_transactions.list_all(workspace_id, None),
+            self.messaging_transactions.list_all(workspace_id, None),
+            self.templates.list_all(workspace_id, None),
+            self.virtual_services.list_all(workspace_id, None),
+        )
+        for result in results:
+            if result.error:
+                return result
+            if result.has_more:
+                return BaseResult(error="The workspace has too many entities to read its whole state, "
+                                        "increase LIST_ALL_MAX_ITEMS")
+        services, configurations, http_transactions, messaging_transactions, templates, virtual_services = \
+            (result.result for result in results)
+        return {
+            "services": {service.name: service for service in services},
+            "configurations": {configuration.name: configuration for configuration in configurations},
+            "transactions": {(t.serviceId, t.name): t for t in messaging_transactions + http_transactions},
+            "templates": {(t.serviceId, t.name): t for t in templates},
+            "virtual_services": {(v.serviceId, v.name): v for v in virtual_services},
+        }
+
+    def _current_by_service(self, kind: str, service_name: str, name: str) -> Any:
+        service = self.state["services"].get(service_name)
+        return self.state[kind].get((service.id, name)) if service else None
+
+    def _resolve(self, kind: str, name: str, current: Any) -> Any:
+        """
+        Id of an entity referenced by name: just created, already existing or still PENDING creation.
+        """
+        if (kind, name) in self.created:
+            return self.created[(kind, name)]
+        if current is not None:
+            return current.id
+        if (kind, name) in self.pending:
+            return PENDING
+        raise UnresolvedReference(f"Unknown {kind} {name}")
+
+    def _references(self, step: _Step) -> Dict[str, Any]:
+        spec = step.spec
+        references = {"service": self._resolve("service", spec.service, self.state["services"].get(spec.service))}
+        if isinstance(spec, ManifestTemplate):
+            references["configuration"] = None if spec.configuration is None else self._resolve(
+                "configuration", spec.configuration, self.state["configurations"].get(spec.configuration))
+            transactions = []
+            for reference in spec.transactions:
+                if isinstance(reference, str):
+                    reference = ManifestTransactionReference(name=reference)
+                transaction_id = self._resolve(
+                    "transaction", f"{spec.service}/{reference.name}",
+                    self._current_by_service("transactions", spec.service, reference.name))
+                transactions.append({"txnId": transaction_id, "priority": reference.priority})
+            references["transactions"] = transactions
+        return references
+
+    def _diff(self, step: _Step, pending_allowed: bool) -> None:
+        """
+        Resolve the references of a step and compare it with the current entity.
+        """
+        try:
+            step.references = self._references(step) if step.kind not in ("service", "configuration") else {}
+        except UnresolvedReference as e:
+            step.result.error = str(e)
+            return
+        pending = step.references.get("service") is PENDING or step.references.get("configuration") is PENDING \
+            or any(t["txnId"] is PENDING for t in step.references.get("transactions", []))
+        if pending and not pending_allowed:
+            step.result.error = "Not applied because an entity it depends on failed"
+            return
+        if step.current is None:
+            return
+        changes = self._changes(step, step.references)
+        if changes:
+            step.result.action = "update"
+            step.result.changes = changes
+
+    def _changes(self, step: _Step, references: Dict[str, Any]) -> List[str]:
+        spec, current = step.spec, step.current
+        changes = []
+        match step.kind:
+            case "configuration":
+                if spec.values != (current.configurationMap or {}):
+                    changes.append("values")
+            case "transaction":
+                current_dsl = _decode_bodies(current.dsl.model_dump(exclude_none=True))
+                if differs(self._desired_dsl(spec), current_dsl):
+                    changes.append("dsl")
+            case "template" | "virtual_service":
+                fields = ["noMatchingRequestPreference"]
+                if isinstance(spec, ManifestVirtualService):
+                    fields += ["harborId", "shipId", "endpointPreference"]
+                changes += [field for field in fields if getattr(spec, field) != getattr(current, field)]
+                desired_transactions = [(t["txnId"], t["priority"]) for t in references["transactions"]]
+                current_transactions = [(t.txnId, t.priority) for t in current.mockServiceTransactions or []]
+                if any(txn_id is PENDING for txn_id, _ in desired_transactions) \
+                        or sorted(desired_transactions) != sorted(current_transactions):
+                    changes.append("transactions")
+                configuration_id = references["configuration"]
+                if configuration_id is not None and configuration_id != current.configurationId:
+                    changes.append("configuration")
+        return changes
+
+    @staticmethod
+    def _desired_dsl(spec: Any) -> dict:
+        dsl = copy.deepcopy(spec.dsl)
+        if spec.type == "HTTP":
+            request = dsl.get("requestDsl") or {}
+            if request.get("url") is not None:
+                request["url"]["key"] = "url"
+        if spec.delay:
+            response = dsl.get("responseDsl")
+            if response:
+                response["responseDelay"] = {"type": "FIXED", "duration": spec.delay}
+        return dsl
+
+    async def _apply_step(self, workspace_id: int, step: _Step) -> None:
+        spec = step.spec
+        current_id = step.current.id if step.current is not None else None
+        match step.kind:
+            case "service":
+                # Services are identified by their name, they are only created
+                result = await self.services.create(spec.name, workspace_id)
+            case "configuration":
+                if current_id is None:
+                    result = await self.configurations.create(workspace_id, spec.name, spec.values)
+                else:
+                    result = await self.configurations.update(workspace_id, current_id, spec.name, spec.values)
+            case "transaction":
+                result = await self._apply_transaction(workspace_id, step, current_id)
+            case _:
+                result = await self._apply_mock(workspace_id, step, current_id)
+        if result.error:
+            step.result.error = result.error
+        elif current_id is None:
+            step.result.id = result.result[0].id
+            self.created[(step.kind, step.name)] = step.result.id
+
+    async def _apply_transaction(self, workspace_id: int, step: _Step, current_id: Optional[int]) -> BaseResult:
+        spec = step.spec
+        service_id = step.references["service"]
+        # Delay is already part of the desired DSL
+        dsl = self._desired_dsl(spec)
+        if spec.type == "HTTP":
+            if current_id is None:
+                return await self.http_transactions.create(spec.name, workspace_id, service_id, dsl, None)
+            return await self.http_transactions.update(current_id, spec.name, workspace_id, dsl, None)
+        if current_id is None:
+            return await self.messaging_transactions.create(spec.name, workspace_id, service_id, spec.type, dsl, None)
+        return await self.messaging_transactions.update(current_id, spec.name, workspace_id, spec.type, dsl, None)
+
+    async def _apply_mock(self, workspace_id: int, step: _Step, current_id: Optional[int]) -> BaseResult:
+        spec, references = step.spec, step.references
+        service_id = references["service"]
+        transactions = references["transactions"]
+        if step.kind == "template":
+            manager = self.templates
+            if current_id is None:
+                result = await manager.create(workspace_id, spec.name, service_id, spec.noMatchingRequestPreference,
+                                              transactions)
+            else:
+                result = await manager.update(workspace_id, current_id, spec.name, service_id,
+                                              spec.noMatchingRequestPreference, transactions)
+        else:
+            manager = self.virtual_services
+            if current_id is None:
+                result = await manager.create(workspace_id, spec.name, service_id, spec.harborId, spec.shipId,
+                                              spec.noMatchingRequestPreference, spec.endpointPreference,
+                                              transactions)
+            else:
+                result = await manager.update(workspace_id, current_id, spec.name, service_id, spec.harborId,
+                                              spec.shipId, spec.noMatchingRequestPreference,
+                                              spec.endpointPreference, transactions)
+        configuration_id = references["configuration"]
+        if result.error or configuration_id is None:
+            return result
+        entity = result.result[0]
+        if entity.configurationId != configuration_id:
+            configuration_result = await manager.assign_configuration(workspace_id, entity.id, configuration_id)
+            if configuration_result.error:
+                return configuration_result
+        return result
+
+    @staticmethod
+    def _result(steps: List[_Step], applied: bool) -> BaseResult:
+        counts: Dict[str, int] = {}
+        for step in steps:
+            counts[step.result.action] = counts.get(step.result.action, 0) + 1
+        failed = [step.result.name for step in steps if step.result.error]
+        verb = {"create": "created", "update": "updated"} if applied else {"create": "to create",
+                                                                           "update": "to update"}
+        summary = ", ".join(f"{counts[action]} {verb.get(action, action)}" for action in
+                            ("create", "update", "unchanged") if counts.get(action))
+        result = BaseResult(result=[step.result for step in steps], total=len(steps), info=[summary or "Empty manifest"])
+        if failed:
+            result.error = f"{len(failed)} entities failed: {', '.join(failed)}"
+        return result
+
+
+def register(mcp, token: Optional[BzmToken]) -> None:
+    @mcp.tool(
+        name=f"{VS_TOOLS_PREFIX}_manifest",
+        description="""
+        Declarative management of a workspace from a manifest describing the desired services, configurations,
+        HTTP/messaging transactions, virtual service templates and virtual services.
+        Entities are matched by name (transactions, templates and virtual services within their service) and
+        only the ones missing or different from the manifest are created or updated, in dependency order.
+        Entities not present in the manifest are left untouched.
+        Manifest format (JSON or YAML):
+            services: [{name}]
+            configurations: [{name, values: {name: value}}]
+            transactions: [{name, service, type (default "HTTP"), dsl, delay}]
+            templates: [{name, service, noMatchingRequestPreference, transactions: [name | {name, priority}],
+                         configuration}]
+            virtual_services: [{name, service, harborId, shipId, noMatchingRequestPreference, endpointPreference,
+                                transactions: [name | {name, priority}], configuration}]
+        Actions:
+        - plan: Show what applying the manifest would create or update, without changing anything.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                manifest (dict | str): The manifest, as an object or JSON/YAML text. Mandatory unless path is given.
+                path (str): Path of a JSON/YAML manifest file on the server.
+        - apply: Create and update the entities of the manifest. Returns the outcome of every entity.
+            args(dict): Same as plan.
+        """
+    )
+    async def manifest(action: str, args: Dict[str, Any], ctx: Context) -> BaseResult:
+        manifest_manager = ManifestManager(token, ctx)
+        try:
+            match action:
+                case "plan" | "apply":
+                    try:
+                        desired = load_manifest(args.get("manifest"), args.get("path"))
+                    except (ValueError, OSError) as e:
+                        return BaseResult(error=f"Invalid manifest: {e}")
+                    if action == "plan":
+                        return await manifest_manager.plan(args["workspace_id"], desired)
+                    return await manifest_manager.apply(args["workspace_id"], desired)
+                case _:
+                    return BaseResult(
+                        error=f"Action {action} not found in manifest manager tool"
+                    )
+        except httpx.HTTPStatusError:
+            return BaseResult(
+                error=f"Error: {traceback.format_exc()}"
+            )
+        except Exception:
+            return BaseResult(
+                error=f"""Error: {traceback.format_exc()}
+                          If you think this is a bug, please contact BlazeMeter support or report issue at https://github.com/BlazeMeter/bzm-mcp/issues"""
+            )
@@ -1,18 +1,20 @@
 import base64
+import copy
 import traceback
-from typing import Optional, Dict, Any, Annotated
+from typing import Optional, Dict, Any, Annotated, List
 
 import httpx
 from mcp.server.fastmcp import Context
 
 from sv_mcp.config.blazemeter import VS_TRANSACTIONS_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX, VS_VALIDATIONS_ENDPOINT, \
-    VS_CONVERT_ENDPOINT
+    VS_CONVERT_ENDPOINT, CACHE_TTL_TRANSACTIONS
 from sv_mcp.config.token import BzmToken
 from sv_mcp.formatters.transaction import format_messaging_transactions
-from sv_mcp.formatters.validations import format_validation_request
 from sv_mcp.models.result import BaseResult
 from sv_mcp.models.vs.messaging_transaction import MessagingTransaction
-from sv_mcp.tools.utils import vs_api_request
+from sv_mcp.tools.utils import vs_api_request, collect_pages
+from sv_mcp.tools.vs.template_validation import template_request
+from sv_mcp.tools.vs.transaction_batch import create_transaction_batches
 
 
 class MessagingTransactionManager:
@@ -26,10 +28,12 @@ class MessagingTransactionManager:
             self.token,
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TRANSACTIONS_ENDPOINT}/{transaction_id}",
-            result_formatter=format_messaging_transactions
+            result_formatter=format_messaging_transactions,
+            cache_ttl=CACHE_TTL_TRANSACTIONS
         )
 
-    async def list(self, workspace_id: int, service_id: int, limit: int = 50, offset: int = 0) -> BaseResult:
+    async def list(self, workspace_id: int, service_id: int,
+                   limit: int = 50, offset: int = 0, cached: bool = True) -> BaseResult:
         parameters = {
             "limit": limit,
             "skip": offset,
@@ -42,12 +46,20 @@ class MessagingTransactionManager:
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TRANSACTIONS_ENDPOINT}",
             result_formatter=format_messaging_transactions,
-            params=parameters)
+            params=parameters,
+            cache_ttl=CACHE_TTL_TRANSACTIONS if cached else None)
 
-    async def create(self, transaction_name: str, workspace_id: int, service_id, type: str,
-                     dsl: MessagingTransaction, delay: int) -> BaseResult:
+    async def list_all(self, workspace_id: int, service_id: Optional[int], max_items: Optional[int] = None) -> BaseResult:
+        return await collect_pages(lambda limit, offset: self.list(workspace_id, service_id, limit, offset),
+                                   max_items)
+
+    @staticmethod
+    def prepare_dsl(dsl: MessagingTransaction, delay: Optional[int]) -> dict:
+        """
+        DSL as sent to the API: body matchers encoded to Base64 and the delay applied.
+        """
         # Convert MessagingDsl to dict for JSON serialization
-        dsl_dict = dsl.model_dump() if isinstance(dsl, MessagingTransaction) else dsl
+        dsl_dict = dsl.model_dump() if isinstance(dsl, MessagingTransaction) else copy.deepcopy(dsl)
         request = dsl_dict.get("requestDsl")
         if request:
             body_list = request.get("body", [])
@@ -62,6 +74,11 @@ class MessagingTransactionManager:
                     "type": "FIXED",
                     "duration": delay
                 }
+        return dsl_dict
+
+    async def create(self, transaction_name: str, workspace_id: int, service_id, type: str,
+                     dsl: MessagingTransaction, delay: int) -> BaseResult:
+        dsl_dict = self.prepare_dsl(dsl, delay)
         transaction_body = {
             "transactions": [
                 {
@@ -84,6 +101,24 @@ class MessagingTransactionManager:
             params=parameters
         )
 
+    async def create_batch(self, workspace_id: int, service_id: Optional[int], transactions: List[Dict[str, Any]],
+                           batch_size: Optional[int] = None, prepared: bool = False) -> BaseResult:
+        """
+        Create many messaging transactions with a few requests. Every item has name and dsl, and optionally type
+        (defaults to MESSAGING), delay and serviceId (defaults to service_id). prepared tells the DSLs are already
+        as returned by the API.
+        """
+        def prepare(item: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "serviceId": item.get("serviceId") or service_id,
+                "type": item.get("type", "MESSAGING"),
+                "dsl": item["dsl"] if prepared else self.prepare_dsl(item["dsl"], item.get("delay")),
+                "name": item["name"],
+            }
+
+        return await create_transaction_batches(self.token, workspace_id, transactions, prepare,
+                                                format_messaging_transactions, batch_size)
+
     async def update(self, id: int, transaction_name: str, workspace_id: int, type: str,
                      dsl: MessagingTransaction, delay: int) -> BaseResult:
         # Convert MessagingDsl to dict for JSON serialization
@@ -118,32 +153,13 @@ class MessagingTransactionManager:
         )
 
     async def validate_template(self, template: str) -> BaseResult:
-        validation_body = {
-            "template": template,
-        }
-        return await vs_api_request(
-            self.token,
-            "POST",
-            f"{VS_VALIDATIONS_ENDPOINT}",
-            result_formatter=format_validation_request,
-            json=validation_body
-        )
+        return await template_request(self.token, VS_VALIDATIONS_ENDPOINT, template)
 
     async def convert_template(self, template: str, encode=True) -> BaseResult:
-        validation_body = {
-            "template": template,
-        }
         parameters = {
             "encode": encode
         }
-        return await vs_api_request(
-            self.token,
-            "POST",
-            f"{VS_CONVERT_ENDPOINT}",
-            result_formatter=format_validation_request,
-            json=validation_body,
-            params=parameters
-        )
+        return await template_request(self.token, VS_CONVERT_ENDPOINT, template, parameters)
 
     def to_base64(input_str: str) -> str:
         encoded_bytes = base64.b64encode(input_str.encode('utf-8'))
@@ -310,6 +326,11 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 virtual_service_id (int): Optional. The id of the virtual service to list transactions from. Without this it will list all transactions in the workspace.
                 limit (int, default=10, valid=[1 to 50]): The number of transactions to list.
                 offset (int, default=0): Number of transactions to skip.
+        - list_all: List all transactions at once, reading every page.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace to list transactions from.
+                serviceId (int): Optional. The id of the service to list transactions from.
+                max_items (int, default=1000): Maximum number of transactions to return.
         - validate_template: Validates template used in transaction definition.
             args:
                 template (str): Mandatory. The handlebars template to validate.
@@ -327,6 +348,13 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 dsl (MessagingDsl): Mandatory. The DSL definition of the transaction.
                 workspace_id (int): Mandatory. The id of the workspace.
                 delay (int): Optional. Response delay in milliseconds.
+        - create_batch: Create many messaging transactions at once. Use it instead of create for more than a few
+            transactions. Returns the id or the error of every transaction, in the same order.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                serviceId (int): Optional. The id of the service of the transactions that don't set their own.
+                transactions (list): Mandatory. Transactions, each with name, dsl and optionally type, delay and serviceId.
+                batch_size (int, default=50): Optional. Number of transactions sent per request.
         - update: Updates a certain transaction.
             Important: before using template in transaction definition validate it and  
             convert it first using validate_template and convert_template actions.
@@ -369,6 +397,12 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                         args.get("limit", 50),
                         args.get("offset", 0)
                     )
+                case "list_all":
+                    return await transaction_manager.list_all(
+                        args["workspace_id"],
+                        args.get("serviceId"),
+                        args.get("max_items"),
+                    )
                 case "create":
                     return await transaction_manager.create(
                         args["name"],
@@ -378,6 +412,13 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                         args["dsl"],
                         args.get("delay", None),
                     )
+                case "create_batch":
+                    return await transaction_manager.create_batch(
+                        args["workspace_id"],
+                        args.get("serviceId"),
+                        args["transactions"],
+                        args.get("batch_size"),
+                    )
                 case "update":
                     return await transaction_manager.update(
                         args["id"],
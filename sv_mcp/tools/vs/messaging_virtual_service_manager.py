@@ -5,13 +5,14 @@ from typing import Optional, Annotated, Dict, Any, List
 import httpx
 from mcp.server.fastmcp import Context
 
-from sv_mcp.config.blazemeter import VS_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX
+from sv_mcp.config.blazemeter import VS_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX, CACHE_TTL_VIRTUAL_SERVICES
 from sv_mcp.config.token import BzmToken
 from sv_mcp.formatters.virtual_service import format_virtual_services, format_virtual_services_action
 from sv_mcp.models.result import BaseResult
 from sv_mcp.models.vs.mock_service_transaction import MockServiceTransaction
 from sv_mcp.models.vs.virtual_service import VirtualService, ActionResult
-from sv_mcp.tools.utils import vs_api_request
+from sv_mcp.tools.utils import vs_api_request, collect_pages
+from sv_mcp.tools.vs.deployment import deploy_and_wait
 
 
 class MessagingVirtualServiceManager:
@@ -25,7 +26,8 @@ class MessagingVirtualServiceManager:
             self.token,
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_ENDPOINT}/{vs_id}",
-            result_formatter=format_virtual_services
+            result_formatter=format_virtual_services,
+            cache_ttl=CACHE_TTL_VIRTUAL_SERVICES
         )
 
     async def list(self, workspace_id: int, service_id: Optional[int], limit: int = 50, offset: int = 0) -> BaseResult:
@@ -37,9 +39,14 @@ class MessagingVirtualServiceManager:
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_ENDPOINT}",
             result_formatter=format_virtual_services,
-            params=params
+            params=params,
+            cache_ttl=CACHE_TTL_VIRTUAL_SERVICES
         )
 
+    async def list_all(self, workspace_id: int, service_id: Optional[int], max_items: Optional[int] = None) -> BaseResult:
+        return await collect_pages(lambda limit, offset: self.list(workspace_id, service_id, limit, offset),
+                                   max_items)
+
     async def create_mq9(
             self,
             workspace_id: int,
@@ -158,6 +165,9 @@ class MessagingVirtualServiceManager:
             result_formatter=format_virtual_services_action,
         )
 
+    async def deploy_and_wait(self, workspace_id: int, vs_id: int, timeout: Optional[float] = None) -> BaseResult:
+        return await deploy_and_wait(self, workspace_id, vs_id, timeout)
+
     async def stop(self, workspace_id: int, vs_id: int) -> BaseResult:
         return await vs_api_request(
             self.token,
@@ -295,6 +305,11 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 serviceId (int): Optional. The id of the service to list virtual services from. Without this it will list all virtual services in the workspace.
                 limit (int, default=10, valid=[1 to 50]): The number of virtual services to list.
                 offset (int, default=0): Number of virtual services to skip.
+        - list_all: List all virtual services at once, reading every page.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace to list virtual services from.
+                serviceId (int): Optional. The id of the service to list virtual services from.
+                max_items (int, default=1000): Maximum number of virtual services to return.
         - create-mq9: Create an IBM MQ9 messaging virtual service.
             args(VirtualService): A virtual service object with the following fields:
                 workspace_id (int): Mandatory. The id of the workspace.
@@ -323,21 +338,29 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 mq9_queue_username(str): Optional. The IBM MQ9 broker username.          
                 mq9_queue_password(str): Optional. The IBM MQ9 broker password.   
         - deploy: Deploy a virtual service. Deploys the virtual service to the specified harbor and ship.
-            Action result contains tracking id to track the deployment. Use tracking tool to track the deployment.
+            Action result contains tracking id to track the deployment. Use the wait action of the tracking tool to wait for the deployment.
             Deployment is finished, when tracking status is 'FINISHED'. If deployment fails, tracking status is 'FAILED'. 
             After tracking status is 'FINISHED' or 'FAILED' you can read the virtual service to get the endpoint and return to user.
             args(dict): Dictionary with the following required parameters:
                 workspace_id (int): Mandatory. The id of the workspace the virtual service belongs to.
                 id (int): Mandatory. The id of the virtual service to deploy.
+        - deploy_and_wait: Deploy a virtual service and wait until the deployment finishes. Prefer it over deploy.
+            Result contains the deployed virtual service with its endpoints, the final tracking status, errors
+            and the time spent in each deployment stage. If the deployment is still running after the timeout,
+            the tracking is returned instead and the tracking tool wait action can be used to keep waiting.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace the virtual service belongs to.
+                id (int): Mandatory. The id of the virtual service to deploy.
+                timeout (int, default=300): Optional. Maximum seconds to wait for the deployment.
         - stop: Stop a virtual service. Stops the virtual service.
-            Action result contains tracking id to track the stop action. Use tracking tool to track the stop action.
+            Action result contains tracking id to track the stop action. Use the wait action of the tracking tool to wait for the stop action.
             Stop action is finished, when tracking status is 'FINISHED'. If stop action fails, tracking status is 'FAILED'. 
             args(dict): Dictionary with the following required parameters:
                 workspace_id (int): Mandatory. The id of the workspace the virtual service belongs to.
                 id (int): Mandatory. The id of the virtual service to stop.
         - configure: Configures a virtual service. Only available if Virtual service is running.
             Updates transactions loaded into the virtual service.
-            Action result contains tracking id to track the update action. Use tracking tool to track the update action.
+            Action result contains tracking id to track the update action. Use the wait action of the tracking tool to wait for the update action.
             Update action is finished, when tracking status is 'FINISHED'. If update action fails, tracking status is 'FAILED'. 
             args(VirtualService): A virtual service object with the following fields:
                 workspace_id (int): Mandatory. The id of the virtual service.
@@ -396,6 +419,8 @@ def register(mcp, token: Optional[BzmToken]) -> None:
             match action:
                 case "deploy":
                     return await vs_manager.deploy(args["workspace_id"], args["id"])
+                case "deploy_and_wait":
+                    return await vs_manager.deploy_and_wait(args["workspace_id"], args["id"], args.get("timeout"))
                 case "stop":
                     return await vs_manager.stop(args["workspace_id"], args["id"])
                 case "configure":
@@ -409,6 +434,12 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                         args.get("limit", 50),
                         args.get("offset", 0),
                     )
+                case "list_all":
+                    return await vs_manager.list_all(
+                        args["workspace_id"],
+                        args.get("serviceId"),
+                        args.get("max_items"),
+                    )
                 case "create-mq9":
                     return await vs_manager.create_mq9(
                         args["workspace_id"],
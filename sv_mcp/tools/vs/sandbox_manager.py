@@ -1,47 +1,208 @@
+import asyncio
+import time
 import traceback
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 import httpx
 from mcp.server.fastmcp import Context
 
-from sv_mcp.config.blazemeter import VS_SANDBOX_ENDPOINT, VS_TOOLS_PREFIX, WORKSPACES_ENDPOINT
+from sv_mcp.analysis.matching import RequestMatcher, decode_base64
+from sv_mcp.config.blazemeter import VS_SANDBOX_ENDPOINT, VS_TOOLS_PREFIX, WORKSPACES_ENDPOINT, \
+    SANDBOX_TEST_CONCURRENCY
+from sv_mcp.config.env import env_int
+from sv_mcp.config.path_mapper import map_path
 from sv_mcp.config.token import BzmToken
+from sv_mcp.converters.documents import parse_document
 from sv_mcp.formatters.sandbox import format_sandbox_test_request, format_sandbox
 from sv_mcp.models.result import BaseResult
 from sv_mcp.models.vs.sandbox_request import SandboxRequest
 from sv_mcp.models.vs.sandbox_response import SandboxResponse
+from sv_mcp.models.vs.sandbox_suite import SandboxTestCase, SandboxCaseResult
+from sv_mcp.tools import bridge
+from sv_mcp.tools.cache import sandbox_placements
 from sv_mcp.tools.utils import vs_api_request
 
 
+def load_suite(cases: Any = None, path: Optional[str] = None) -> List[SandboxTestCase]:
+    """
+    Read the cases of a suite given as a list, as JSON/YAML text or as the path of a JSON/YAML file. The document
+    may also be an object with the list under "cases".
+    """
+    if path:
+        with open(map_path(path), "r", encoding="utf-8") as suite_file:
+            cases = suite_file.read()
+    if isinstance(cases, str):
+        cases = parse_document(cases, "suite")
+    if isinstance(cases, dict):
+        cases = cases.get("cases")
+    if not isinstance(cases, list):
+        raise ValueError("Provide the suite as a list of cases, as JSON/YAML text or the path of a suite file")
+    return [SandboxTestCase(**case) for case in cases]
+
+
+def check_response(case: SandboxTestCase, response: SandboxResponse) -> List[str]:
+    """
+    The assertions of a case failed by a sandbox response.
+    """
+    failures = []
+    if case.expectedStatus is not None and response.status != case.expectedStatus:
+        failures.append(f"Expected status {case.expectedStatus}, got {response.status}")
+    # Response bodies are Base64 encoded
+    body = decode_base64(response.body) or ""
+    if case.expectedBody is not None and body != case.expectedBody:
+        failures.append(f"Expected body {case.expectedBody!r}, got {body[:200]!r}")
+    for text in case.bodyContains or []:
+        if text not in body:
+            failures.append(f"Body doesn't contain {text!r}")
+    headers = {header.name.lower(): header.value for header in response.headers or []}
+    for name, value in (case.expectedHeaders or {}).items():
+        if headers.get(name.lower()) != value:
+            failures.append(f"Expected header {name}: {value}, got {headers.get(name.lower())}")
+    return failures
+
+
 class SandboxManager:
 
     def __init__(self, token: Optional[BzmToken], ctx: Context):
         self.token = token
         self.ctx = ctx
 
-    async def init(self, workspace_id: int, transaction_id: int) -> BaseResult:
+    async def init(self, workspace_id: int, transaction_id: int, force: bool = False) -> BaseResult:
+        """
+        Place a transaction in the sandbox. Skipped when this API key already placed it and it wasn't updated
+        since, unless forced.
+        """
+        if self.token and not force:
+            placed = sandbox_placements.get(self.token, workspace_id, transaction_id)
+            if placed is not None:
+                return BaseResult(result=[placed], total=1,
+                                  info=[f"Transaction {transaction_id} is already in the sandbox, init skipped"])
+        # An update of the transaction while the request is in flight makes the placed copy outdated
+        generation = sandbox_placements.generation(transaction_id)
         parameters = {
             "transactionId": transaction_id
         }
-        return await vs_api_request(
+        result = await vs_api_request(
             self.token,
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_SANDBOX_ENDPOINT}",
             result_formatter=format_sandbox,
             params=parameters
         )
+        if self.token:
+            if result.error is None and result.result:
+                sandbox_placements.set(self.token, workspace_id, transaction_id, result.result[0], generation)
+            else:
+                sandbox_placements.forget(self.token)
+        return result
 
     async def test_request(self, request: SandboxRequest, workspace_id: int) -> BaseResult:
         sandbox_request = {
             "httpRequest": request,
         }
-        return await vs_api_request(
+        result = await vs_api_request(
             self.token,
             "POST",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_SANDBOX_ENDPOINT}/test-request",
             result_formatter=format_sandbox_test_request,
             json=sandbox_request
         )
+        if result.error and self.token:
+            # The placement may have expired on the server, place the transaction again next time
+            sandbox_placements.forget(self.token)
+        return result
+
+    async def run_suite(self, workspace_id: int, cases: Any = None, path: Optional[str] = None) -> BaseResult:
+        """
+        Run the cases of a suite in the sandbox. Cases are grouped by transaction, so each transaction is placed in
+        the sandbox once; groups run one after the other, as the sandbox holds one transaction, and the requests of
+        a group are sent concurrently up to SANDBOX_TEST_CONCURRENCY.
+        """
+        suite = load_suite(cases, path)
+        groups: Dict[int, List[int]] = {}
+        for index, case in enumerate(suite):
+            groups.setdefault(case.transactionId, []).append(index)
+
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(env_int("SANDBOX_TEST_CONCURRENCY", SANDBOX_TEST_CONCURRENCY))
+        results: List[Optional[SandboxCaseResult]] = [None] * len(suite)
+
+        async def run(index: int) -> None:
+            case = suite[index]
+            async with semaphore:
+                response = await self.test_request(case.request.model_dump(exclude_none=True), workspace_id)
+            outcome = SandboxCaseResult(index=index, name=case.name, transactionId=case.transactionId, passed=False)
+            if response.error:
+                outcome.failures = [response.error]
+            else:
+                sandbox_response = response.result[0]
+                outcome.status = sandbox_response.status
+                outcome.failures = check_response(case, sandbox_response) or None
+                outcome.passed = outcome.failures is None
+                if not outcome.passed:
+                    outcome.matchingLog = sandbox_response.matchingLog
+            results[index] = outcome
+
+        for position, (transaction_id, indexes) in enumerate(groups.items()):
+            placement = await self.init(workspace_id, transaction_id)
+            if placement.error:
+                for index in indexes:
+                    results[index] = SandboxCaseResult(
+                        index=index, name=suite[index].name, transactionId=transaction_id, passed=False,
+                        failures=[f"Transaction {transaction_id} could not be placed in the sandbox: {placement.error}"])
+            else:
+                await asyncio.gather(*(run(index) for index in indexes))
+            if self.ctx is not None:
+                await self.ctx.report_progress(position + 1, len(groups), f"Transaction {transaction_id} tested")
+
+        passed = sum(outcome.passed for outcome in results)
+        result = BaseResult(result=results, total=len(results))
+        result.append_info([f"{len(results)} cases, {passed} passed, {len(results) - passed} failed, "
+                            f"{len(groups)} transactions tested in {time.monotonic() - started:.1f} s"])
+        if passed < len(results):
+            result.error = f"{len(results) - passed} of {len(results)} cases failed"
+        return result
+
+    async def simulate(self, workspace_id: int, requests: List[Dict[str, Any]], service_id: Optional[int] = None,
+                       vs_id: Optional[int] = None) -> BaseResult:
+        """
+        Find locally which transaction answers each request: the transactions of a virtual service with their
+        priorities, or every HTTP transaction of a service with the default priority.
+        """
+        priorities = None
+        if vs_id is not None:
+            virtual_service = await bridge.read_virtual_service(self.token, self.ctx, workspace_id, vs_id)
+            if virtual_service.error:
+                return virtual_service
+            virtual_service = virtual_service.result[0]
+            service_id = virtual_service.serviceId
+            priorities = {t.txnId: t.priority for t in virtual_service.mockServiceTransactions or []}
+        elif service_id is None:
+            return BaseResult(error="Either service_id or virtual_service_id is required")
+
+        transactions = await bridge.list_all_http_transactions(self.token, self.ctx, workspace_id, service_id)
+        if transactions.error:
+            return transactions
+        if priorities is None:
+            candidates = [(transaction, None) for transaction in transactions.result]
+        else:
+            candidates = [(transaction, priorities[transaction.id]) for transaction in transactions.result
+                          if transaction.id in priorities]
+
+        started = time.perf_counter()
+        matcher = RequestMatcher(candidates)
+        results = [matcher.match(SandboxRequest.model_validate(request), index)
+                   for index, request in enumerate(requests)]
+        elapsed = time.perf_counter() - started
+        result = BaseResult(result=results, total=len(results))
+        result.append_info([f"{len(candidates)} transactions, {len(results)} requests matched locally "
+                            f"in {elapsed * 1000:.1f} ms"])
+        if transactions.has_more:
+            result.append_warnings(["The service has more transactions than were read, matches may be missing"])
+        if any(not match.certain for match in results):
+            result.append_warnings(["Some matchers can't be evaluated locally, confirm uncertain matches with "
+                                    "init and test_request"])
+        return result
 
 
 def register(mcp, token: Optional[BzmToken]) -> None:
@@ -52,14 +213,33 @@ def register(mcp, token: Optional[BzmToken]) -> None:
         Use this for HTTP transaction verification.
         MESSAGING transactions are not supported in sandbox.
         Actions:
-        - init: Places transaction into sandbox.
+        - init: Places transaction into sandbox. Skipped when the transaction is already in the sandbox and wasn't
+            updated since.
             args(dict): Dictionary with the following required parameters:
                 workspace_id (int): Mandatory. The id of the workspace.
                 transaction_id (int): Mandatory. The id of the transaction to test.
+                force (bool, default=False): Optional. Place the transaction again even if it is already in the sandbox.
         - test_request: Sends test request to sandbox. 
             args(dict): Dictionary with the following required parameters:
                 request (SandboxRequest): Mandatory. The request definition.
                 workspace_id (int): Mandatory. The id of the workspace.
+        - simulate: Finds locally, without the sandbox, which transaction answers each request and why.
+            Transactions are tried by priority (lower first). Use it to check many requests at once, and confirm
+            matches reported as not certain with init and test_request.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                requests (list[SandboxRequest]): Mandatory. The requests to match.
+                virtual_service_id (int): Optional. Match against the transactions of this virtual service, with their priorities.
+                service_id (int): Optional. Match against all HTTP transactions of this service. Required without virtual_service_id.
+        - run_suite: Runs a regression suite in the sandbox: every case places its transaction in the sandbox, sends a
+            request and checks the response. Cases of the same transaction share one init and run concurrently.
+            Returns pass/fail for every case, with the matching log of the failed ones.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace.
+                cases (list): Optional. The cases, each with transactionId, request (SandboxRequest) and optional
+                    name, expectedStatus, expectedBody (plain text), bodyContains (list of texts) and expectedHeaders
+                    (header values by name). Required without path.
+                path (str): Optional. Path of a JSON or YAML file with the list of cases.
         Sandbox Request Schema:
         """ + str(SandboxRequest.model_json_schema()) + """
         Sandbox test_request response schema:
@@ -70,12 +250,29 @@ def register(mcp, token: Optional[BzmToken]) -> None:
         try:
             match action:
                 case "init":
-                    return await sandbox_manager.init(args["workspace_id"], args["transaction_id"])
+                    return await sandbox_manager.init(
+                        args["workspace_id"],
+                        args["transaction_id"],
+                        args.get("force", False),
+                    )
                 case "test_request":
                     return await sandbox_manager.test_request(
                         args["request"],
                         args["workspace_id"]
                     )
+                case "simulate":
+                    return await sandbox_manager.simulate(
+                        args["workspace_id"],
+                        args["requests"],
+                        args.get("service_id"),
+                        args.get("virtual_service_id"),
+                    )
+                case "run_suite":
+                    return await sandbox_manager.run_suite(
+                        args["workspace_id"],
+                        args.get("cases"),
+                        args.get("path"),
+                    )
                 case _:
                     return BaseResult(
                         error=f"Action {action} not found in sandbox manager tool"
@@ -4,12 +4,12 @@ from typing import Optional, Dict, Any
 import httpx
 from mcp.server.fastmcp import Context
 
-from sv_mcp.config.blazemeter import VS_SERVICES_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX
+from sv_mcp.config.blazemeter import VS_SERVICES_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX, CACHE_TTL_SERVICES
 from sv_mcp.config.token import BzmToken
 from sv_mcp.formatters.service import format_services
 from sv_mcp.models.result import BaseResult
 from sv_mcp.models.vs.service import Service
-from sv_mcp.tools.utils import vs_api_request
+from sv_mcp.tools.utils import vs_api_request, collect_pages
 
 
 class ServiceManager:
@@ -23,10 +23,11 @@ class ServiceManager:
             self.token,
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_SERVICES_ENDPOINT}/{service_id}",
-            result_formatter=format_services
+            result_formatter=format_services,
+            cache_ttl=CACHE_TTL_SERVICES
         )
 
-    async def list(self, workspace_id: int, limit: int = 50, offset: int = 0) -> BaseResult:
+    async def list(self, workspace_id: int, limit: int = 50, offset: int = 0, cached: bool = True) -> BaseResult:
         parameters = {
             "limit": limit,
             "skip": offset
@@ -37,9 +38,13 @@ class ServiceManager:
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_SERVICES_ENDPOINT}",
             result_formatter=format_services,
-            params=parameters
+            params=parameters,
+            cache_ttl=CACHE_TTL_SERVICES if cached else None
         )
 
+    async def list_all(self, workspace_id: int, max_items: Optional[int] = None) -> BaseResult:
+        return await collect_pages(lambda limit, offset: self.list(workspace_id, limit, offset), max_items)
+
     async def create(self, service_name: str, workspace_id: int) -> BaseResult:
         service_body = {
             "name": service_name,
@@ -81,6 +86,10 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 workspace_id (int): Mandatory. The id of the workspace to list services from.
                 limit (int, default=10, valid=[1 to 50]): The number of services to list.
                 offset (int, default=0): Number of services to skip.
+        - list_all: List all services at once, reading every page.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace to list services from.
+                max_items (int, default=1000): Maximum number of services to return.
         - create: Create a new service.
             args(dict): Dictionary with the following required parameters:
                 service_name (str): Mandatory. The required name of the service to create.
@@ -102,6 +111,8 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 case "list":
                     return await service_manager.list(args["workspace_id"], args.get("limit", 50),
                                                       args.get("offset", 0))
+                case "list_all":
+                    return await service_manager.list_all(args["workspace_id"], args.get("max_items"))
                 case "create":
                     return await service_manager.create(args["service_name"], args["workspace_id"])
                 case "update":
@@ -0,0 +1,488 @@
+import asyncio
+import json
+import os
+import time
+import traceback
+from typing import Optional, Dict, Any, Callable, Awaitable, TextIO, Iterator, Set, List, Tuple
+
+import httpx
+from mcp.server.fastmcp import Context
+from pydantic import BaseModel
+
+from sv_mcp.config.blazemeter import VS_TOOLS_PREFIX, SNAPSHOT_ACTION_CONCURRENCY, SNAPSHOT_VERSION, \
+    SNAPSHOT_IMPORT_CONCURRENCY, SNAPSHOT_IMPORT_BATCH_SIZE
+from sv_mcp.config.env import env_int
+from sv_mcp.config.path_mapper import map_path
+from sv_mcp.config.token import BzmToken
+from sv_mcp.models.result import BaseResult
+from sv_mcp.models.vs.snapshot import SnapshotSummary
+from sv_mcp.tools.utils import iterate_pages, PageError, get_date_time_iso
+from sv_mcp.tools.vs.action_manager import ActionManager
+from sv_mcp.tools.vs.asset_manager import AssetManager
+from sv_mcp.tools.vs.configuration_manager import ConfigurationManager
+from sv_mcp.tools.vs.http_transaction_manager import HttpTransactionManager
+from sv_mcp.tools.vs.messaging_transaction_manager import MessagingTransactionManager
+from sv_mcp.tools.vs.service_manager import ServiceManager
+from sv_mcp.tools.vs.virtual_service_manager import VirtualServiceManager
+from sv_mcp.tools.vs.virtual_service_template_manager import VirtualServiceTemplateManager
+
+
+class SnapshotWriter:
+    """
+    Appends entities to a JSONL snapshot, one {"kind", "data"} object per line.
+    """
+
+    def __init__(self, file: TextIO):
+        self.file = file
+        self.counts: Dict[str, int] = {}
+
+    def write(self, kind: str, entity: Any, **parents: Any) -> None:
+        data = entity.model_dump(mode="json", exclude_none=True) if isinstance(entity, BaseModel) else entity
+        self.file.write(json.dumps({"kind": kind, **parents, "data": data}) + "\n")
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+
+
+def read_snapshot(path: str, kinds: Set[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the lines of a snapshot with one of the given kinds.
+    """
+    with open(path, "r", encoding="utf-8") as snapshot_file:
+        for line in snapshot_file:
+            if line.strip():
+                entity = json.loads(line)
+                if entity.get("kind") in kinds:
+                    yield entity
+
+
+class ImportCheckpoint:
+    """
+    Ids of the entities already imported, by kind and snapshot id, so a failed import can be resumed without
+    creating them again. The file is a journal: a header line with the workspace, then one line appended and
+    flushed per entity created, so no id is lost when the process is killed in the middle of a layer.
+    """
+
+    def __init__(self, path: str, workspace_id: int):
+        self.path = path
+        self.workspace_id = workspace_id
+        self.ids: Dict[str, Dict[str, int]] = {}
+        self.resumed = 0
+        self.file: Optional[TextIO] = None
+
+    @classmethod
+    def load(cls, path: str, workspace_id: int) -> "ImportCheckpoint":
+        checkpoint = cls(path, workspace_id)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as checkpoint_file:
+                for line in checkpoint_file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line cut short when the process was killed
+                        continue
+                    if "workspaceId" in entry and entry["workspaceId"] != workspace_id:
+                        raise ValueError(f"Checkpoint {path} belongs to an import into workspace "
+                                         f"{entry['workspaceId']}")
+                    for kind, ids in entry.get("ids", {}).items():
+                        checkpoint.ids.setdefault(kind, {}).update(ids)
+                    if "kind" in entry:
+                        checkpoint.ids.setdefault(entry["kind"], {})[entry["old"]] = entry["new"]
+        return checkpoint
+
+    def open(self) -> None:
+        exists = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        if exists:
+            with open(self.path, "rb") as checkpoint_file:
+                checkpoint_file.seek(-1, os.SEEK_END)
+                complete = checkpoint_file.read(1) == b"\n"
+        self.file = open(self.path, "a", encoding="utf-8")
+        if not exists:
+            self._append({"workspaceId": self.workspace_id})
+        elif not complete:
+            self.file.write("\n")
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def get(self, kind: str, old_id: Any) -> Optional[int]:
+        return self.ids.get(kind, {}).get(str(old_id))
+
+    def set(self, kind: str, old_id: Any, new_id: int) -> None:
+        self.ids.setdefault(kind, {})[str(old_id)] = new_id
+        if self.file is not None:
+            self._append({"kind": kind, "old": str(old_id), "new": new_id})
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        self.file.write(json.dumps(entry) + "\n")
+        self.file.flush()
+
+
+class SnapshotManager:
+
+    def __init__(self, token: Optional[BzmToken], ctx: Context):
+        self.token = token
+        self.ctx = ctx
+        self.services = ServiceManager(token, ctx)
+        self.configurations = ConfigurationManager(token, ctx)
+        self.assets = AssetManager(token, ctx)
+        self.http_transactions = HttpTransactionManager(token, ctx)
+        self.messaging_transactions = MessagingTransactionManager(token, ctx)
+        self.actions = ActionManager(token, ctx)
+        self.templates = VirtualServiceTemplateManager(token, ctx)
+        self.virtual_services = VirtualServiceManager(token, ctx)
+
+    async def export(self, workspace_id: int, path: str) -> BaseResult:
+        """
+        Write every entity of a workspace to a JSONL file. Entities are written as their pages arrive, so
+        memory use doesn't depend on the size of the workspace.
+        """
+        started = time.monotonic()
+        snapshot_path = map_path(path)
+        errors = []
+        action_reads = asyncio.Semaphore(env_int("SNAPSHOT_ACTION_CONCURRENCY", SNAPSHOT_ACTION_CONCURRENCY))
+        action_tasks = []
+        crawled = 0
+
+        partial_path = f"{snapshot_path}.part"
+        with open(partial_path, "w", encoding="utf-8") as snapshot_file:
+            writer = SnapshotWriter(snapshot_file)
+            writer.write("snapshot", {
+                "version": SNAPSHOT_VERSION,
+                "workspaceId": workspace_id,
+                "created": get_date_time_iso(int(time.time())),
+            })
+
+            async def read_actions(transaction_id: int) -> None:
+                try:
+                    result = await self.actions.list(workspace_id, transaction_id)
+                finally:
+                    action_reads.release()
+                if result.error:
+                    errors.append(f"action of transaction {transaction_id}: {result.error}")
+                for action in result.result or []:
+                    writer.write("action", action, transactionId=transaction_id)
+
+            async def crawl_actions(transaction: Any) -> None:
+                # Waiting for a free slot before starting the read holds the listing back
+                await action_reads.acquire()
+                action_tasks.append(asyncio.create_task(read_actions(transaction.id)))
+
+            async def crawl(kind: str, fetch_page: Callable[[int, int], Awaitable[BaseResult]],
+                            on_entity: Optional[Callable[[Any], Awaitable[None]]] = None) -> None:
+                nonlocal crawled
+                try:
+                    async for entity in iterate_pages(fetch_page):
+                        writer.write(kind, entity)
+                        if on_entity:
+                            await on_entity(entity)
+                except PageError as e:
+                    errors.append(f"{kind}: {e.result.error}")
+                crawled += 1
+                if self.ctx is not None:
+                    await self.ctx.report_progress(crawled, len(crawls), f"{kind}: {writer.counts.get(kind, 0)}")
+
+            # Pages are read once, keeping them out of the response cache
+            crawls = [
+                crawl("service", lambda limit, offset: self.services.list(workspace_id, limit, offset, cached=False)),
+                crawl("configuration",
+                      lambda limit, offset: self.configurations.list(workspace_id, limit, offset, cached=False)),
+                crawl("asset", lambda limit, offset: self.assets.list(workspace_id, limit, offset)),
+                crawl("http_transaction",
+                      lambda limit, offset: self.http_transactions.list(workspace_id, None, limit, offset,
+                                                                        cached=False),
+                      crawl_actions),
+                crawl("messaging_transaction",
+                      lambda limit, offset: self.messaging_transactions.list(workspace_id, None, limit, offset,
+                                                                             cached=False),
+                      crawl_actions),
+                crawl("template",
+                      lambda limit, offset: self.templates.list(workspace_id, None, limit, offset, cached=False)),
+                crawl("virtual_service",
+                      lambda limit, offset: self.virtual_services.list(workspace_id, None, limit, offset,
+                                                                       cached=False)),
+            ]
+            await asyncio.gather(*crawls)
+            await asyncio.gather(*action_tasks)
+        os.replace(partial_path, snapshot_path)
+
+        counts = {kind: count for kind, count in writer.counts.items() if kind != "snapshot"}
+        summary = SnapshotSummary(
+            path=path,
+            workspaceId=workspace_id,
+            counts=counts,
+            errors=errors or None,
+            elapsedSeconds=round(time.monotonic() - started, 3)
+        )
+        result = BaseResult(result=[summary], total=sum(counts.values()))
+        if errors:
+            result.error = f"The snapshot is incomplete, {len(errors)} lists could not be read"
+        return result
+
+    async def import_snapshot(self, workspace_id: int, path: str, checkpoint_path: Optional[str] = None,
+                              harbor_id: Optional[str] = None, ship_id: Optional[str] = None) -> BaseResult:
+        """
+        Create the entities of a snapshot in a workspace, layer by layer: services, then configurations and
+        transactions, then templates, virtual services and actions. Ids are remapped to the new entities.
+        The snapshot is streamed once per layer and the ids created are kept in a checkpoint file, so running
+        the import again after a failure only creates what is missing.
+        """
+        started = time.monotonic()
+        checkpoint_path = checkpoint_path or f"{path}.{workspace_id}.checkpoint.jsonl"
+        snapshot_path = map_path(path)
+        try:
+            checkpoint = ImportCheckpoint.load(map_path(checkpoint_path), workspace_id)
+        except ValueError as e:
+            return BaseResult(error=str(e))
+        counts: Dict[str, int] = {}
+        skipped: Dict[str, int] = {}
+        errors: List[str] = []
+
+        def created(kind: str, old_id: Any, new_id: int) -> None:
+            checkpoint.set(kind, old_id, new_id)
+            counts[kind] = counts.get(kind, 0) + 1
+
+        def failed(kind: str, data: Dict[str, Any], error: str) -> None:
+            errors.append(f"{kind} {data.get('name')} ({data.get('id')}): {error}")
+
+        def pending(kind: str, data: Dict[str, Any]) -> bool:
+            if checkpoint.get(kind, data.get("id")) is not None:
+                checkpoint.resumed += 1
+                return False
+            return True
+
+        async def import_service(line: Dict[str, Any]) -> None:
+            data = line["data"]
+            result = await self.services.create(data["name"], workspace_id)
+            if result.error:
+                failed("service", data, result.error)
+            else:
+                created("service", data["id"], result.result[0].id)
+
+        async def import_configuration(line: Dict[str, Any]) -> None:
+            data = line["data"]
+            result = await self.configurations.create(workspace_id, data["name"], data.get("configurationMap") or {})
+            if result.error:
+                failed("configuration", data, result.error)
+            else:
+                created("configuration", data["id"], result.result[0].id)
+
+        async def import_transactions(service_id: int, messaging: bool, batch: List[Dict[str, Any]]) -> None:
+            manager = self.messaging_transactions if messaging else self.http_transactions
+            # Snapshot DSLs are stored as returned by the API, with their bodies already encoded
+            items = [{"name": data["name"], "dsl": data["dsl"],
+                      "type": data.get("type") or data["dsl"].get("type", "MESSAGING")}
+                     for data in batch]
+            result = await manager.create_batch(workspace_id, service_id, items, prepared=True)
+            for data, outcome in zip(batch, result.result):
+                if outcome.error:
+                    failed("transaction", data, outcome.error)
+                else:
+                    created("transaction", data["id"], outcome.id)
+
+        async def import_mock(line: Dict[str, Any]) -> None:
+            kind, data = line["kind"], line["data"]
+            service_id = checkpoint.get("service", data.get("serviceId"))
+            if service_id is None:
+                failed(kind, data, f"Service {data.get('serviceId')} was not imported")
+                return
+            transactions = []
+            for transaction in data.get("mockServiceTransactions") or []:
+                transaction_id = checkpoint.get("transaction", transaction["txnId"])
+                if transaction_id is None:
+                    failed(kind, data, f"Transaction {transaction['txnId']} was not imported")
+                    return
+                transactions.append({"txnId": transaction_id, "priority": transaction.get("priority", 10)})
+            configuration_id = None
+            if data.get("configurationId") is not None:
+                configuration_id = checkpoint.get("configuration", data["configurationId"])
+                if configuration_id is None:
+                    failed(kind, data, f"Configuration {data['configurationId']} was not imported")
+                    return
+
+            if kind == "template":
+                manager = self.templates
+                result = await manager.create(workspace_id, data["name"], service_id,
+                                              data.get("noMatchingRequestPreference", "return404"), transactions)
+            else:
+                manager = self.virtual_services
+                result = await manager.create(workspace_id, data["name"], service_id,
+                                              harbor_id or data["harborId"], ship_id or data["shipId"],
+                                              data.get("noMatchingRequestPreference", "return404"),
+                                              data.get("endpointPreference", "HTTPS"), transactions)
+            if result.error:
+                failed(kind, data, result.error)
+                return
+            new_id = result.result[0].id
+            created(kind, data["id"], new_id)
+            if configuration_id is not None:
+                configuration_result = await manager.assign_configuration(workspace_id, new_id, configuration_id)
+                if configuration_result.error:
+                    failed(kind, data, f"Configuration not assigned: {configuration_result.error}")
+
+        async def import_action(line: Dict[str, Any]) -> None:
+            data = line["data"]
+            transaction_id = checkpoint.get("transaction", line.get("transactionId"))
+            if transaction_id is None:
+                failed("action", data, f"Transaction {line.get('transactionId')} was not imported")
+                return
+            if data.get("actionType") == "WEBHOOK":
+                result = await self.actions.create_web_hook(data["name"], workspace_id, transaction_id,
+                                                            data["definition"])
+            else:
+                result = await self.actions.create_http_call(data["name"], workspace_id, transaction_id,
+                                                             data["definition"])
+            if result.error:
+                failed("action", data, result.error)
+            else:
+                created("action", data["id"], result.result[0].id)
+
+        def entities(kinds: Set[str]) -> Iterator[Dict[str, Any]]:
+            for line in read_snapshot(snapshot_path, kinds):
+                kind = "transaction" if line["kind"].endswith("_transaction") else line["kind"]
+                if kind == "virtual_service" and line["data"].get("type") == "MESSAGING":
+                    # Messaging virtual services need broker credentials, which snapshots don't have
+                    skipped[kind] = skipped.get(kind, 0) + 1
+                elif pending(kind, line["data"]):
+                    yield line
+
+        async def import_layer_2() -> None:
+            # Transactions are created in batches of the same service and family
+            batches: Dict[Tuple[int, bool], List[Dict[str, Any]]] = {}
+            batch_size = env_int("SNAPSHOT_IMPORT_BATCH_SIZE", SNAPSHOT_IMPORT_BATCH_SIZE)
+
+            def work() -> Iterator[Awaitable[None]]:
+                for line in entities({"configuration", "http_transaction", "messaging_transaction"}):
+                    data = line["data"]
+                    if line["kind"] == "configuration":
+                        yield import_configuration(line)
+                        continue
+                    if data.get("assets"):
+                        skipped["transaction asset"] = skipped.get("transaction asset", 0) + len(data["assets"])
+                    service_id = checkpoint.get("service", data.get("serviceId"))
+                    if service_id is None:
+                        failed("transaction", data, f"Service {data.get('serviceId')} was not imported")
+                        continue
+                    key = (service_id, line["kind"] == "messaging_transaction")
+                    batch = batches.setdefault(key, [])
+                    batch.append(data)
+                    if len(batch) >= batch_size:
+                        del batches[key]
+                        yield import_transactions(*key, batch)
+                for key, batch in list(batches.items()):
+                    yield import_transactions(*key, batch)
+
+            await self._run_bounded(work())
+
+        skipped_assets = sum(1 for _ in read_snapshot(snapshot_path, {"asset"}))
+        if skipped_assets:
+            # Snapshots only have the asset metadata
+            skipped["asset"] = skipped_assets
+        layers = [
+            lambda: self._run_bounded(import_service(line) for line in entities({"service"})),
+            import_layer_2,
+            lambda: self._run_bounded(
+                import_action(line) if line["kind"] == "action" else import_mock(line)
+                for line in entities({"template", "virtual_service", "action"})),
+        ]
+        checkpoint.open()
+        try:
+            for index, layer in enumerate(layers):
+                await layer()
+                if self.ctx is not None:
+                    await self.ctx.report_progress(index + 1, len(layers), f"Imported {sum(counts.values())} entities")
+        finally:
+            checkpoint.close()
+
+        summary = SnapshotSummary(
+            path=path,
+            workspaceId=workspace_id,
+            counts=counts,
+            skipped=skipped or None,
+            errors=errors or None,
+            checkpoint=checkpoint_path,
+            elapsedSeconds=round(time.monotonic() - started, 3)
+        )
+        result = BaseResult(result=[summary], total=sum(counts.values()))
+        if checkpoint.resumed:
+            result.append_info([f"{checkpoint.resumed} entities were already imported according to the checkpoint"])
+        if errors:
+            result.error = f"{len(errors)} entities failed to be imported. Run the import again with the same " \
+                           f"checkpoint to retry them"
+        return result
+
+    @staticmethod
+    async def _run_bounded(work: Iterator[Awaitable[None]]) -> None:
+        """
+        Run the coroutines of an iterator concurrently, up to SNAPSHOT_IMPORT_CONCURRENCY at a time. The
+        iterator is only advanced when a slot is free, so the snapshot is not read ahead of the requests.
+        """
+        slots = asyncio.Semaphore(env_int("SNAPSHOT_IMPORT_CONCURRENCY", SNAPSHOT_IMPORT_CONCURRENCY))
+        running: Set[asyncio.Task] = set()
+
+        async def run(coroutine: Awaitable[None]) -> None:
+            try:
+                await coroutine
+            finally:
+                slots.release()
+
+        for coroutine in work:
+            await slots.acquire()
+            task = asyncio.create_task(run(coroutine))
+            running.add(task)
+            task.add_done_callback(running.discard)
+        while running:
+            await asyncio.gather(*list(running))
+
+
+def register(mcp, token: Optional[BzmToken]) -> None:
+    @mcp.tool(
+        name=f"{VS_TOOLS_PREFIX}_snapshot",
+        description="""
+        Workspace snapshots, for backing up or inspecting a whole workspace at once.
+        A snapshot is a JSONL file with one entity per line: {"kind": ..., "data": ...}. Kinds are service,
+        configuration, asset (metadata only), http_transaction, messaging_transaction, action (with its
+        transactionId), template and virtual_service. The first line describes the snapshot.
+        Actions:
+        - export: Write every entity of a workspace to a snapshot file. Returns the number of entities of each kind.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace to export.
+                path (str): Mandatory. Path of the snapshot file to write on the server.
+        - import: Create the entities of a snapshot in a workspace, remapping their ids. Assets and messaging
+            virtual services are not imported. If some entities fail, run the import again with the same
+            checkpoint and only the missing ones are created.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace to import into.
+                path (str): Mandatory. Path of the snapshot file on the server.
+                checkpoint (str): Optional. Path of the checkpoint file. Defaults to <path>.<workspace_id>.checkpoint.jsonl
+                harborId (str): Optional. Location harbor for the virtual services, instead of the exported one.
+                shipId (str): Optional. Location ship for the virtual services, instead of the exported one.
+        """
+    )
+    async def snapshot(action: str, args: Dict[str, Any], ctx: Context) -> BaseResult:
+        snapshot_manager = SnapshotManager(token, ctx)
+        try:
+            match action:
+                case "export":
+                    return await snapshot_manager.export(args["workspace_id"], args["path"])
+                case "import":
+                    return await snapshot_manager.import_snapshot(
+                        args["workspace_id"],
+                        args["path"],
+                        args.get("checkpoint"),
+                        args.get("harborId"),
+                        args.get("shipId"),
+                    )
+                case _:
+                    return BaseResult(
+                        error=f"Action {action} not found in snapshot manager tool"
+                    )
+        except httpx.HTTPStatusError:
+            return BaseResult(
+                error=f"Error: {traceback.format_exc()}"
+            )
+        except Exception:
+            return BaseResult(
+                error=f"""Error: {traceback.format_exc()}
+                          If you think this is a bug, please contact BlazeMeter support or report issue at https://github.com/BlazeMeter/bzm-mcp/issues"""
+            )
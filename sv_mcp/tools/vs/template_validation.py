@@ -0,0 +1,63 @@
+"""
+Handlebars template validation and conversion requests. Templates are checked locally first, and answered
+from the template cache when the same template was already sent.
+"""
+from typing import Optional
+
+from sv_mcp.analysis.handlebars import check_template
+from sv_mcp.config.token import BzmToken
+from sv_mcp.formatters.validations import format_validation_request
+from sv_mcp.models.result import BaseResult
+from sv_mcp.models.vs.validation_response import ValidationResponse
+from sv_mcp.tools.cache import template_cache
+from sv_mcp.tools.utils import vs_api_request, SingleFlight
+
+template_in_flight = SingleFlight()
+
+
+async def template_request(token: Optional[BzmToken], endpoint: str, template: str,
+                           params: Optional[dict] = None) -> BaseResult:
+    """
+    POST a template to a validation endpoint. Templates with syntax errors found locally are reported invalid
+    without a request, and warnings are added to the result. Successful responses are cached by content, so
+    each distinct template (and parameters) reaches the API once; identical requests in flight share one call.
+    """
+    check = check_template(template)
+    warnings = [str(warning) for warning in check.warnings]
+    if not check.valid:
+        result = BaseResult(result=[ValidationResponse(
+            valid=False, message="; ".join(str(error) for error in check.errors))])
+        result.append_info(["Template checked locally, it was not sent for validation"])
+        if warnings:
+            result.append_warnings(warnings)
+        return result
+
+    result = await _send_template(token, endpoint, template, params)
+    if warnings:
+        result.append_warnings(warnings)
+    return result
+
+
+async def _send_template(token: Optional[BzmToken], endpoint: str, template: str,
+                         params: Optional[dict] = None) -> BaseResult:
+    key = template_cache.key(endpoint, template, params)
+    cached = template_cache.get(key)
+    if cached is not None:
+        return BaseResult(result=[ValidationResponse(**item) for item in cached])
+
+    async def send() -> BaseResult:
+        result = await vs_api_request(
+            token,
+            "POST",
+            endpoint,
+            result_formatter=format_validation_request,
+            json={"template": template},
+            params=params
+        )
+        if result.error is None and result.result is not None:
+            template_cache.set(key, [item.model_dump() for item in result.result])
+        return result
+
+    result, _ = await template_in_flight.do(key, send)
+    # Every caller gets its own copy, the first one could otherwise add warnings before the others copy it
+    return result.model_copy(deep=True)
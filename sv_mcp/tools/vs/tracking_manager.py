@@ -1,15 +1,19 @@
+import asyncio
+import time
 import traceback
 from typing import Optional, Dict, Any
 
 import httpx
 from mcp.server.fastmcp import Context
 
-from sv_mcp.config.blazemeter import VS_TOOLS_PREFIX, VS_TRACKINGS_ENDPOINT
+from sv_mcp.config.blazemeter import VS_TOOLS_PREFIX, VS_TRACKINGS_ENDPOINT, TRACKING_WAIT_TIMEOUT
+from sv_mcp.config.env import env_float
 from sv_mcp.config.token import BzmToken
 from sv_mcp.formatters.tracking import format_trackings, format_asset_trackings
 from sv_mcp.models.result import BaseResult
 from sv_mcp.models.vs.trackings import MasterTracking
 from sv_mcp.tools.utils import vs_api_request
+from sv_mcp.tools.vs.tracking_registry import tracking_registry
 
 
 class TrackingManager:
@@ -34,12 +38,50 @@ class TrackingManager:
             result_formatter=format_asset_trackings
         )
 
+    async def wait(self, tracking_id: str, timeout: Optional[float] = None, asset: bool = False) -> BaseResult:
+        """
+        Wait until the tracking reaches a final status or the timeout (seconds) expires.
+        The tracking is polled by the shared tracking_registry, with an interval that grows while
+        nothing changes, and every stage change is reported to the client as progress.
+        """
+        if not self.token:
+            return await self.read(tracking_id)
+        timeout = timeout if timeout is not None else env_float("TRACKING_WAIT_TIMEOUT", TRACKING_WAIT_TIMEOUT)
+        deadline = time.monotonic() + timeout
+        subscription = tracking_registry.subscribe(self.token, tracking_id, asset)
+        try:
+            while True:
+                try:
+                    state = await asyncio.wait_for(subscription.get(), max(deadline - time.monotonic(), 0))
+                except asyncio.TimeoutError:
+                    break
+                await self.report_progress(state.progress, state.total, state.message)
+                if state.final:
+                    return state.result
+        finally:
+            subscription.close()
+
+        last_state = subscription.entry.state
+        tracking_result = last_state.result.model_copy(deep=True) if last_state else \
+            await (self.read_asset_tracking if asset else self.read)(tracking_id)
+        if not tracking_result.error and tracking_result.result:
+            tracking_result.append_warnings([
+                f"Tracking {tracking_id} is still {tracking_result.result[0].status} after {timeout:g} seconds. "
+                f"Use the wait action again to keep waiting."
+            ])
+        return tracking_result
+
+    async def report_progress(self, progress: float, total: Optional[float], message: str) -> None:
+        if self.ctx is not None:
+            await self.ctx.report_progress(progress, total, message)
+
+
 def register(mcp, token: Optional[BzmToken]) -> None:
     @mcp.tool(
         name=f"{VS_TOOLS_PREFIX}_tracking",
         description="""
         Operations on tracking objects. 
-        Use this when a user needs to poll the tracking to understand job status or the asset upload status.
+        Use this when a user needs to wait for a job or an asset upload, or to poll the tracking to understand its status.
         Actions:
         - read: Read a Tracking. Get the information of a tracking. Used for virtual service deploy/stop/configure tracking.
             args(dict): Dictionary with the following required parameters:
@@ -47,6 +89,13 @@ def register(mcp, token: Optional[BzmToken]) -> None:
         - read_asset_tracking: Read an Asset Tracking. Get the information of a tracking. Used only for asset upload tracking.
             args(dict): Dictionary with the following required parameters:
                 tracking_id (str): Mandatory. The id of the tracking, must be a valid UUID.
+        - wait: Wait until a tracking is 'FINISHED' or 'FAILED' and return it. Prefer it over polling with read.
+            The progress of every stage is reported while waiting.
+            args(dict): Dictionary with the following parameters:
+                tracking_id (str): Mandatory. The id of the tracking, must be a valid UUID.
+                timeout (int, default=300): Optional. Maximum seconds to wait. If the tracking is still running
+                after it, the last tracking is returned with a warning and wait can be called again.
+                asset (bool, default=False): Optional. True for asset upload trackings.
         Tracking Schema:
         """ + str(MasterTracking.model_json_schema())
     )
@@ -58,6 +107,9 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                     return await tracking_manager.read(args["tracking_id"])
                 case "read_asset_tracking":
                     return await tracking_manager.read_asset_tracking(args["tracking_id"])
+                case "wait":
+                    return await tracking_manager.wait(args["tracking_id"], args.get("timeout"),
+                                                       args.get("asset", False))
                 case _:
                     return BaseResult(
                         error=f"Action {action} not found in tracking manager tool"
@@ -0,0 +1,282 @@
+"""
+Process-wide registry of the trackings being waited on.
+Every caller waiting for a tracking subscribes to it and a single background task polls all the
+active trackings, so sessions waiting for the same deployment share the same requests.
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sv_mcp.config.blazemeter import VS_TRACKINGS_ENDPOINT, VS_ENDPOINT, TRACKING_POLL_MIN_INTERVAL, \
+    TRACKING_POLL_MAX_INTERVAL, TRACKING_POLL_BACKOFF, TRACKING_FINAL_STATUSES, TRACKING_POLL_CONCURRENCY, \
+    TRACKING_RETENTION
+from sv_mcp.config.env import env_int, env_float
+from sv_mcp.config.token import BzmToken
+from sv_mcp.formatters.tracking import format_trackings, format_asset_trackings
+from sv_mcp.models.result import BaseResult
+from sv_mcp.models.vs.trackings import MasterTracking, StageTiming
+from sv_mcp.tools.cache import response_cache
+from sv_mcp.tools.utils import vs_api_request, get_date_time_iso
+
+
+def describe_tracking(tracking: Any) -> Tuple[float, Optional[float], str]:
+    """
+    Progress of a tracking as (finished jobs, total jobs, message with the stage of every virtual service).
+    """
+    if isinstance(tracking, MasterTracking) and tracking.data and tracking.data.serviceMockTrackingDtos:
+        stages = []
+        finished = 0
+        for dto in tracking.data.serviceMockTrackingDtos:
+            sub_tracking = dto.trackingDto
+            stage = sub_tracking.data.stage if sub_tracking and sub_tracking.data else None
+            status = sub_tracking.status if sub_tracking else None
+            if status in TRACKING_FINAL_STATUSES:
+                finished += 1
+            stages.append(f"{dto.serviceMockName or dto.serviceMockId}: {stage or status or 'PENDING'}")
+        return finished, len(tracking.data.serviceMockTrackingDtos), f"{tracking.status} - {', '.join(stages)}"
+    finished = 1 if tracking.status in TRACKING_FINAL_STATUSES else 0
+    return finished, 1, str(tracking.status)
+
+
+class TrackingState:
+    """
+    Result of a poll of a tracking, as delivered to its subscribers.
+    """
+
+    def __init__(self, result: BaseResult, progress: float, total: Optional[float], message: str, final: bool):
+        self.result = result
+        self.progress = progress
+        self.total = total
+        self.message = message
+        self.final = final
+
+
+class TrackingEntry:
+
+    def __init__(self, token: BzmToken, tracking_id: str, asset: bool, poll_interval: float):
+        self.token = token
+        self.tracking_id = tracking_id
+        self.asset = asset
+        self.state: Optional[TrackingState] = None
+        # (epoch seconds, message) of every change seen
+        self.history: List[Tuple[float, str]] = []
+        # Stages reported for each virtual service of the job as (stage, started epoch seconds)
+        self.stages: Dict[Optional[int], List[Tuple[str, Optional[float]]]] = {}
+        self.finished: Optional[float] = None
+        self.subscriptions: Set["TrackingSubscription"] = set()
+        self.interval = poll_interval
+        self.next_poll = 0.0
+        self.completed_at: Optional[float] = None
+
+
+class TrackingSubscription:
+    """
+    Receives the changes of a tracking until it reaches a final status. Close it when done.
+    """
+
+    def __init__(self, registry: "TrackingRegistry", entry: TrackingEntry):
+        self.registry = registry
+        self.entry = entry
+        self.queue: "asyncio.Queue[TrackingState]" = asyncio.Queue()
+
+    async def get(self) -> TrackingState:
+        return await self.queue.get()
+
+    def close(self) -> None:
+        self.registry.unsubscribe(self)
+
+
+class TrackingRegistry:
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str, bool], TrackingEntry] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.polls = 0
+
+    def subscribe(self, token: BzmToken, tracking_id: str, asset: bool = False) -> TrackingSubscription:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Entries and poller belong to a previous event loop
+            self._entries.clear()
+            self._task = None
+            self._wakeup = asyncio.Event()
+            self._loop = loop
+        self._evict(time.monotonic())
+
+        key = (token.id, tracking_id, asset)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = TrackingEntry(token, tracking_id, asset, self._min_interval())
+            self._entries[key] = entry
+        subscription = TrackingSubscription(self, entry)
+        entry.subscriptions.add(subscription)
+        if entry.state is not None:
+            subscription.queue.put_nowait(entry.state)
+
+        if entry.completed_at is None:
+            if self._task is None or self._task.done():
+                self._task = loop.create_task(self._run())
+            self._wakeup.set()
+        return subscription
+
+    def unsubscribe(self, subscription: TrackingSubscription) -> None:
+        entry = subscription.entry
+        entry.subscriptions.discard(subscription)
+        if not entry.subscriptions and entry.completed_at is None:
+            # Nobody is waiting anymore, stop polling it
+            key = (entry.token.id, entry.tracking_id, entry.asset)
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+
+    def history(self, token: BzmToken, tracking_id: str, asset: bool = False) -> List[Tuple[float, str]]:
+        entry = self._entries.get((token.id, tracking_id, asset))
+        return list(entry.history) if entry else []
+
+    def stage_timings(self, token: BzmToken, tracking_id: str) -> List[StageTiming]:
+        """
+        Time spent by every virtual service of a waited job in each of the stages seen while polling it.
+        """
+        entry = self._entries.get((token.id, tracking_id, False))
+        if entry is None:
+            return []
+        timings = []
+        for vs_id, stages in entry.stages.items():
+            for index, (stage, started) in enumerate(stages):
+                ended = stages[index + 1][1] if index + 1 < len(stages) else entry.finished
+                timings.append(StageTiming(
+                    serviceMockId=vs_id,
+                    stage=stage,
+                    started=get_date_time_iso(started) if started is not None else None,
+                    durationSeconds=round(ended - started, 3) if started is not None and ended is not None else None
+                ))
+        return timings
+
+    def stats(self) -> Dict[str, int]:
+        active = sum(1 for entry in self._entries.values() if entry.completed_at is None)
+        return {
+            "active": active,
+            "completed": len(self._entries) - active,
+            "subscriptions": sum(len(entry.subscriptions) for entry in self._entries.values()),
+            "polls": self.polls,
+        }
+
+    async def _run(self) -> None:
+        semaphore = asyncio.Semaphore(env_int("TRACKING_POLL_CONCURRENCY", TRACKING_POLL_CONCURRENCY))
+
+        async def poll(entry: TrackingEntry) -> None:
+            async with semaphore:
+                try:
+                    await self._poll(entry)
+                except Exception as e:
+                    # A failed poll ends its tracking only, the poller keeps serving the others
+                    self._fail(entry, e)
+
+        while True:
+            now = time.monotonic()
+            self._evict(now)
+            active = [entry for entry in self._entries.values() if entry.completed_at is None]
+            if not active:
+                return
+            due = [entry for entry in active if entry.next_poll <= now]
+            if due:
+                # Every tracking due in this tick is polled at the same time
+                await asyncio.gather(*(poll(entry) for entry in due))
+                continue
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), min(entry.next_poll for entry in active) - now)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, entry: TrackingEntry) -> None:
+        result = await self._read(entry)
+        self.polls += 1
+        if entry.completed_at is not None or not entry.subscriptions:
+            return
+
+        if result.error or not result.result:
+            state = TrackingState(result, 0, None, result.error or f"Tracking {entry.tracking_id} not found", True)
+        else:
+            tracking = result.result[0]
+            progress, total, message = describe_tracking(tracking)
+            state = TrackingState(result, progress, total, message, tracking.status in TRACKING_FINAL_STATUSES)
+
+        self._record_stages(entry, state)
+        changed = entry.state is None or entry.state.message != state.message or state.final
+        entry.state = state
+        if changed:
+            entry.history.append((time.time(), state.message))
+            entry.interval = self._min_interval()
+            for subscription in entry.subscriptions:
+                subscription.queue.put_nowait(state)
+        else:
+            entry.interval = min(entry.interval * TRACKING_POLL_BACKOFF,
+                                 env_float("TRACKING_POLL_MAX_INTERVAL", TRACKING_POLL_MAX_INTERVAL))
+        entry.next_poll = time.monotonic() + entry.interval
+
+        if state.final:
+            entry.completed_at = time.monotonic()
+            entry.finished = time.time()
+            if not result.error:
+                self._invalidate_virtual_services(entry)
+
+    def _fail(self, entry: TrackingEntry, error: Exception) -> None:
+        message = f"Polling tracking {entry.tracking_id} failed: {error}"
+        state = TrackingState(BaseResult(error=message), 0, None, message, True)
+        entry.state = state
+        entry.history.append((time.time(), message))
+        entry.completed_at = time.monotonic()
+        entry.finished = time.time()
+        for subscription in entry.subscriptions:
+            subscription.queue.put_nowait(state)
+
+    async def _read(self, entry: TrackingEntry) -> BaseResult:
+        return await vs_api_request(
+            entry.token,
+            "GET",
+            f"/{VS_TRACKINGS_ENDPOINT}/{entry.tracking_id}",
+            result_formatter=format_asset_trackings if entry.asset else format_trackings
+        )
+
+    def _evict(self, now: float) -> None:
+        retention = env_float("TRACKING_RETENTION", TRACKING_RETENTION)
+        expired = [key for key, entry in self._entries.items()
+                   if entry.completed_at is not None and now - entry.completed_at >= retention]
+        for key in expired:
+            del self._entries[key]
+
+    @staticmethod
+    def _record_stages(entry: TrackingEntry, state: TrackingState) -> None:
+        tracking = state.result.result[0] if state.result.result else None
+        if not isinstance(tracking, MasterTracking) or not tracking.data:
+            return
+        for dto in tracking.data.serviceMockTrackingDtos or []:
+            sub_tracking = dto.trackingDto
+            if not sub_tracking or not sub_tracking.data or not sub_tracking.data.stage:
+                continue
+            stages = entry.stages.setdefault(dto.serviceMockId, [])
+            if not stages or stages[-1][0] != sub_tracking.data.stage:
+                started = sub_tracking.data.started
+                # The API may report the stage start in milliseconds
+                if started is not None and started > 1e11:
+                    started = started / 1000
+                stages.append((sub_tracking.data.stage, started if started is not None else time.time()))
+
+    @staticmethod
+    def _invalidate_virtual_services(entry: TrackingEntry) -> None:
+        # Deployed or stopped virtual services changed their status and endpoints
+        tracking = entry.state.result.result[0]
+        if isinstance(tracking, MasterTracking) and tracking.data and tracking.data.serviceMockTrackingDtos:
+            for dto in tracking.data.serviceMockTrackingDtos:
+                if dto.serviceMockId is not None:
+                    response_cache.invalidate_entity(entry.token, VS_ENDPOINT, dto.serviceMockId)
+
+    @staticmethod
+    def _min_interval() -> float:
+        return env_float("TRACKING_POLL_MIN_INTERVAL", TRACKING_POLL_MIN_INTERVAL)
+
+
+tracking_registry = TrackingRegistry()
+
@@ -0,0 +1,145 @@
+"""
+Creation of many transactions through the multi-transaction body of the transactions endpoint.
+"""
+import asyncio
+from collections import defaultdict, deque
+from typing import Optional, Dict, Any, List, Callable, Tuple, Iterable, Awaitable, Set, Union, AsyncIterable
+
+from sv_mcp.config.blazemeter import VS_TRANSACTIONS_ENDPOINT, WORKSPACES_ENDPOINT, TRANSACTION_BATCH_SIZE, \
+    TRANSACTION_BATCH_CONCURRENCY
+from sv_mcp.config.env import env_int
+from sv_mcp.config.token import BzmToken
+from sv_mcp.models.result import BaseResult
+from sv_mcp.models.vs.batch import BatchItemResult
+from sv_mcp.tools.utils import vs_api_request
+
+
+async def create_transaction_batches(token: Optional[BzmToken], workspace_id: int, transactions: List[Dict[str, Any]],
+                                     prepare: Callable[[Dict[str, Any]], Dict[str, Any]],
+                                     result_formatter: Callable, batch_size: Optional[int] = None) -> BaseResult:
+    """
+    Create transactions with requests of up to batch_size transactions of the same service, sent concurrently.
+    prepare(item) builds the request body of an item, raising KeyError or ValueError when it is invalid.
+    The result has a BatchItemResult for every item in input order; items of a failed request carry its error.
+    """
+    batch_size = max(1, batch_size or env_int("TRANSACTION_BATCH_SIZE", TRANSACTION_BATCH_SIZE))
+    outcomes = [BatchItemResult(index=index, name=item.get("name")) for index, item in enumerate(transactions)]
+
+    by_service: Dict[Any, List[Tuple[int, Dict[str, Any]]]] = defaultdict(list)
+    for index, item in enumerate(transactions):
+        try:
+            body = prepare(item)
+            if body.get("serviceId") is None:
+                raise KeyError("serviceId")
+        except KeyError as e:
+            outcomes[index].error = f"Missing {e}"
+            continue
+        except ValueError as e:
+            outcomes[index].error = str(e)
+            continue
+        by_service[body["serviceId"]].append((index, body))
+    chunks = [(service_id, bodies[start:start + batch_size])
+              for service_id, bodies in by_service.items() for start in range(0, len(bodies), batch_size)]
+
+    semaphore = asyncio.Semaphore(env_int("TRANSACTION_BATCH_CONCURRENCY", TRANSACTION_BATCH_CONCURRENCY))
+
+    async def send(service_id: Any, chunk: List[Tuple[int, Dict[str, Any]]]) -> None:
+        async with semaphore:
+            result = await vs_api_request(
+                token,
+                "POST",
+                f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TRANSACTIONS_ENDPOINT}",
+                result_formatter=result_formatter,
+                json={"transactions": [body for _, body in chunk]},
+                params={"serviceId": service_id}
+            )
+        if result.error:
+            for index, _ in chunk:
+                outcomes[index].error = result.error
+            return
+        # Created transactions are matched by name, in order for repeated names
+        created = defaultdict(deque)
+        for transaction in result.result or []:
+            created[transaction.name].append(transaction.id)
+        for index, body in chunk:
+            if created[body["name"]]:
+                outcomes[index].id = created[body["name"]].popleft()
+            else:
+                outcomes[index].error = "The transaction was not returned by the server"
+
+    await asyncio.gather(*(send(service_id, chunk) for service_id, chunk in chunks))
+
+    failed = sum(1 for outcome in outcomes if outcome.error)
+    result = BaseResult(result=outcomes, total=len(outcomes))
+    if failed:
+        result.error = f"{failed} of {len(outcomes)} transactions failed to be created"
+    return result
+
+
+class StreamUploadResult:
+
+    def __init__(self):
+        self.created = 0
+        self.failed = 0
+        self.errors: List[str] = []
+
+
+async def create_transaction_stream(create_batch: Callable[[List[Dict[str, Any]]], Awaitable[BaseResult]],
+                                    transactions: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+                                    batch_size: Optional[int] = None,
+                                    on_batch: Optional[Callable[[StreamUploadResult], Awaitable[None]]] = None,
+                                    max_errors: int = 20) -> StreamUploadResult:
+    """
+    Create the transactions of an iterator or async iterator in batches, keeping at most
+    TRANSACTION_BATCH_CONCURRENCY batches in flight. The iterator is only advanced when a batch can be sent,
+    so it can read from a file lazily.
+    """
+    batch_size = max(1, batch_size or env_int("TRANSACTION_BATCH_SIZE", TRANSACTION_BATCH_SIZE))
+    slots = asyncio.Semaphore(env_int("TRANSACTION_BATCH_CONCURRENCY", TRANSACTION_BATCH_CONCURRENCY))
+    upload = StreamUploadResult()
+    running: Set[asyncio.Task] = set()
+
+    async def send(batch: List[Dict[str, Any]]) -> None:
+        try:
+            result = await create_batch(batch)
+        finally:
+            slots.release()
+        for outcome in result.result or []:
+            if outcome.error:
+                upload.failed += 1
+                if len(upload.errors) < max_errors:
+                    upload.errors.append(f"{outcome.name}: {outcome.error}")
+            else:
+                upload.created += 1
+        if on_batch:
+            await on_batch(upload)
+
+    async def start(batch: List[Dict[str, Any]]) -> None:
+        await slots.acquire()
+        task = asyncio.create_task(send(batch))
+        running.add(task)
+        task.add_done_callback(running.discard)
+
+    batch: List[Dict[str, Any]] = []
+
+    async def add(transaction: Dict[str, Any]) -> None:
+        nonlocal batch
+        batch.append(transaction)
+        if len(batch) == batch_size:
+            await start(batch)
+            batch = []
+
+    try:
+        if hasattr(transactions, "__aiter__"):
+            async for transaction in transactions:
+                await add(transaction)
+        else:
+            for transaction in transactions:
+                await add(transaction)
+        if batch:
+            await start(batch)
+    finally:
+        # Batches already sent complete even when reading the transactions fails
+        while running:
+            await asyncio.gather(*list(running))
+    return upload
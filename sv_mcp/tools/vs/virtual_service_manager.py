@@ -1,17 +1,23 @@
+import asyncio
 import base64
+import time
 import traceback
 from typing import Optional, Annotated, Dict, Any, List
 
 import httpx
 from mcp.server.fastmcp import Context
 
-from sv_mcp.config.blazemeter import VS_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX
+from sv_mcp.config.blazemeter import VS_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX, CACHE_TTL_VIRTUAL_SERVICES, \
+    TRACKING_FINAL_STATUSES, BULK_ACTION_CONCURRENCY
+from sv_mcp.config.env import env_int
 from sv_mcp.config.token import BzmToken
 from sv_mcp.formatters.virtual_service import format_virtual_services, format_virtual_services_action
 from sv_mcp.models.result import BaseResult
 from sv_mcp.models.vs.mock_service_transaction import MockServiceTransaction
-from sv_mcp.models.vs.virtual_service import VirtualService, ActionResult
-from sv_mcp.tools.utils import vs_api_request
+from sv_mcp.models.vs.virtual_service import VirtualService, ActionResult, BulkActionOutcome
+from sv_mcp.tools import bridge
+from sv_mcp.tools.utils import vs_api_request, collect_pages
+from sv_mcp.tools.vs.deployment import deploy_and_wait
 
 
 class VirtualServiceManager:
@@ -20,15 +26,17 @@ class VirtualServiceManager:
         self.token = token
         self.ctx = ctx
 
-    async def read(self, workspace_id: int, vs_id: int) -> BaseResult:
+    async def read(self, workspace_id: int, vs_id: int, cached: bool = True) -> BaseResult:
         return await vs_api_request(
             self.token,
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_ENDPOINT}/{vs_id}",
-            result_formatter=format_virtual_services
+            result_formatter=format_virtual_services,
+            cache_ttl=CACHE_TTL_VIRTUAL_SERVICES if cached else None
         )
 
-    async def list(self, workspace_id: int, service_id: Optional[int], limit: int = 50, offset: int = 0) -> BaseResult:
+    async def list(self, workspace_id: int, service_id: Optional[int],
+                   limit: int = 50, offset: int = 0, cached: bool = True) -> BaseResult:
         params = {"limit": limit, "skip": offset}
         if service_id is not None:
             params["serviceId"] = service_id
@@ -37,9 +45,14 @@ class VirtualServiceManager:
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_ENDPOINT}",
             result_formatter=format_virtual_services,
-            params=params
+            params=params,
+            cache_ttl=CACHE_TTL_VIRTUAL_SERVICES if cached else None
         )
 
+    async def list_all(self, workspace_id: int, service_id: Optional[int], max_items: Optional[int] = None) -> BaseResult:
+        return await collect_pages(lambda limit, offset: self.list(workspace_id, service_id, limit, offset),
+                                   max_items)
+
     async def create(
             self,
             workspace_id: int,
@@ -136,6 +149,82 @@ class VirtualServiceManager:
             result_formatter=format_virtual_services_action,
         )
 
+    async def deploy_and_wait(self, workspace_id: int, vs_id: int, timeout: Optional[float] = None) -> BaseResult:
+        return await deploy_and_wait(self, workspace_id, vs_id, timeout)
+
+    async def bulk_action(self, action: str, workspace_id: int, vs_ids: Optional[List[int]] = None,
+                          service_id: Optional[int] = None, name_filter: Optional[str] = None,
+                          wait: bool = True, timeout: Optional[float] = None) -> BaseResult:
+        """
+        Deploy or stop many virtual services, given by id or by service and/or name filter.
+        Requests are sent concurrently up to BULK_ACTION_CONCURRENCY and all the trackings are waited
+        together, returning the outcome of every virtual service.
+        """
+        run_action = self.deploy if action == "deploy" else self.stop
+        names: Dict[int, Optional[str]] = {}
+        if not vs_ids:
+            if service_id is None and not name_filter:
+                return BaseResult(error="Provide the ids of the virtual services, a serviceId or a name filter")
+            vs_list = await self.list_all(workspace_id, service_id)
+            if vs_list.error:
+                return vs_list
+            names = {vs.id: vs.name for vs in vs_list.result
+                     if not name_filter or name_filter.lower() in (vs.name or "").lower()}
+            vs_ids = list(names)
+        if not vs_ids:
+            return BaseResult(result=[], total=0, info=["No virtual services matched"])
+
+        semaphore = asyncio.Semaphore(env_int("BULK_ACTION_CONCURRENCY", BULK_ACTION_CONCURRENCY))
+        finished = 0
+
+        async def run(vs_id: int) -> BulkActionOutcome:
+            nonlocal finished
+            outcome = BulkActionOutcome(id=vs_id, name=names.get(vs_id))
+            async with semaphore:
+                started = time.monotonic()
+                action_result = await run_action(workspace_id, vs_id)
+            if action_result.error:
+                outcome.status = "FAILED"
+                outcome.errors = [action_result.error]
+                return outcome
+            outcome.trackingId = action_result.result[0].tracking_id
+            if not wait:
+                return outcome
+            # Progress is reported once for the whole bulk action
+            tracking_result = await bridge.wait_tracking(self.token, None, outcome.trackingId, timeout)
+            if tracking_result.error:
+                outcome.errors = [tracking_result.error]
+                return outcome
+            tracking = tracking_result.result[0]
+            outcome.status = tracking.status
+            outcome.errors = tracking.errors or None
+            if tracking.status in TRACKING_FINAL_STATUSES:
+                outcome.durationSeconds = round(time.monotonic() - started, 3)
+                outcome.stageTimings = bridge.tracking_stage_timings(self.token, outcome.trackingId)
+                finished += 1
+                if self.ctx is not None:
+                    await self.ctx.report_progress(finished, len(vs_ids), f"{action} {vs_id}: {tracking.status}")
+            return outcome
+
+        outcomes = list(await asyncio.gather(*(run(vs_id) for vs_id in vs_ids)))
+
+        if wait and action == "deploy":
+            # Endpoints of the deployed virtual services, read again by id after the deployments
+            async def refresh(outcome: BulkActionOutcome) -> None:
+                async with semaphore:
+                    vs_result = await self.read(workspace_id, outcome.id, cached=False)
+                if not vs_result.error and vs_result.result:
+                    outcome.name = vs_result.result[0].name
+                    outcome.endpoints = vs_result.result[0].endpoints
+
+            await asyncio.gather(*(refresh(outcome) for outcome in outcomes if not outcome.errors))
+
+        bulk_result = BaseResult(result=outcomes, total=len(outcomes))
+        failed = [outcome.id for outcome in outcomes if outcome.errors or (wait and outcome.status != "FINISHED")]
+        if failed:
+            bulk_result.append_warnings([f"{action} didn't finish for virtual services {failed}"])
+        return bulk_result
+
     async def stop(self, workspace_id: int, vs_id: int) -> BaseResult:
         return await vs_api_request(
             self.token,
@@ -269,6 +358,11 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 serviceId (int): Optional. The id of the service to list virtual services from. Without this it will list all virtual services in the workspace.
                 limit (int, default=10, valid=[1 to 50]): The number of virtual services to list.
                 offset (int, default=0): Number of virtual services to skip.
+        - list_all: List all virtual services at once, reading every page.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace to list virtual services from.
+                serviceId (int): Optional. The id of the service to list virtual services from.
+                max_items (int, default=1000): Maximum number of virtual services to return.
         - create: Create a new virtual service.
             args(VirtualService): A virtual service object with the following fields:
                 workspace_id (int): Mandatory. The id of the workspace.
@@ -289,21 +383,41 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 endpointPreference (str): Optional. If not specified use 'HTTPS'.
                 noMatchingRequestPreference (str): Optional. If not specified use 'return404'.
         - deploy: Deploy a virtual service. Deploys the virtual service to the specified harbor and ship.
-            Action result contains tracking id to track the deployment. Use tracking tool to track the deployment.
+            Action result contains tracking id to track the deployment. Use the wait action of the tracking tool to wait for the deployment.
             Deployment is finished, when tracking status is 'FINISHED'. If deployment fails, tracking status is 'FAILED'. 
             After tracking status is 'FINISHED' or 'FAILED' you can read the virtual service to get the endpoint and return to user.
             args(dict): Dictionary with the following required parameters:
                 workspace_id (int): Mandatory. The id of the workspace the virtual service belongs to.
                 id (int): Mandatory. The id of the virtual service to deploy.
+        - deploy_and_wait: Deploy a virtual service and wait until the deployment finishes. Prefer it over deploy.
+            Result contains the deployed virtual service with its endpoints, the final tracking status, errors
+            and the time spent in each deployment stage. If the deployment is still running after the timeout,
+            the tracking is returned instead and the tracking tool wait action can be used to keep waiting.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace the virtual service belongs to.
+                id (int): Mandatory. The id of the virtual service to deploy.
+                timeout (int, default=300): Optional. Maximum seconds to wait for the deployment.
         - stop: Stop a virtual service. Stops the virtual service.
-            Action result contains tracking id to track the stop action. Use tracking tool to track the stop action.
+            Action result contains tracking id to track the stop action. Use the wait action of the tracking tool to wait for the stop action.
             Stop action is finished, when tracking status is 'FINISHED'. If stop action fails, tracking status is 'FAILED'. 
             args(dict): Dictionary with the following required parameters:
                 workspace_id (int): Mandatory. The id of the workspace the virtual service belongs to.
                 id (int): Mandatory. The id of the virtual service to stop.
+        - bulk_deploy: Deploy many virtual services at once and wait for all of them.
+            Result contains the outcome of every virtual service: final tracking status, errors, endpoints and timings.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace the virtual services belong to.
+                ids (List[int]): Optional. The ids of the virtual services to deploy.
+                serviceId (int): Optional. Without ids, deploy the virtual services of this service.
+                name (str): Optional. Without ids, deploy the virtual services whose name contains this text.
+                wait (bool, default=True): Optional. Wait until every deployment finishes.
+                timeout (int, default=300): Optional. Maximum seconds to wait for each deployment.
+        - bulk_stop: Stop many virtual services at once and wait for all of them.
+            Result contains the outcome of every virtual service: final tracking status, errors and timings.
+            args(dict): Same parameters as bulk_deploy.
         - configure: Configures a virtual service. Only available if Virtual service is running.
             Updates transactions loaded into the virtual service.
-            Action result contains tracking id to track the update action. Use tracking tool to track the update action.
+            Action result contains tracking id to track the update action. Use the wait action of the tracking tool to wait for the update action.
             Update action is finished, when tracking status is 'FINISHED'. If update action fails, tracking status is 'FAILED'. 
             args(VirtualService): A virtual service object with the following fields:
                 workspace_id (int): Mandatory. The id of the virtual service.
@@ -337,7 +451,7 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 workspace_id (int): Mandatory. The id of the workspace the virtual service belongs to.
                 id (int): Mandatory. The id of the virtual service to remove proxy.     
         - apply_template: Applies virtual service template settings to the virtual service.
-            Result contains tracking id to track the update action. Use tracking tool to track the update action.
+            Result contains tracking id to track the update action. Use the wait action of the tracking tool to wait for the update action.
             args(dict): Dictionary with the following required parameters:
                 workspace_id (int): Mandatory. The id of the workspace the virtual service belongs to.
                 id (int): Mandatory. The id of the virtual service to remove proxy.
@@ -370,8 +484,20 @@ def register(mcp, token: Optional[BzmToken]) -> None:
             match action:
                 case "deploy":
                     return await vs_manager.deploy(args["workspace_id"], args["id"])
+                case "deploy_and_wait":
+                    return await vs_manager.deploy_and_wait(args["workspace_id"], args["id"], args.get("timeout"))
                 case "stop":
                     return await vs_manager.stop(args["workspace_id"], args["id"])
+                case "bulk_deploy" | "bulk_stop":
+                    return await vs_manager.bulk_action(
+                        action.removeprefix("bulk_"),
+                        args["workspace_id"],
+                        args.get("ids"),
+                        args.get("serviceId"),
+                        args.get("name"),
+                        args.get("wait", True),
+                        args.get("timeout"),
+                    )
                 case "configure":
                     return await vs_manager.configure(args["workspace_id"], args["id"])
                 case "read":
@@ -383,6 +509,12 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                         args.get("limit", 50),
                         args.get("offset", 0),
                     )
+                case "list_all":
+                    return await vs_manager.list_all(
+                        args["workspace_id"],
+                        args.get("serviceId"),
+                        args.get("max_items"),
+                    )
                 case "create":
                     return await vs_manager.create(
                         args["workspace_id"],
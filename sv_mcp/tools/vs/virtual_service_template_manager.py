@@ -4,13 +4,13 @@ from typing import Optional, Annotated, Dict, Any, List
 import httpx
 from mcp.server.fastmcp import Context
 
-from sv_mcp.config.blazemeter import VS_TEMPLATE_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX
+from sv_mcp.config.blazemeter import VS_TEMPLATE_ENDPOINT, WORKSPACES_ENDPOINT, VS_TOOLS_PREFIX, CACHE_TTL_TEMPLATES
 from sv_mcp.config.token import BzmToken
 from sv_mcp.formatters.virtual_service_template import format_virtual_service_templates
 from sv_mcp.models.result import BaseResult
 from sv_mcp.models.vs.mock_service_transaction import MockServiceTransaction
 from sv_mcp.models.vs.virtual_service_template import VirtualServiceTemplate
-from sv_mcp.tools.utils import vs_api_request
+from sv_mcp.tools.utils import vs_api_request, collect_pages
 
 
 class VirtualServiceTemplateManager:
@@ -24,10 +24,12 @@ class VirtualServiceTemplateManager:
             self.token,
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TEMPLATE_ENDPOINT}/{template_id}",
-            result_formatter=format_virtual_service_templates
+            result_formatter=format_virtual_service_templates,
+            cache_ttl=CACHE_TTL_TEMPLATES
         )
 
-    async def list(self, workspace_id: int, service_id: Optional[int], limit: int = 50, offset: int = 0) -> BaseResult:
+    async def list(self, workspace_id: int, service_id: Optional[int],
+                   limit: int = 50, offset: int = 0, cached: bool = True) -> BaseResult:
         params = {"limit": limit, "skip": offset}
         if service_id is not None:
             params["serviceId"] = service_id
@@ -36,9 +38,14 @@ class VirtualServiceTemplateManager:
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}/{VS_TEMPLATE_ENDPOINT}",
             result_formatter=format_virtual_service_templates,
-            params=params
+            params=params,
+            cache_ttl=CACHE_TTL_TEMPLATES if cached else None
         )
 
+    async def list_all(self, workspace_id: int, service_id: Optional[int], max_items: Optional[int] = None) -> BaseResult:
+        return await collect_pages(lambda limit, offset: self.list(workspace_id, service_id, limit, offset),
+                                   max_items)
+
     async def create(
             self,
             workspace_id: int,
@@ -174,6 +181,11 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                 Without this it will list all virtual service templates in the workspace.
                 limit (int, default=10, valid=[1 to 50]): The number of virtual service templates to list.
                 offset (int, default=0): Number of virtual service templates to skip.
+        - list_all: List all virtual service templates at once, reading every page.
+            args(dict): Dictionary with the following parameters:
+                workspace_id (int): Mandatory. The id of the workspace to list virtual service templates from.
+                serviceId (int): Optional. The id of the service to list virtual service templates from.
+                max_items (int, default=1000): Maximum number of virtual service templates to return.
         - create: Create a new virtual service template.
             args(VirtualService): A virtual service template object with the following fields:
                 workspace_id (int): Mandatory. The id of the workspace.
@@ -235,6 +247,12 @@ def register(mcp, token: Optional[BzmToken]) -> None:
                         args.get("limit", 50),
                         args.get("offset", 0),
                     )
+                case "list_all":
+                    return await vs_manager.list_all(
+                        args["workspace_id"],
+                        args.get("serviceId"),
+                        args.get("max_items"),
+                    )
                 case "create":
                     return await vs_manager.create(
                         args["workspace_id"],
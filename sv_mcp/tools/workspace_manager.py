@@ -1,3 +1,4 @@
+import asyncio
 import traceback
 from typing import Any, Dict, Optional
 
@@ -5,11 +6,12 @@ import httpx
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
-from sv_mcp.config.blazemeter import WORKSPACES_ENDPOINT, TOOLS_PREFIX
+from sv_mcp.config.blazemeter import WORKSPACES_ENDPOINT, TOOLS_PREFIX, CACHE_TTL_WORKSPACES
 from sv_mcp.config.token import BzmToken
 from sv_mcp.formatters.workspace import format_workspaces, format_workspaces_detailed
 from sv_mcp.models.result import BaseResult
 from sv_mcp.tools import bridge
+from sv_mcp.tools.cache import consent_cache
 from sv_mcp.tools.utils import bzm_api_request
 
 
@@ -24,30 +26,42 @@ class WorkspaceManager:
         self.ctx = ctx
 
     async def read(self, workspace_id: int) -> BaseResult:
-
-        workspace_result = await bzm_api_request(
+        workspace_request = bzm_api_request(
             self.token,
             "GET",
             f"{WORKSPACES_ENDPOINT}/{workspace_id}",
-            result_formatter=format_workspaces_detailed
+            result_formatter=format_workspaces_detailed,
+            cache_ttl=CACHE_TTL_WORKSPACES
         )
+        # When the account of the workspace is already known, check its consent at the same time
+        account_id = consent_cache.get_workspace_account(self.token, workspace_id) if self.token else None
+        if account_id is not None:
+            workspace_result, consent_error = await asyncio.gather(
+                workspace_request,
+                bridge.check_account_consent(self.token, self.ctx, account_id)
+            )
+        else:
+            workspace_result, consent_error = await workspace_request, None
         if workspace_result.error:
             return workspace_result
+        elif consent_error:
+            return consent_error
         else:
-            # Check if it's valid or allowed
-            account_result = await bridge.read_account(self.token, self.ctx,
-                                                       workspace_result.result[0].account_id)
-            if account_result.error:
-                return account_result
-            else:
-                return workspace_result
+            workspace_account_id = workspace_result.result[0].account_id
+            consent_cache.set_workspace_account(self.token, workspace_id, workspace_account_id)
+            if workspace_account_id != account_id:
+                # Check if it's valid or allowed
+                consent_error = await bridge.check_account_consent(self.token, self.ctx, workspace_account_id)
+                if consent_error:
+                    return consent_error
+            return workspace_result
 
     async def list(self, account_id: int, limit: int = 50, offset: int = 0) -> BaseResult:
 
         # Check if it's valid or allowed
-        account_data = await bridge.read_account(self.token, self.ctx, account_id)
-        if account_data.error:
-            return account_data
+        consent_error = await bridge.check_account_consent(self.token, self.ctx, account_id)
+        if consent_error:
+            return consent_error
 
         parameters = {
             "accountId": account_id,
@@ -0,0 +1,23 @@
+import httpx
+import pytest
+
+from sv_mcp.tools import utils
+from sv_mcp.tools.cache import ResponseCache
+
+from tests.helpers import BASE_URL
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    """
+    Install a handler(request) -> httpx.Response answering the API requests of the test, with an empty response
+    cache unless one is given. Returns the response cache in use.
+    """
+    def install(handler, cache=None):
+        client = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler))
+        cache = cache if cache is not None else ResponseCache(max_size=10)
+        monkeypatch.setattr(utils.api_clients, "get", lambda base_url: client)
+        monkeypatch.setattr(utils, "response_cache", cache)
+        return cache
+
+    return install
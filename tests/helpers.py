@@ -0,0 +1,16 @@
+"""
+Test data shared by the test modules.
+"""
+from sv_mcp.models.vs.http_transaction import HttpTransaction
+
+BASE_URL = "https://mock.blazemeter.com/api/v1"
+
+
+def http_transaction(transaction_id, method, url, matcher="equals_url", **request):
+    """
+    HTTP transaction matching the url with the given matcher, plus any other requestDsl fields.
+    """
+    dsl = {"requestDsl": {"method": method, "path": url,
+                          "url": {"key": "url", "matcherName": matcher, "matchingValue": url}, **request},
+           "responseDsl": {"status": 200}}
+    return HttpTransaction(id=transaction_id, name=f"t{transaction_id}", dsl=dsl)
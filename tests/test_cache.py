@@ -0,0 +1,254 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from sv_mcp.config.token import BzmToken
+from sv_mcp.tools import utils, account_manager
+from sv_mcp.tools.account_manager import AccountManager
+from sv_mcp.tools.cache import ConsentCache, ResponseCache, TTLCache, TemplateCache
+from sv_mcp.tools.vs import template_validation
+
+from tests.helpers import BASE_URL
+
+class TestTTLCache:
+
+    def test_hit_and_miss_counters(self):
+        cache = TTLCache(max_size=10)
+        assert cache.get("a") is None
+        cache.set("a", 1, ttl=60)
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entries_expire(self):
+        cache = TTLCache(max_size=10)
+        with patch("sv_mcp.tools.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1, ttl=5)
+        with patch("sv_mcp.tools.cache.time.monotonic", return_value=104.0):
+            assert cache.get("a") == 1
+        with patch("sv_mcp.tools.cache.time.monotonic", return_value=105.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(max_size=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_disabled_when_size_is_zero(self):
+        cache = TTLCache(max_size=0)
+        cache.set("a", 1, ttl=60)
+        assert cache.get("a") is None
+
+
+class TestResponseCache:
+
+    def test_key_normalizes_params_and_endpoint(self):
+        token = BzmToken("id", "secret")
+        first = ResponseCache.key(BASE_URL, token, "get", "workspaces/1/locations", {"skip": 0, "limit": 50})
+        second = ResponseCache.key(BASE_URL, token, "GET", "/workspaces/1/locations", {"limit": 50, "skip": 0})
+        assert first == second
+
+    def test_mutation_invalidates_collection(self):
+        token = BzmToken("id", "secret")
+        cache = ResponseCache(max_size=10)
+        list_key = ResponseCache.key(BASE_URL, token, "GET", "/workspaces/1/services", {"limit": 50})
+        item_key = ResponseCache.key(BASE_URL, token, "GET", "/workspaces/1/services/2")
+        other_key = ResponseCache.key(BASE_URL, token, "GET", "/workspaces/1/locations")
+        for key in (list_key, item_key, other_key):
+            cache.set(key, {}, ttl=60)
+        cache.invalidate_mutation(BASE_URL, token, "PUT", "/workspaces/1/services/2")
+        assert cache.get(list_key) is None
+        assert cache.get(item_key) is None
+        assert cache.get(other_key) == {}
+
+    def test_update_writes_entity_through_and_evicts_list(self):
+        token = BzmToken("id", "secret")
+        cache = ResponseCache(max_size=10)
+        read_key = ResponseCache.key(BASE_URL, token, "GET", "/workspaces/1/service-mocks/7")
+        list_key = ResponseCache.key(BASE_URL, token, "GET", "/workspaces/1/service-mocks", {"skip": 0})
+        cache.set(read_key, {"result": {"id": 7, "name": "old"}}, ttl=60)
+        cache.set(list_key, {"result": [{"id": 7, "name": "old"}]}, ttl=60)
+        cache.on_mutation(BASE_URL, token, "PATCH", "/workspaces/1/service-mocks/7",
+                          {"result": {"id": 7, "name": "new"}})
+        assert cache.get(read_key) == {"result": {"id": 7, "name": "new"}}
+        assert cache.get(list_key) is None
+
+    def test_create_writes_every_returned_entity_through(self):
+        token = BzmToken("id", "secret")
+        cache = ResponseCache(max_size=10)
+        cache.on_mutation(BASE_URL, token, "POST", "/workspaces/1/transactions",
+                          {"result": [{"id": 3}, {"id": 4}]})
+        assert cache.get(ResponseCache.key(BASE_URL, token, "GET", "/workspaces/1/transactions/3")) == \
+               {"result": {"id": 3}}
+        assert cache.get(ResponseCache.key(BASE_URL, token, "GET", "/workspaces/1/transactions/4")) == \
+               {"result": {"id": 4}}
+
+    def test_action_evicts_entity_read(self):
+        token = BzmToken("id", "secret")
+        cache = ResponseCache(max_size=10)
+        read_key = ResponseCache.key(BASE_URL, token, "GET", "/workspaces/1/service-mocks/7")
+        cache.set(read_key, {"result": {"id": 7, "status": "STOPPED"}}, ttl=60)
+        cache.on_mutation(BASE_URL, token, "GET", "/workspaces/1/service-mocks/7/deploy",
+                          {"result": {"trackingId": "abc"}})
+        assert cache.get(read_key) is None
+        assert len(cache) == 0
+
+
+class TestConsentCache:
+
+    def test_denied_consent_expires_sooner(self):
+        token = BzmToken("id", "secret")
+        cache = ConsentCache(max_size=10, granted_ttl=300, denied_ttl=30, workspace_ttl=300)
+        with patch("sv_mcp.tools.cache.time.monotonic", return_value=100.0):
+            cache.set_consent(token, 1, True)
+            cache.set_consent(token, 2, False)
+        with patch("sv_mcp.tools.cache.time.monotonic", return_value=200.0):
+            assert cache.get_consent(token, 1) is True
+            assert cache.get_consent(token, 2) is None
+
+    def test_shared_by_token_id(self):
+        cache = ConsentCache(max_size=10, granted_ttl=300, denied_ttl=30, workspace_ttl=300)
+        cache.set_workspace_account(BzmToken("id", "secret"), 5, 1)
+        assert cache.get_workspace_account(BzmToken("id", "secret"), 5) == 1
+        assert cache.get_workspace_account(BzmToken("other", "secret"), 5) is None
+
+    def test_consent_granted_after_a_denial_is_seen_once_the_denial_expires(self, mock_api):
+        consents = [False, True]
+
+        def handler(request):
+            return httpx.Response(200, json={"result": {"id": 1, "name": "a", "created": 0, "updated": 0,
+                                                             "aiConsent": consents.pop(0)}})
+
+        manager = AccountManager(BzmToken("id", "secret"), None)
+        cache = ConsentCache(max_size=10, granted_ttl=300, denied_ttl=30, workspace_ttl=300)
+        mock_api(handler)
+        with patch.object(account_manager, "consent_cache", cache):
+            with patch("sv_mcp.tools.cache.time.monotonic", return_value=100.0):
+                denied = asyncio.run(manager.check_consent(1))
+            with patch("sv_mcp.tools.cache.time.monotonic", return_value=140.0):
+                granted = asyncio.run(manager.check_consent(1))
+
+        assert denied.error is not None
+        assert granted is None
+        assert consents == []
+
+    def test_read_after_a_revoke_is_not_served_from_the_response_cache(self, mock_api):
+        consents = [True, False]
+
+        def handler(request):
+            return httpx.Response(200, json={"result": {"id": 1, "name": "a", "created": 0, "updated": 0,
+                                                             "aiConsent": consents.pop(0)}})
+
+        token = BzmToken("id", "secret")
+        cache = ConsentCache(max_size=10, granted_ttl=300, denied_ttl=30, workspace_ttl=300)
+        mock_api(handler)
+        with patch.object(account_manager, "consent_cache", cache):
+            granted = asyncio.run(AccountManager(token, None).read(1))
+            revoked = asyncio.run(AccountManager(token, None).read(1))
+
+        assert granted.error is None
+        assert revoked.error is not None
+        assert cache.get_consent(token, 1) is False
+
+
+class TestApiRequestCache:
+
+    def test_get_with_cache_ttl_is_served_from_cache(self, mock_api):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if request.method == "GET":
+                return httpx.Response(200, json={"result": [{"id": len(calls)}], "total": 1})
+            return httpx.Response(200, json={"result": {"id": 1}})
+
+        token = BzmToken("id", "secret")
+        cache = ResponseCache(max_size=10)
+
+        async def scenario():
+            first = await utils._api_request(BASE_URL, token, "GET", "/workspaces/1/service-mock-configurations",
+                                             cache_ttl=60)
+            second = await utils._api_request(BASE_URL, token, "GET", "/workspaces/1/service-mock-configurations",
+                                              cache_ttl=60)
+            await utils._api_request(BASE_URL, token, "POST", "/workspaces/1/service-mock-configurations",
+                                     json={"name": "new"})
+            third = await utils._api_request(BASE_URL, token, "GET", "/workspaces/1/service-mock-configurations",
+                                             cache_ttl=60)
+            return first, second, third
+
+        mock_api(handler, cache)
+        first, second, third = asyncio.run(scenario())
+
+        assert first.result == second.result == [{"id": 1}]
+        assert third.result == [{"id": 3}]
+        assert len(calls) == 3
+        assert cache.stats()["hits"] == 1
+
+
+class TestTemplateCache:
+
+    def test_persists_entries_in_recency_order(self, tmp_path):
+        path = str(tmp_path / "templates.json")
+        cache = TemplateCache(max_size=2, path=path)
+        cache.set("a", [1])
+        cache.set("b", [2])
+        cache.get("a")
+        cache.set("c", [3])
+
+        reloaded = TemplateCache(max_size=2, path=path)
+        assert reloaded.get("b") is None
+        assert (reloaded.get("a"), reloaded.get("c")) == ([1], [3])
+
+    def test_writes_changes_made_in_a_loop_together_in_the_background(self, tmp_path):
+        path = tmp_path / "templates.json"
+        writes = []
+        cache = TemplateCache(max_size=10, path=str(path), save_delay=0.01)
+        write = cache._write
+        cache._write = lambda entries, version: writes.append(version) or write(entries, version)
+
+        async def scenario():
+            for name in ("a", "b", "c"):
+                cache.set(name, [name])
+            assert not path.exists()
+            await asyncio.sleep(0.05)
+            cache.set("d", ["d"])
+
+        asyncio.run(scenario())
+        assert writes == [3]
+        cache.flush()
+        assert writes == [3, 4]
+        assert TemplateCache(max_size=10, path=str(path)).get("d") == ["d"]
+
+    def test_each_template_and_encode_flag_is_sent_once(self, mock_api):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"result": {"valid": True, "message": request.url.query.decode()}})
+
+        token = BzmToken("id", "secret")
+
+        async def scenario():
+            requests = [template_validation.template_request(token, "/convert", "{{now}}", {"encode": encode})
+                        for encode in (True, True, False)]
+            return await asyncio.gather(*requests, template_validation.template_request(
+                token, "/convert", "{{now}}", {"encode": True}))
+
+        mock_api(handler)
+        with patch.object(template_validation, "template_cache", TemplateCache(max_size=10)):
+            results = asyncio.run(scenario())
+            cached = asyncio.run(template_validation.template_request(token, "/convert", "{{now}}",
+                                                                      {"encode": False}))
+
+        assert len(calls) == 2
+        assert [result.result[0].message for result in results] == ["encode=true", "encode=true", "encode=false",
+                                                                     "encode=true"]
+        assert cached.result[0].message == "encode=false"
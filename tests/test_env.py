@@ -0,0 +1,18 @@
+from sv_mcp.config.env import env_int, env_float
+
+
+class TestEnvSettings:
+
+    def test_defaults_when_unset_or_not_a_number(self, monkeypatch):
+        monkeypatch.delenv("SV_TEST_SETTING", raising=False)
+        assert env_int("SV_TEST_SETTING", 8) == 8
+        monkeypatch.setenv("SV_TEST_SETTING", "eight")
+        assert env_int("SV_TEST_SETTING", 8) == 8
+        assert env_float("SV_TEST_SETTING", 1.5) == 1.5
+
+    def test_values_below_the_minimum_are_raised(self, monkeypatch):
+        monkeypatch.setenv("SV_TEST_SETTING", "0")
+        assert env_int("SV_TEST_SETTING", 8) == 1
+        assert env_int("SV_TEST_SETTING", 8, minimum=0) == 0
+        monkeypatch.setenv("SV_TEST_SETTING", " -2.5 ")
+        assert env_float("SV_TEST_SETTING", 1.0) == 0.0
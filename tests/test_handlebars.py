@@ -0,0 +1,58 @@
+import asyncio
+
+from sv_mcp.analysis.handlebars import check_template
+from sv_mcp.config.token import BzmToken
+from sv_mcp.tools.vs.template_validation import template_request
+
+CONDITIONAL = """{{#assign 'price'}}{{jsonPath request.body '$.price'}}{{/assign}}
+{{#eq request.headers.STATUS 'missing'}}
+  { "error": "User not found" }
+{{else}}
+  { "id": {{request.path.1}}, "price": {{price}}, "tags": [{{#each (range 1 3) as |i|}}"{{i}}"{{/each}}] }
+{{/eq}}"""
+
+
+class TestHandlebarsCheck:
+
+    def test_accepts_documented_syntax(self):
+        check = check_template(CONDITIONAL)
+        assert check.valid
+        assert check.warnings == []
+
+    def test_reports_block_errors_with_position(self):
+        check = check_template("{\n  {{#eq a 'x'}}1{{else}}2{{else}}3{{/each}}\n  {{/else}}\n}")
+        assert [str(error) for error in check.errors] == [
+            "Line 2, column 35: {{/each}} closes {{#eq}} opened at line 2",
+            "Line 3, column 3: {{/else}} is not valid, {{else}} has no closing tag",
+            "Line 2, column 3: {{#eq}} is never closed with {{/eq}}",
+        ]
+        assert [str(warning) for warning in check.warnings] == [
+            "Line 2, column 26: More than one {{else}} in {{#eq}}",
+        ]
+
+    def test_accepts_inverse_shorthand_and_partial_blocks(self):
+        for template in ("{{#if a}}x{{^}}y{{/if}}", "{{#> layout}}<p>{{title}}</p>{{/layout}}",
+                         "{{#*inline \"row\"}}{{name}}{{/inline}}{{> row}}"):
+            check = check_template(template)
+            assert check.valid, template
+            assert check.warnings == [], template
+
+    def test_loops_are_checked_as_rendered_zero_times(self):
+        check = check_template("[{{#each xs}}{{this}}{{#unless @last}},{{/unless}}{{/each}}]")
+        assert check.valid
+        assert check.warnings == []
+        check = check_template('{"items": {{#each xs}}[{{this}}]{{else}}[,]{{/each}}}')
+        assert [warning.message for warning in check.warnings] == [
+            "Not valid JSON outside helpers: Expecting value"]
+
+    def test_warnings_do_not_block_and_errors_skip_the_request(self):
+        check = check_template('{"total": {{sum a b}} "items": []}')
+        assert check.valid
+        assert [str(warning) for warning in check.warnings] == [
+            "Line 1, column 11: Unknown helper 'sum'",
+            "Line 1, column 23: Not valid JSON outside helpers: Expecting ',' delimiter",
+        ]
+
+        result = asyncio.run(template_request(BzmToken("id", "secret"), "/validate", "{{#if a}}{{upper a}"))
+        assert result.result[0].valid is False
+        assert result.result[0].message == "Line 1, column 10: Tag is never closed with }}"
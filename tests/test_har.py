@@ -0,0 +1,93 @@
+import asyncio
+import base64
+import io
+import json
+
+import httpx
+import pytest
+
+from sv_mcp.config.token import BzmToken
+from sv_mcp.converters.har import HarReader, JsonArrayStream
+from sv_mcp.tools.vs.http_transaction_manager import HttpTransactionManager
+
+def _entry(method, url, status=200, body=None, text='{"ok": true}'):
+    request = {"method": method, "url": url, "headers": []}
+    if body is not None:
+        request["postData"] = {"mimeType": "application/json", "text": body}
+    return {"request": request, "response": {
+        "status": status,
+        "headers": [{"name": "Content-Type", "value": "application/json"}, {"name": "Content-Length", "value": "12"}],
+        "content": {"mimeType": "application/json", "text": text},
+    }}
+
+
+def _write_har(tmp_path, entries):
+    path = tmp_path / "recording.har"
+    path.write_text(json.dumps({"log": {"version": "1.2", "pages": [], "entries": entries}}))
+    return str(path)
+
+
+class TestHarReader:
+
+    def test_streams_items_split_across_chunks(self):
+        document = json.dumps({"log": {"creator": {"name": "entries"}, "entries": [{"id": i} for i in range(20)]}})
+        stream = JsonArrayStream(io.BytesIO(document.encode("utf-8")), "entries", chunk_size=5)
+        assert [item["id"] for item in stream] == list(range(20))
+
+    def test_decodes_each_item_once_and_bounds_the_buffer(self):
+        items = [{"s": 'a"}{[ \\', "n": [1, {"x": "\\\""}]}, "text ]", 12, None, {"body": "x" * 1000}]
+        document = json.dumps({"entries": items}).encode("utf-8")
+        stream = JsonArrayStream(io.BytesIO(document), "entries", chunk_size=7)
+        decode = stream.decoder.raw_decode
+        calls = []
+        stream.decoder.raw_decode = lambda text, *args: calls.append(text) or decode(text, *args)
+
+        assert list(stream) == items
+        assert len(calls) == len(items)
+
+        unterminated = JsonArrayStream(io.BytesIO(b'{"entries": [{"body": "' + b"x" * 5000), "entries",
+                                       chunk_size=100, max_item_size=1000)
+        with pytest.raises(ValueError, match="larger than 1000"):
+            list(unterminated)
+
+    def test_deduplicates_requests_and_skips_unusable_entries(self, tmp_path):
+        path = _write_har(tmp_path, [
+            _entry("GET", "https://shop.example.com/orders?page=1"),
+            _entry("GET", "https://shop.example.com/orders?page=1"),
+            _entry("GET", "https://shop.example.com/orders?page=2"),
+            _entry("POST", "https://shop.example.com/orders", 201, body='{"item": 1}'),
+            _entry("GET", "data:image/png;base64,AAAA"),
+        ])
+        reader = HarReader(path)
+        transactions = list(reader)
+
+        assert [t["name"] for t in transactions] == ["GET /orders", "GET /orders (2)", "POST /orders"]
+        assert (reader.entries, reader.duplicates, reader.skipped) == (5, 1, 1)
+        dsl = transactions[2]["dsl"]
+        assert dsl.requestDsl.body[0].matcherName == "equals_json"
+        assert base64.b64decode(dsl.responseDsl.content) == b'{"ok": true}'
+        assert [header.name for header in dsl.responseDsl.headers] == ["Content-Type"]
+
+
+class TestImportHar:
+
+    def test_uploads_transactions_in_batches(self, mock_api, tmp_path):
+        path = _write_har(tmp_path, [_entry("GET", f"https://shop.example.com/items/{i}") for i in range(5)])
+        requests = []
+
+        def handler(request):
+            transactions = json.loads(request.content)["transactions"]
+            requests.append(transactions)
+            return httpx.Response(200, json={"result": [
+                {"id": index, "name": t["name"], "serviceId": t["serviceId"], "dsl": t["dsl"]}
+                for index, t in enumerate(transactions)]})
+
+        manager = HttpTransactionManager(BzmToken("id", "secret"), None)
+        mock_api(handler)
+        result = asyncio.run(manager.import_har(1, 9, path, batch_size=2))
+
+        assert result.error is None
+        assert result.result[0].created == 5
+        assert sorted(len(batch) for batch in requests) == [1, 2, 2]
+        url = requests[0][0]["dsl"]["requestDsl"]["url"]
+        assert (url["key"], url["matchingValue"]) == ("url", "/items/0")
@@ -0,0 +1,84 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+from sv_mcp.config.token import BzmToken
+from sv_mcp.models.result import BaseResult
+from sv_mcp.models.vs.configuration import Configuration
+from sv_mcp.models.vs.http_transaction import HttpTransaction
+from sv_mcp.models.vs.service import Service
+from sv_mcp.models.vs.virtual_service import VirtualService
+from sv_mcp.tools.vs.manifest_manager import ManifestManager, load_manifest
+
+ORDERS_DSL = {"requestDsl": {"method": "GET", "path": "/orders"}, "responseDsl": {"status": 200}}
+
+MANIFEST = """
+{
+  "services": [{"name": "shop"}],
+  "configurations": [{"name": "staging", "values": {"host": "example.com"}}],
+  "transactions": [
+    {"name": "orders", "service": "shop", "dsl": %s},
+    {"name": "users", "service": "shop", "dsl": {"requestDsl": {"method": "GET", "path": "/users"},
+                                                  "responseDsl": {"status": 200}}}
+  ],
+  "virtual_services": [{"name": "shop-vs", "service": "shop", "harborId": "h", "shipId": "s",
+                        "transactions": ["orders", {"name": "users", "priority": 5}], "configuration": "staging"}]
+}
+""" % json.dumps(ORDERS_DSL)
+
+
+def _virtual_service(**fields):
+    return VirtualService(id=4, name="shop-vs", serviceId=1, type="TRANSACTIONAL", harborId="h", shipId="s",
+                          configurationId=2, noMatchingRequestPreference="return404", endpointPreference="HTTPS",
+                          **fields)
+
+
+def _manager():
+    manager = ManifestManager(BzmToken("id", "secret"), None)
+    manager.services.list_all = AsyncMock(return_value=BaseResult(result=[Service(id=1, name="shop")]))
+    manager.configurations.list_all = AsyncMock(return_value=BaseResult(result=[
+        Configuration(id=2, name="staging", configurationMap={"host": "example.com"})]))
+    manager.http_transactions.list_all = AsyncMock(return_value=BaseResult(result=[
+        HttpTransaction(id=3, name="orders", serviceId=1, dsl=ORDERS_DSL)]))
+    manager.messaging_transactions.list_all = AsyncMock(return_value=BaseResult(result=[]))
+    manager.templates.list_all = AsyncMock(return_value=BaseResult(result=[]))
+    manager.virtual_services.list_all = AsyncMock(return_value=BaseResult(result=[
+        _virtual_service(mockServiceTransactions=[{"txnId": 3, "priority": 10}])]))
+    return manager
+
+
+class TestManifest:
+
+    def test_plan_only_reports_differences(self):
+        result = asyncio.run(_manager().plan(1, load_manifest(MANIFEST)))
+        actions = {step.name: (step.action, step.changes) for step in result.result}
+        assert actions == {
+            "shop": ("unchanged", None),
+            "staging": ("unchanged", None),
+            "shop/orders": ("unchanged", None),
+            "shop/users": ("create", None),
+            "shop/shop-vs": ("update", ["transactions"]),
+        }
+        assert result.info == ["1 to create, 1 to update, 3 unchanged"]
+
+    def test_apply_uses_ids_created_in_previous_layers(self):
+        manager = _manager()
+        manager.http_transactions.create = AsyncMock(return_value=BaseResult(result=[
+            HttpTransaction(id=5, name="users", serviceId=1, dsl=ORDERS_DSL)]))
+        manager.virtual_services.update = AsyncMock(return_value=BaseResult(result=[
+            _virtual_service()]))
+        result = asyncio.run(manager.apply(1, load_manifest(MANIFEST)))
+        assert result.error is None
+        assert manager.http_transactions.create.await_count == 1
+        transactions = manager.virtual_services.update.await_args.args[-1]
+        assert transactions == [{"txnId": 3, "priority": 10}, {"txnId": 5, "priority": 5}]
+
+    def test_failed_dependency_skips_dependents(self):
+        manager = _manager()
+        manager.http_transactions.create = AsyncMock(return_value=BaseResult(error="Bad DSL"))
+        manager.virtual_services.update = AsyncMock()
+        result = asyncio.run(manager.apply(1, load_manifest(MANIFEST)))
+        errors = {step.name: step.error for step in result.result if step.error}
+        assert errors["shop/users"] == "Bad DSL"
+        assert "shop/shop-vs" in errors
+        manager.virtual_services.update.assert_not_awaited()
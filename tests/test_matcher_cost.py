@@ -0,0 +1,43 @@
+import base64
+
+from sv_mcp.analysis import regex
+from sv_mcp.analysis.matcher_cost import lint_transactions
+
+from tests.helpers import http_transaction
+
+
+class TestBacktrackingRisks:
+
+    def test_flags_catastrophic_patterns(self):
+        for pattern in (r"(a+)+$", r"(\w+\s?)*$", r"(a|aa)+$", r"(\d+|\w+)*!"):
+            assert any(catastrophic for _, catastrophic in regex.backtracking_risks(regex.parse(pattern))), pattern
+
+    def test_accepts_linear_patterns(self):
+        for pattern in (r"^/orders/[^/]+(\?.*)?$", r"(\d{3}-)+", r"(a|ab)*c", r"(a?b)+", r"[a-z]+@[a-z]+\.com"):
+            assert regex.backtracking_risks(regex.parse(pattern)) == [], pattern
+
+
+class TestMatcherLint:
+
+    def test_reports_errors_first_and_suggests_cheaper_matchers(self):
+        headers = [
+            {"key": "Accept", "matcherName": "matches", "matchingValue": "application/json"},
+            {"key": "Authorization", "matcherName": "matches", "matchingValue": "(?i)bearer"},
+            {"key": "User-Agent", "matcherName": "matches", "matchingValue": ".*Mobile.*"},
+            {"key": "X-Id", "matcherName": "matches", "matchingValue": "[0-9]+"},
+        ]
+        body = [{"key": "body", "matcherName": "matches_json",
+                 "matchingValue": base64.b64encode(b"$..id").decode()}]
+        lints = lint_transactions([
+            http_transaction(1, "GET", "/orders/[0-9]+", "matches_url", headers=headers, body=body),
+            http_transaction(2, "GET", "/search/(\\w+\\s?)*$", "matches_url"),
+        ])
+
+        assert lints[0].transactionId == 2 and lints[0].severity == "error"
+        assert {(lint.key, lint.suggestion) for lint in lints if lint.suggestion} == {
+            ("Accept", "equals with value 'application/json'"),
+            ("Authorization", "equals_insensitive with value 'bearer'"),
+            ("User-Agent", "contains with value 'Mobile'"),
+        }
+        assert [lint.severity for lint in lints if lint.field == "body"] == ["warning"]
+        assert all(lint.key != "X-Id" for lint in lints)
@@ -0,0 +1,63 @@
+import base64
+
+from sv_mcp.analysis.matching import RequestMatcher, json_path
+from sv_mcp.models.vs.sandbox_request import SandboxRequest
+
+from tests.helpers import http_transaction
+
+
+def _encode(text):
+    return base64.b64encode(text.encode("utf-8")).decode("utf-8")
+
+
+def _request(method, path, content=None, **fields):
+    return SandboxRequest(method=method, path=path, name="shop",
+                          content=_encode(content) if content else None, **fields)
+
+
+ORDER_BY_ID = http_transaction(1, "GET", "/orders/[0-9]+", "matches_url")
+ANY_ORDER = http_transaction(2, "GET", "/orders/.*", "matches_url")
+CREATE_ORDER = http_transaction(3, "POST", "/orders", body=[
+    {"key": "body", "matcherName": "equals_json", "matchingValue": _encode('{"item": 1, "size": "L"}')}],
+    headers=[{"key": "X-Tenant", "matcherName": "equals", "matchingValue": "acme", "optional": True}])
+FILTERED = http_transaction(4, "POST", "/orders", body=[
+    {"key": "body", "matcherName": "matches_json", "matchingValue": _encode("$.items[?(@.qty > 1)]")}])
+
+
+class TestRequestMatcher:
+
+    def test_priority_decides_between_overlapping_transactions(self):
+        matcher = RequestMatcher([(ANY_ORDER, 10), (ORDER_BY_ID, 10)])
+        assert matcher.match(_request("GET", "/orders/7?expand=true")).transactionId == 2
+
+        matcher = RequestMatcher([(ANY_ORDER, 10), (ORDER_BY_ID, 1)])
+        result = matcher.match(_request("GET", "/orders/7"))
+        assert (result.transactionId, result.priority, result.certain) == (1, 1, True)
+        assert [m.outcome for m in result.matchers] == ["match", "match"]
+
+    def test_body_and_optional_header_matchers(self):
+        matcher = RequestMatcher([(FILTERED, 1), (CREATE_ORDER, 5)])
+
+        uncertain = matcher.match(_request("POST", "/orders", '{"items": []}'))
+        assert (uncertain.transactionId, uncertain.certain) == (4, False)
+
+        matcher = RequestMatcher([(CREATE_ORDER, 5)])
+        assert matcher.match(_request("POST", "/orders", '{"size": "L", "item": 1}')).transactionId == 3
+        wrong_tenant = matcher.match(_request("POST", "/orders", '{"size": "L", "item": 1}',
+                                              headers=[{"name": "x-tenant", "value": "other"}]))
+        assert wrong_tenant.transactionId is None
+        assert wrong_tenant.closestTransactionId == 3
+        assert [(m.field, m.outcome) for m in wrong_tenant.matchers] == [
+            ("method", "match"), ("url", "match"), ("header", "no_match"), ("body", "match")]
+
+    def test_invalid_regular_expression_is_reported(self):
+        matcher = RequestMatcher([(http_transaction(5, "GET", "/orders/(", "matches_url"), 1)])
+        result = matcher.match(_request("GET", "/orders/7"))
+        assert (result.transactionId, result.certain) == (5, False)
+        assert result.matchers[1].detail.startswith("Invalid regular expression: missing )")
+
+    def test_json_path_subset(self):
+        document = {"order": {"lines": [{"sku": "a"}, {"sku": "b"}]}}
+        assert json_path(document, "$.order.lines[1].sku") == ["b"]
+        assert json_path(document, "$..sku") == ["a", "b"]
+        assert json_path(document, "$.order.missing") == []
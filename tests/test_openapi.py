@@ -0,0 +1,72 @@
+import base64
+import json
+
+import pytest
+
+from sv_mcp.converters.openapi import OpenApiReader, example_from_schema
+
+SPEC = {
+    "openapi": "3.0.3",
+    "servers": [{"url": "https://api.example.com/v1"}],
+    "components": {"schemas": {"Pet": {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "name": {"type": "string", "example": "Rex"},
+                       "born": {"type": "string", "format": "date"}},
+    }}},
+    "paths": {
+        "/pets": {"get": {
+            "operationId": "listPets",
+            "responses": {"200": {"content": {"application/json": {
+                "schema": {"type": "array", "items": {"$ref": "#/components/schemas/Pet"}}}}}},
+        }},
+        "/pets/{petId}": {"get": {
+            "responses": {
+                "200": {"content": {"application/json": {"examples": {
+                    "dog": {"value": {"id": 1, "name": "Rex"}},
+                    "cat": {"value": {"id": 2, "name": "Tom"}},
+                }}}},
+                "404": {"description": "Not found"},
+                "default": {"description": "Error"},
+            },
+        }},
+    },
+}
+
+
+class TestOpenApiReader:
+
+    def test_generates_a_transaction_per_operation(self):
+        reader = OpenApiReader(json.dumps(SPEC))
+        transactions = {t["name"]: t["dsl"] for t in reader}
+
+        assert list(transactions) == ["listPets 200", "GET /v1/pets/{petId} 200"]
+        assert (reader.entries, reader.duplicates, reader.skipped, reader.unreachable) == (5, 2, 1, 0)
+        pets = transactions["listPets 200"]
+        assert (pets.requestDsl.url.matcherName, pets.requestDsl.url.matchingValue) == ("equals_url", "/v1/pets")
+        assert json.loads(base64.b64decode(pets.responseDsl.content)) == [{"id": 0, "name": "Rex", "born": "2024-01-01"}]
+        by_id = transactions["GET /v1/pets/{petId} 200"]
+        assert by_id.requestDsl.url.matcherName == "matches_url"
+        assert by_id.requestDsl.url.matchingValue == "^/v1/pets/[^/]+(\\?.*)?$"
+        assert json.loads(base64.b64decode(by_id.responseDsl.content)) == {"id": 1, "name": "Rex"}
+
+    def test_all_responses_reports_the_unreachable_ones(self):
+        reader = OpenApiReader(json.dumps(SPEC), all_responses=True)
+        transactions = {t["name"]: t["dsl"] for t in reader}
+
+        assert list(transactions) == ["listPets 200", "GET /v1/pets/{petId} 200 dog", "GET /v1/pets/{petId} 200 cat",
+                                      "GET /v1/pets/{petId} 404"]
+        assert (reader.entries, reader.duplicates, reader.skipped, reader.unreachable) == (5, 0, 1, 2)
+        assert transactions["GET /v1/pets/{petId} 404"].responseDsl.content is None
+
+    def test_rejects_swagger_2(self):
+        with pytest.raises(ValueError):
+            OpenApiReader(json.dumps({"swagger": "2.0", "paths": {}}))
+
+    def test_recursive_schemas_stop(self):
+        spec = {"components": {"schemas": {"Node": {
+            "type": "object", "properties": {"child": {"$ref": "#/components/schemas/Node"}}}}}}
+        example = example_from_schema(spec, {"$ref": "#/components/schemas/Node"})
+        depth = 0
+        while isinstance(example, dict) and example.get("child") is not None:
+            example, depth = example["child"], depth + 1
+        assert depth <= 7
@@ -0,0 +1,65 @@
+import asyncio
+
+from sv_mcp.models.result import BaseResult
+from sv_mcp.tools.utils import collect_pages, iterate_pages
+
+
+def _pages(total, report_total=True, fail_at=None):
+    calls = []
+    in_flight = {"now": 0, "max": 0}
+
+    async def fetch_page(limit, offset):
+        calls.append(offset)
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        # Later pages answer first, order must be kept anyway
+        await asyncio.sleep(0.001 * (10 - offset // limit % 10))
+        in_flight["now"] -= 1
+        if offset == fail_at:
+            return BaseResult(error="boom")
+        items = list(range(offset, min(offset + limit, total)))
+        return BaseResult(result=items, total=total if report_total else len(items))
+
+    return fetch_page, calls, in_flight
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestIteratePages:
+
+    def test_yields_every_item_in_order(self):
+        fetch_page, calls, in_flight = _pages(230)
+        items = asyncio.run(_collect(iterate_pages(fetch_page, page_size=50, concurrency=2)))
+        assert items == list(range(230))
+        assert sorted(calls) == [0, 50, 100, 150, 200]
+        assert in_flight["max"] == 2
+
+    def test_stops_at_max_items(self):
+        fetch_page, calls, _ = _pages(230)
+        items = asyncio.run(_collect(iterate_pages(fetch_page, max_items=70, page_size=50)))
+        assert items == list(range(70))
+        assert sorted(calls) == [0, 50]
+
+    def test_without_total_reads_until_short_page(self):
+        fetch_page, calls, _ = _pages(120, report_total=False)
+        items = asyncio.run(_collect(iterate_pages(fetch_page, page_size=50)))
+        assert items == list(range(120))
+        assert calls == [0, 50, 100]
+
+
+class TestCollectPages:
+
+    def test_has_more_when_cut(self):
+        fetch_page, _, _ = _pages(230)
+        result = asyncio.run(collect_pages(fetch_page, max_items=100))
+        assert result.result == list(range(100))
+        assert result.total == 230
+        assert result.has_more
+
+    def test_page_error_keeps_items_read(self):
+        fetch_page, _, _ = _pages(230, fail_at=100)
+        result = asyncio.run(collect_pages(fetch_page, max_items=1000))
+        assert result.error == "boom"
+        assert result.result == list(range(100))
@@ -0,0 +1,220 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from sv_mcp.tools import utils
+from sv_mcp.tools.utils import RetryBudget, RetryPolicy, parse_retry_after
+
+from tests.helpers import BASE_URL
+
+
+def _policy(max_retries=3, reserve=10.0):
+    return RetryPolicy(max_retries=max_retries, base_delay=0.0, max_delay=5.0,
+                       budget=RetryBudget(ratio=0.2, reserve=reserve))
+
+
+def _status_error(status_code, headers=None):
+    request = httpx.Request("GET", f"{BASE_URL}/services")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestRetryBudget:
+
+    def test_withdraw_until_empty(self):
+        budget = RetryBudget(ratio=0.5, reserve=2.0)
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+    def test_deposit_refills_up_to_reserve(self):
+        budget = RetryBudget(ratio=0.5, reserve=1.0)
+        assert budget.withdraw()
+        budget.deposit()
+        assert not budget.withdraw()
+        budget.deposit()
+        assert budget.withdraw()
+        for _ in range(10):
+            budget.deposit()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+
+class TestRetryPolicy:
+
+    def test_idempotency_rules(self):
+        policy = _policy()
+        assert policy.is_idempotent("GET", "/workspaces/1/services", None)
+        assert policy.is_idempotent("PATCH", "/workspaces/1/service-mocks/2", None)
+        assert policy.is_idempotent("PUT", "/workspaces/1/transactions/2", None)
+        assert not policy.is_idempotent("POST", "/workspaces/1/transactions", None)
+        assert policy.is_idempotent("POST", "/workspaces/1/transactions", "key-1")
+        assert not policy.is_idempotent("GET", "/workspaces/1/service-mocks/2/deploy", None)
+
+    def test_retryable_status_codes(self):
+        policy = _policy()
+        assert policy.should_retry(0, True, _status_error(503))
+        assert policy.should_retry(0, True, _status_error(429))
+        assert not policy.should_retry(0, True, _status_error(500))
+        assert not policy.should_retry(0, False, _status_error(502))
+
+    def test_connect_errors_always_retried(self):
+        policy = _policy()
+        assert policy.should_retry(0, False, httpx.ConnectError("refused"))
+        assert not policy.should_retry(0, False, httpx.ReadTimeout("timeout"))
+        assert policy.should_retry(0, True, httpx.ReadTimeout("timeout"))
+
+    def test_max_retries_and_budget(self):
+        assert not _policy(max_retries=2).should_retry(2, True, _status_error(503))
+        policy = _policy(reserve=1.0)
+        assert policy.should_retry(0, True, _status_error(503))
+        assert not policy.should_retry(1, True, _status_error(503))
+
+    def test_backoff_honors_retry_after(self):
+        policy = _policy()
+        response = httpx.Response(429, headers={"Retry-After": "2"})
+        assert policy.backoff(0, response) == 2.0
+        assert policy.backoff(0, httpx.Response(429, headers={"Retry-After": "60"})) is None
+
+    def test_backoff_full_jitter(self):
+        policy = RetryPolicy(max_retries=3, base_delay=1.0, max_delay=3.0, budget=RetryBudget(0.2, 10.0))
+        for attempt in range(5):
+            assert 0 <= policy.backoff(attempt) <= min(3.0, 2 ** attempt)
+
+
+class TestParseRetryAfter:
+
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date_in_the_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestApiRequestRetries:
+
+    def _run(self, mock_api, handler, method="GET", **kwargs):
+        token = utils.BzmToken("id", "secret")
+        mock_api(handler)
+        with patch.object(utils, "api_retry_policy", _policy()):
+            return asyncio.run(utils._api_request(BASE_URL, token, method,
+                                                  "/services", **kwargs))
+
+    def test_retries_until_success(self, mock_api):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503, json={"error": "unavailable"})
+            return httpx.Response(200, json={"result": [{"id": 1}], "total": 1})
+
+        result = self._run(mock_api, handler)
+        assert result.error is None
+        assert result.result == [{"id": 1}]
+        assert len(calls) == 3
+
+    def test_post_without_key_is_not_retried(self, mock_api):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(502, json={"error": "bad gateway"})
+
+        result = self._run(mock_api, handler, method="POST")
+        assert result.error == "bad gateway"
+        assert len(calls) == 1
+
+    def test_post_with_key_is_retried(self, mock_api):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(502, text="bad gateway")
+            return httpx.Response(200, json={"result": {"id": 2}})
+
+        result = self._run(mock_api, handler, method="POST", idempotency_key="abc")
+        assert result.result == [{"id": 2}]
+        assert calls[1].headers["Idempotency-Key"] == "abc"
+
+    def test_transport_error_returns_error(self, mock_api):
+        def handler(request):
+            raise httpx.ConnectError("connection refused")
+
+        result = self._run(mock_api, handler)
+        assert "ConnectError" in result.error
+
+
+class TestSingleFlight:
+
+    def test_identical_gets_share_one_request(self, mock_api):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"result": {"id": 1, "status": "RUNNING"}})
+
+        token = utils.BzmToken("id", "secret")
+        in_flight = utils.SingleFlight()
+
+        async def scenario():
+            requests = [utils._api_request(BASE_URL, token, "GET", "/trackings/1")
+                        for _ in range(3)]
+            requests.append(utils._api_request(BASE_URL, token, "GET", "/trackings/2"))
+            return await asyncio.gather(*requests)
+
+        mock_api(handler)
+        with patch.object(utils, "api_in_flight", in_flight):
+            results = asyncio.run(scenario())
+
+        assert len(calls) == 2
+        assert results[0].result == results[1].result == results[2].result
+        assert results[0].result is not results[1].result
+        assert in_flight.stats() == {"in_flight": 0, "calls": 2, "collapsed": 2}
+
+    def test_coalesced_error_results_are_copied_for_every_caller(self, mock_api):
+        def handler(request):
+            return httpx.Response(404, json={"error": "not found"})
+
+        token = utils.BzmToken("id", "secret")
+
+        async def scenario():
+            async def read():
+                result = await utils._api_request(BASE_URL, token, "GET", "/trackings/1")
+                result.append_warnings(["checked"])
+                return result
+            return await asyncio.gather(*[read() for _ in range(3)])
+
+        mock_api(handler)
+        with patch.object(utils, "api_in_flight", utils.SingleFlight()), \
+                patch.object(utils, "api_retry_policy", _policy(max_retries=0)):
+            results = asyncio.run(scenario())
+
+        assert [result.warning for result in results] == [["checked"]] * 3
+
+    def test_side_effect_gets_are_not_shared(self, mock_api):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"result": {"trackingId": "abc"}})
+
+        token = utils.BzmToken("id", "secret")
+
+        async def scenario():
+            return await asyncio.gather(*[
+                utils._api_request(BASE_URL, token, "GET",
+                                   "/workspaces/1/service-mocks/2/deploy") for _ in range(2)
+            ])
+
+        mock_api(handler)
+        with patch.object(utils, "api_in_flight", utils.SingleFlight()):
+            asyncio.run(scenario())
+
+        assert len(calls) == 2
@@ -0,0 +1,51 @@
+from sv_mcp.analysis import routes
+from sv_mcp.analysis.routes import analyze_routes
+
+from tests.helpers import http_transaction
+
+
+class TestRouteAnalysis:
+
+    def test_reports_duplicates_shadowed_and_ambiguous(self):
+        findings = analyze_routes([
+            (http_transaction(1, "GET", "/orders/.*", "matches_url"), 1),
+            (http_transaction(2, "GET", "/orders/[0-9]+", "matches_url"), 5),
+            (http_transaction(3, "GET", "/orders/7"), 5),
+            (http_transaction(4, "GET", "/orders/7"), 5),
+            (http_transaction(5, "POST", "/orders/7"), 5),
+            (http_transaction(6, "GET", "/users/[a-z]+", "matches_url"), 10),
+            (http_transaction(7, "GET", "/users/[a-m0-9]+", "matches_url"), 10),
+        ])
+        found = {(f.kind, f.transactionId, f.otherTransactionId, f.certain) for f in findings}
+
+        assert found == {
+            ("shadowed", 2, 1, False),
+            ("shadowed", 3, 1, True),
+            ("shadowed", 4, 1, True),
+            ("duplicate", 4, 3, True),
+            ("ambiguous", 3, 2, True),
+            ("ambiguous", 4, 2, True),
+            ("ambiguous", 7, 6, True),
+        }
+
+    def test_distinct_header_values_do_not_overlap(self):
+        tenant = [{"key": "X-Tenant", "matcherName": "equals", "matchingValue": "a"}]
+        other_tenant = [{"key": "x-tenant", "matcherName": "equals", "matchingValue": "b"}]
+        findings = analyze_routes([(http_transaction(1, "GET", "/orders", headers=tenant), None),
+                                   (http_transaction(2, "GET", "/orders", headers=other_tenant), None),
+                                   (http_transaction(3, "GET", "/orders"), None)])
+        assert {(f.kind, f.transactionId, f.otherTransactionId) for f in findings} == {
+            ("ambiguous", 3, 1), ("ambiguous", 3, 2)}
+
+    def test_thousands_of_distinct_routes(self, monkeypatch):
+        compared = []
+        overlaps = routes._Route.overlaps
+        monkeypatch.setattr(routes._Route, "overlaps",
+                            lambda route, other: compared.append((route, other)) or overlaps(route, other))
+        transactions = [(http_transaction(i, "GET", f"/api/v1/resource{i}/items"), None) for i in range(3000)]
+        transactions += [(http_transaction(i, "GET", f"/api/v1/resource{i}/[0-9]+", "matches_url"), None)
+                         for i in range(3000, 4000)]
+        transactions.append((http_transaction(4000, "GET", "/api/v1/resource0/[a-z]+", "matches_url"), None))
+        assert [(f.kind, f.transactionId) for f in analyze_routes(transactions)] == [("ambiguous", 4000)]
+        # The index only pairs routes sharing their segments, not each of the 4001 routes with every other one
+        assert len(compared) == 1
@@ -0,0 +1,145 @@
+import asyncio
+import base64
+import json
+from unittest.mock import patch
+
+import httpx
+
+from sv_mcp.config.token import BzmToken
+from sv_mcp.tools.cache import SandboxPlacementCache
+from sv_mcp.tools.vs import sandbox_manager, http_transaction_manager
+from sv_mcp.tools.vs.http_transaction_manager import HttpTransactionManager
+from sv_mcp.tools.vs.sandbox_manager import SandboxManager
+
+def _encoded(text):
+    return base64.b64encode(text.encode()).decode()
+
+
+class TestRunSuite:
+
+    def test_inits_each_transaction_once_and_reports_failures(self, mock_api, monkeypatch):
+        # A concurrency of 0 still sends the requests one at a time
+        monkeypatch.setenv("SANDBOX_TEST_CONCURRENCY", "0")
+        calls = []
+        sent = []
+        placed = {}
+
+        def handler(request):
+            if request.method == "GET":
+                transaction_id = int(request.url.params["transactionId"])
+                calls.append(("init", transaction_id))
+                placed["id"] = transaction_id
+                return httpx.Response(200, json={"result": {"userId": 1, "serviceId": 2,
+                                                            "transactionId": transaction_id}})
+            sent.append(json.loads(request.content)["httpRequest"])
+            path = sent[-1]["path"]
+            calls.append(("test", placed["id"], path))
+            status = 200 if placed["id"] == 10 else 404
+            return httpx.Response(200, json={"result": {
+                "status": status, "statusMessage": "OK", "body": _encoded(f"order {path}"),
+                "headers": [{"name": "Content-Type", "value": "text/plain"}],
+                "matchingLog": [{"t": 1, "m": f"tested {path}"}]}})
+
+        cases = [
+            {"transactionId": 10, "name": "a", "request": {"method": "GET", "path": "/a", "name": "s"},
+             "expectedStatus": 200, "bodyContains": ["order"], "expectedHeaders": {"content-type": "text/plain"}},
+            {"transactionId": 20, "name": "b", "request": {"method": "GET", "path": "/b", "name": "s"},
+             "expectedStatus": 200},
+            {"transactionId": 10, "name": "c", "request": {"method": "GET", "path": "/c", "name": "s"},
+             "expectedBody": "order /x"},
+        ]
+        manager = SandboxManager(BzmToken("id", "secret"), None)
+        mock_api(handler)
+        with patch.object(sandbox_manager, "sandbox_placements", SandboxPlacementCache(10, 60)):
+            result = asyncio.run(manager.run_suite(1, json.dumps({"cases": cases})))
+
+        assert [call for call in calls if call[0] == "init"] == [("init", 10), ("init", 20)]
+        # Fields without a value are not sent
+        assert all(None not in request.values() and "content" not in request for request in sent)
+        # Requests of a transaction are sent while it is the one placed in the sandbox
+        assert all(call[1] == {"/a": 10, "/c": 10, "/b": 20}[call[2]] for call in calls if call[0] == "test")
+        assert [outcome.passed for outcome in result.result] == [True, False, False]
+        assert result.result[0].matchingLog is None
+        assert result.result[1].failures == ["Expected status 200, got 404"]
+        assert result.result[2].matchingLog[0].m == "tested /c"
+        assert result.error == "2 of 3 cases failed"
+
+
+class TestSandboxPlacements:
+
+    def test_init_is_skipped_until_the_transaction_is_updated(self, mock_api):
+        inits = []
+
+        def handler(request):
+            if request.method == "PUT":
+                return httpx.Response(200, json={"result": {"id": 10, "name": "t", "dsl": {
+                    "requestDsl": {"method": "GET", "path": "/"}, "responseDsl": {"status": 200}}}})
+            inits.append(int(request.url.params["transactionId"]))
+            return httpx.Response(200, json={"result": {"userId": 1, "serviceId": 2,
+                                                        "transactionId": inits[-1]}})
+
+        async def edit_test_loop(token):
+            sandbox = SandboxManager(token, None)
+            await sandbox.init(1, 10)
+            skipped = await sandbox.init(1, 10)
+            await sandbox.init(1, 20)
+            await sandbox.init(1, 10)
+            await HttpTransactionManager(token, None).update(
+                10, "t", 1, {"requestDsl": {"method": "GET", "path": "/"}, "responseDsl": {"status": 200}}, 0)
+            await sandbox.init(1, 10)
+            await sandbox.init(1, 10, force=True)
+            return skipped
+
+        placements = SandboxPlacementCache(10, 60)
+        mock_api(handler)
+        with patch.object(sandbox_manager, "sandbox_placements", placements), \
+                patch.object(http_transaction_manager, "sandbox_placements", placements):
+            skipped = asyncio.run(edit_test_loop(BzmToken("id", "secret")))
+
+        assert inits == [10, 20, 10, 10, 10]
+        assert skipped.result[0].transactionId == 10
+        assert skipped.info == ["Transaction 10 is already in the sandbox, init skipped"]
+
+    def test_placement_made_during_an_update_is_forgotten(self, mock_api):
+        token = BzmToken("id", "secret")
+        placements = SandboxPlacementCache(10, 60)
+
+        def handler(request):
+            # A sandbox init of the old transaction completes while the update is in flight
+            placements.set(token, 1, 10, {"transactionId": 10})
+            return httpx.Response(200, json={"result": {"id": 10, "name": "t", "dsl": {
+                "requestDsl": {"method": "GET", "path": "/"}, "responseDsl": {"status": 200}}}})
+
+        mock_api(handler)
+        with patch.object(http_transaction_manager, "sandbox_placements", placements):
+            asyncio.run(HttpTransactionManager(token, None).update(
+                10, "t", 1, {"requestDsl": {"method": "GET", "path": "/"}, "responseDsl": {"status": 200}}, 0))
+
+        assert placements.get(token, 1, 10) is None
+
+    def test_placing_in_another_workspace_replaces_the_placement(self, mock_api):
+        token = BzmToken("id", "secret")
+        placements = SandboxPlacementCache(10, 60)
+        inits = []
+
+        def handler(request):
+            inits.append(int(request.url.params["transactionId"]))
+            if request.url.params["transactionId"] == "20":
+                # The transaction is updated while it is being placed
+                placements.invalidate_transaction(20)
+            return httpx.Response(200, json={"result": {"userId": 1, "serviceId": 2,
+                                                        "transactionId": inits[-1]}})
+
+        async def scenario():
+            sandbox = SandboxManager(token, None)
+            await sandbox.init(1, 10)
+            await sandbox.init(2, 11)
+            await sandbox.init(1, 10)
+            await sandbox.init(1, 20)
+            await sandbox.init(1, 20)
+
+        mock_api(handler)
+        with patch.object(sandbox_manager, "sandbox_placements", placements):
+            asyncio.run(scenario())
+
+        assert inits == [10, 11, 10, 20, 20]
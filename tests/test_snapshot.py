@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+import httpx
+
+from sv_mcp.config.token import BzmToken
+from sv_mcp.tools.cache import ResponseCache
+from sv_mcp.tools.vs.snapshot_manager import SnapshotManager, ImportCheckpoint
+
+ORDERS_DSL = {"requestDsl": {"method": "GET", "path": "/orders"}, "responseDsl": {"status": 200}}
+
+WORKSPACE = {
+    "/api/v1/workspaces/1/services": [{"id": 1, "name": "shop"}],
+    "/api/v1/workspaces/1/transactions?HTTP": [{"id": 3, "name": "orders", "serviceId": 1, "dsl": ORDERS_DSL}],
+    "/api/v1/workspaces/1/transactions/3/actions": [{
+        "id": 7, "name": "notify", "actionType": "WEBHOOK",
+        "definition": {"urlMethod": "POST", "urlValue": "https://example.com/hook", "bodyContent": ""},
+    }],
+}
+
+
+def _handler(request):
+    key = request.url.path
+    if key.endswith("/transactions"):
+        key += f"?{request.url.params['type']}"
+    entities = WORKSPACE.get(key, [])
+    return httpx.Response(200, json={"result": entities, "total": len(entities)})
+
+
+def _run(mock_api, scenario, cache=None):
+    mock_api(_handler, cache)
+    return asyncio.run(scenario())
+
+
+class TestSnapshotExport:
+
+    def test_writes_one_entity_per_line(self, mock_api, tmp_path):
+        path = tmp_path / "workspace.jsonl"
+        manager = SnapshotManager(BzmToken("id", "secret"), None)
+        cache = ResponseCache(max_size=10)
+
+        result = _run(mock_api, lambda: manager.export(1, str(path)), cache)
+
+        assert result.error is None
+        assert len(cache) == 0
+        assert result.result[0].counts == {"service": 1, "http_transaction": 1, "action": 1}
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert lines[0]["kind"] == "snapshot"
+        assert lines[0]["data"]["workspaceId"] == 1
+        action = next(line for line in lines if line["kind"] == "action")
+        assert action["transactionId"] == 3
+        assert action["data"]["name"] == "notify"
+        assert not (tmp_path / "workspace.jsonl.part").exists()
+
+
+class TestSnapshotImport:
+
+    def test_remaps_ids_and_resumes_from_checkpoint(self, mock_api, tmp_path):
+        path = tmp_path / "workspace.jsonl"
+        lines = [
+            {"kind": "snapshot", "data": {"version": 1, "workspaceId": 1}},
+            {"kind": "template", "data": {"id": 5, "name": "shop-template", "serviceId": 1,
+                                          "noMatchingRequestPreference": "return404",
+                                          "mockServiceTransactions": [{"txnId": 3, "priority": 1}]}},
+            {"kind": "http_transaction", "data": {"id": 3, "name": "orders", "serviceId": 1, "dsl": ORDERS_DSL}},
+            {"kind": "service", "data": {"id": 1, "name": "shop"}},
+        ]
+        path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+        posts = []
+        template_status = [400, 200]
+
+        def handler(request):
+            body = json.loads(request.content)
+            posts.append((request.url.path.rsplit("/", 1)[-1], body))
+            if request.url.path.endswith("/services"):
+                return httpx.Response(200, json={"result": {"id": 11, "name": body["name"]}})
+            if request.url.path.endswith("/transactions"):
+                return httpx.Response(200, json={"result": [
+                    {"id": 13, "name": t["name"], "serviceId": t["serviceId"], "dsl": t["dsl"]}
+                    for t in body["transactions"]]})
+            status = template_status.pop(0)
+            if status != 200:
+                return httpx.Response(status, json={"error": {"message": "Invalid template"}})
+            return httpx.Response(200, json={"result": {"id": 15, **body}})
+
+        manager = SnapshotManager(BzmToken("id", "secret"), None)
+        mock_api(handler)
+        first = asyncio.run(manager.import_snapshot(2, str(path)))
+        second = asyncio.run(manager.import_snapshot(2, str(path)))
+
+        assert first.error is not None
+        assert first.result[0].counts == {"service": 1, "transaction": 1}
+        assert second.error is None
+        assert second.result[0].counts == {"template": 1}
+        assert [kind for kind, _ in posts] == ["services", "transactions", "service-mock-templates",
+                                               "service-mock-templates"]
+        template = posts[-1][1]
+        assert template["serviceId"] == 11
+        assert template["mockServiceTransactions"] == [{"txnId": 13, "priority": 1}]
+
+    def test_checkpoint_keeps_every_id_written_before_a_kill(self, tmp_path):
+        path = str(tmp_path / "import.checkpoint.jsonl")
+        checkpoint = ImportCheckpoint.load(path, 2)
+        checkpoint.open()
+        checkpoint.set("service", 1, 11)
+        checkpoint.set("transaction", 3, 13)
+        # Killed while appending: the file is never closed and its last line is cut short
+        with open(path, "a", encoding="utf-8") as checkpoint_file:
+            checkpoint_file.write('{"kind": "transaction", "ol')
+
+        resumed = ImportCheckpoint.load(path, 2)
+        resumed.open()
+        resumed.set("template", 5, 15)
+        resumed.close()
+
+        assert ImportCheckpoint.load(path, 2).ids == {"service": {"1": 11}, "transaction": {"3": 13},
+                                                      "template": {"5": 15}}
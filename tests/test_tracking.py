@@ -0,0 +1,227 @@
+import asyncio
+import itertools
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from sv_mcp.config.token import BzmToken
+from sv_mcp.models.result import BaseResult
+from sv_mcp.models.vs.trackings import MasterTracking
+from sv_mcp.tools import utils
+from sv_mcp.tools.cache import ResponseCache
+from sv_mcp.tools.vs.messaging_virtual_service_manager import MessagingVirtualServiceManager
+from sv_mcp.tools.vs.tracking_manager import TrackingManager
+from sv_mcp.tools.vs.tracking_registry import TrackingRegistry, describe_tracking
+from sv_mcp.tools.vs.virtual_service_manager import VirtualServiceManager
+
+
+def _tracking(status, stage):
+    return MasterTracking(**{
+        "trackingId": "abc",
+        "status": status,
+        "data": {"serviceMockTrackingDtos": [{
+            "serviceMockId": 1,
+            "serviceMockName": "orders",
+            "trackingDto": {"status": status, "data": {"stage": stage}},
+        }]},
+    })
+
+
+class FakeContext:
+
+    def __init__(self):
+        self.progress = []
+
+    async def report_progress(self, progress, total, message):
+        self.progress.append((progress, total, message))
+
+
+class TestTrackingWait:
+
+    def _wait(self, trackings, monkeypatch, timeout=None, waiters=1):
+        monkeypatch.setenv("TRACKING_POLL_MIN_INTERVAL", "0")
+        monkeypatch.setenv("TRACKING_POLL_MAX_INTERVAL", "0")
+        registry = TrackingRegistry()
+        reads = iter(trackings)
+        contexts = [FakeContext() for _ in range(waiters)]
+
+        async def read(entry):
+            return BaseResult(result=[next(reads)])
+
+        async def scenario():
+            return await asyncio.gather(*[
+                TrackingManager(BzmToken("id", "secret"), ctx).wait("abc", timeout) for ctx in contexts
+            ])
+
+        with patch("sv_mcp.tools.vs.tracking_manager.tracking_registry", registry), \
+                patch.object(registry, "_read", side_effect=read):
+            results = asyncio.run(scenario())
+        return results[0], contexts[0], registry
+
+    def test_waits_until_finished_reporting_stage_changes(self, monkeypatch):
+        result, ctx, _ = self._wait([
+            _tracking("RUNNING", "PROVISIONING"),
+            _tracking("RUNNING", "PROVISIONING"),
+            _tracking("RUNNING", "STARTING"),
+            _tracking("FINISHED", "RUNNING"),
+        ], monkeypatch)
+        assert result.result[0].status == "FINISHED"
+        assert ctx.progress == [
+            (0, 1, "RUNNING - orders: PROVISIONING"),
+            (0, 1, "RUNNING - orders: STARTING"),
+            (1, 1, "FINISHED - orders: RUNNING"),
+        ]
+
+    def test_waiters_share_polls(self, monkeypatch):
+        result, ctx, registry = self._wait([
+            _tracking("RUNNING", "PROVISIONING"),
+            _tracking("FINISHED", "RUNNING"),
+        ], monkeypatch, waiters=3)
+        assert result.result[0].status == "FINISHED"
+        assert len(ctx.progress) == 2
+        assert registry.stats() == {"active": 0, "completed": 1, "subscriptions": 0, "polls": 2}
+        assert [message for _, message in registry.history(BzmToken("id", "secret"), "abc")] == [
+            "RUNNING - orders: PROVISIONING", "FINISHED - orders: RUNNING"
+        ]
+
+    def test_timeout_returns_last_tracking_with_warning(self, monkeypatch):
+        result, _, _ = self._wait(itertools.repeat(_tracking("RUNNING", "PROVISIONING")), monkeypatch, timeout=0.05)
+        assert result.error is None
+        assert result.result[0].status == "RUNNING"
+        assert "still RUNNING" in result.warning[0]
+
+    def test_failed_poll_fails_its_waiters_and_keeps_polling_the_others(self, monkeypatch):
+        monkeypatch.setenv("TRACKING_POLL_MIN_INTERVAL", "0")
+        monkeypatch.setenv("TRACKING_POLL_MAX_INTERVAL", "0")
+        registry = TrackingRegistry()
+        reads = iter([_tracking("RUNNING", "PROVISIONING"), _tracking("FINISHED", "RUNNING")])
+
+        async def read(entry):
+            if entry.tracking_id == "broken":
+                raise ValueError("unexpected payload")
+            return BaseResult(result=[next(reads)])
+
+        async def scenario():
+            manager = TrackingManager(BzmToken("id", "secret"), FakeContext())
+            return await asyncio.gather(manager.wait("broken", 5), manager.wait("abc", 5))
+
+        with patch("sv_mcp.tools.vs.tracking_manager.tracking_registry", registry), \
+                patch.object(registry, "_read", side_effect=read):
+            broken, finished = asyncio.run(scenario())
+        assert broken.error == "Polling tracking broken failed: unexpected payload"
+        assert finished.result[0].status == "FINISHED"
+
+    def test_describe_without_sub_trackings(self):
+        assert describe_tracking(MasterTracking(trackingId="abc", status="FAILED")) == (1, 1, "FAILED")
+
+
+class TestDeployAndWait:
+
+    @pytest.mark.parametrize("manager_class", [VirtualServiceManager, MessagingVirtualServiceManager])
+    def test_returns_deployed_virtual_service_with_stage_timings(self, mock_api, monkeypatch, manager_class):
+        monkeypatch.setenv("TRACKING_POLL_MIN_INTERVAL", "0")
+        monkeypatch.setenv("TRACKING_POLL_MAX_INTERVAL", "0")
+        trackings = iter([("RUNNING", "PROVISIONING", 1000), ("RUNNING", "STARTING", 1004),
+                          ("FINISHED", "RUNNING", 1010)])
+
+        def handler(request):
+            path = request.url.path
+            if path.endswith("/deploy"):
+                return httpx.Response(200, json={"result": {"trackingId": "abc"}})
+            if "/trackings/" in path:
+                status, stage, started = next(trackings)
+                return httpx.Response(200, json={"result": {
+                    "trackingId": "abc", "status": status,
+                    "data": {"serviceMockTrackingDtos": [{
+                        "serviceMockId": 2, "serviceMockName": "orders",
+                        "trackingDto": {"status": status, "data": {"stage": stage, "started": started}},
+                    }]},
+                }})
+            return httpx.Response(200, json={"result": {
+                "id": 2, "name": "orders", "status": "RUNNING", "serviceId": 1, "type": "TRANSACTIONAL",
+                "harborId": "h", "shipId": "s", "noMatchingRequestPreference": "return404",
+                "endpointPreference": "HTTPS", "replicas": 1, "httpRunnerEnabled": True,
+                "endpoints": [{"endpoint": "https://orders.mock"}],
+            }})
+
+        registry = TrackingRegistry()
+        manager = manager_class(BzmToken("id", "secret"), FakeContext())
+
+        mock_api(handler, ResponseCache(max_size=0))
+        with patch("sv_mcp.tools.vs.tracking_manager.tracking_registry", registry), \
+                patch("sv_mcp.tools.vs.deployment.tracking_registry", registry):
+            result = asyncio.run(manager.deploy_and_wait(1, 2))
+
+        assert result.error is None
+        deployment = result.result[0]
+        assert deployment.status == "FINISHED"
+        assert deployment.virtualService.endpoints[0].endpoint == "https://orders.mock"
+        assert [(timing.stage, timing.durationSeconds) for timing in deployment.stageTimings][:2] == [
+            ("PROVISIONING", 4.0), ("STARTING", 6.0)
+        ]
+
+
+class TestBulkAction:
+
+    def test_stops_every_virtual_service_and_reports_failures(self, mock_api, monkeypatch):
+        monkeypatch.setenv("TRACKING_POLL_MIN_INTERVAL", "0")
+        monkeypatch.setenv("BULK_ACTION_CONCURRENCY", "2")
+
+        def handler(request):
+            path = request.url.path
+            if path.endswith("/3/stop"):
+                return httpx.Response(500, json={"error": "cannot stop"})
+            if path.endswith("/stop"):
+                return httpx.Response(200, json={"result": {"trackingId": f"t{path.split('/')[-2]}"}})
+            tracking_id = path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"result": {"trackingId": tracking_id, "status": "FINISHED", "data": {}}})
+
+        registry = TrackingRegistry()
+        manager = VirtualServiceManager(BzmToken("id", "secret"), FakeContext())
+
+        mock_api(handler)
+        with patch.object(utils, "api_retry_policy", utils.RetryPolicy(0, 0, 0, utils.RetryBudget(0, 0))), \
+                patch("sv_mcp.tools.vs.tracking_manager.tracking_registry", registry), \
+                patch("sv_mcp.tools.vs.tracking_registry.tracking_registry", registry):
+            result = asyncio.run(manager.bulk_action("stop", 1, [1, 2, 3]))
+
+        outcomes = {outcome.id: outcome for outcome in result.result}
+        assert outcomes[1].status == outcomes[2].status == "FINISHED"
+        assert outcomes[2].trackingId == "t2"
+        assert outcomes[3].status == "FAILED"
+        assert outcomes[3].errors == ["cannot stop"]
+        assert result.warning == ["stop didn't finish for virtual services [3]"]
+
+    def test_deploy_reads_endpoints_of_the_given_virtual_services(self, mock_api, monkeypatch):
+        monkeypatch.setenv("TRACKING_POLL_MIN_INTERVAL", "0")
+        paths = []
+
+        def handler(request):
+            path = request.url.path
+            paths.append(path)
+            if path.endswith("/deploy"):
+                return httpx.Response(200, json={"result": {"trackingId": f"t{path.split('/')[-2]}"}})
+            if "/trackings/" in path:
+                return httpx.Response(200, json={"result": {"trackingId": path.rsplit("/", 1)[-1],
+                                                            "status": "FINISHED", "data": {}}})
+            vs_id = int(path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"result": {
+                "id": vs_id, "name": f"vs{vs_id}", "status": "RUNNING", "serviceId": 1, "type": "TRANSACTIONAL",
+                "harborId": "h", "shipId": "s", "noMatchingRequestPreference": "return404",
+                "endpointPreference": "HTTPS", "replicas": 1, "httpRunnerEnabled": True,
+                "endpoints": [{"endpoint": f"https://vs{vs_id}.mock"}],
+            }})
+
+        registry = TrackingRegistry()
+        manager = VirtualServiceManager(BzmToken("id", "secret"), FakeContext())
+
+        mock_api(handler)
+        with patch("sv_mcp.tools.vs.tracking_manager.tracking_registry", registry), \
+                patch("sv_mcp.tools.vs.tracking_registry.tracking_registry", registry):
+            result = asyncio.run(manager.bulk_action("deploy", 1, [4, 5]))
+
+        assert [outcome.endpoints[0].endpoint for outcome in result.result] == ["https://vs4.mock", "https://vs5.mock"]
+        assert result.result[0].name == "vs4"
+        # Nothing else of the workspace is listed
+        assert not any(path.endswith("/service-mocks") for path in paths)
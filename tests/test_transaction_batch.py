@@ -0,0 +1,43 @@
+import asyncio
+import json
+
+import httpx
+
+from sv_mcp.config.token import BzmToken
+from sv_mcp.tools.vs.http_transaction_manager import HttpTransactionManager
+
+RESPONSE_DSL = {"requestDsl": {"method": "GET", "path": "/"}, "responseDsl": {"status": 200}}
+
+
+class TestCreateBatch:
+
+    def test_chunks_requests_and_maps_results_to_input_order(self, mock_api):
+        requests = []
+
+        def handler(request):
+            transactions = json.loads(request.content)["transactions"]
+            requests.append(transactions)
+            if any(t["name"] == "bad" for t in transactions):
+                return httpx.Response(400, json={"error": {"message": "Invalid DSL"}})
+            # The server doesn't have to return the transactions in the request order
+            return httpx.Response(200, json={"result": [
+                {"id": int(t["name"][1:]), "name": t["name"], "serviceId": t["serviceId"], "dsl": RESPONSE_DSL}
+                for t in reversed(transactions)]})
+
+        dsl = {"requestDsl": {"method": "GET", "path": "/", "body": [{"matchingValue": "x"}]},
+               "responseDsl": {"status": 200}}
+        transactions = [{"name": f"t{index}", "dsl": dsl} for index in range(5)]
+        transactions.insert(1, {"name": "bad", "dsl": dsl})
+        transactions.append({"dsl": dsl})
+
+        manager = HttpTransactionManager(BzmToken("id", "secret"), None)
+        mock_api(handler)
+        result = asyncio.run(manager.create_batch(1, 9, transactions, batch_size=2))
+
+        assert sorted(len(chunk) for chunk in requests) == [2, 2, 2]
+        assert [outcome.id for outcome in result.result] == [None, None, 1, 2, 3, 4, None]
+        assert result.result[0].error == result.result[1].error is not None
+        assert result.result[6].error == "Missing 'name'"
+        assert result.error == "3 of 7 transactions failed to be created"
+        assert requests[0][0]["dsl"]["requestDsl"]["body"][0]["matchingValue"] == "eA=="
+        assert dsl["requestDsl"]["body"][0]["matchingValue"] == "x"
@@ -0,0 +1,92 @@
+import asyncio
+import base64
+import json
+
+import httpx
+
+from sv_mcp.config.token import BzmToken
+from sv_mcp.converters.wiremock import convert_mapping_file, transaction_to_mapping
+from sv_mcp.models.vs.http_transaction import HttpTransaction
+from sv_mcp.tools.vs.http_transaction_manager import HttpTransactionManager
+
+ORDER_MAPPING = {
+    "name": "create order",
+    "request": {
+        "method": "POST",
+        "urlPathPattern": "/orders/[0-9]+",
+        "headers": {"Accept": {"equalTo": "application/json", "caseInsensitive": True}},
+        "bodyPatterns": [{"matchesJsonPath": "$.item"}],
+    },
+    "response": {"status": 201, "bodyFileName": "order.json", "fixedDelayMilliseconds": 100},
+}
+
+
+def _write_directory(tmp_path, mappings):
+    (tmp_path / "mappings").mkdir()
+    (tmp_path / "__files").mkdir()
+    (tmp_path / "__files" / "order.json").write_text('{"id": 1}')
+    for index, mapping in enumerate(mappings):
+        (tmp_path / "mappings" / f"stub-{index}.json").write_text(json.dumps(mapping))
+    return str(tmp_path)
+
+
+class TestWireMockConversion:
+
+    def test_mapping_round_trip(self, tmp_path):
+        _write_directory(tmp_path, [{"mappings": [ORDER_MAPPING, {"request": {"method": "GET"}}]}])
+        transactions, skipped, errors = convert_mapping_file(str(tmp_path / "mappings" / "stub-0.json"),
+                                                             str(tmp_path / "__files"))
+
+        assert (len(transactions), skipped, errors) == (1, 1, [])
+        dsl = transactions[0]["dsl"]
+        assert (dsl.requestDsl.url.matcherName, dsl.requestDsl.url.matchingValue) == ("matches_url", "/orders/[0-9]+")
+        assert dsl.requestDsl.headers[0].matcherName == "equals_insensitive"
+        assert base64.b64decode(dsl.responseDsl.content) == b'{"id": 1}'
+
+        stored = dsl.model_dump(exclude_none=True)
+        stored["requestDsl"]["body"][0]["matchingValue"] = base64.b64encode(b"$.item").decode("utf-8")
+        stored["responseDsl"]["responseDelay"] = {"type": "FIXED", "duration": 100}
+        mapping = transaction_to_mapping(HttpTransaction(id=3, name="create order", serviceId=1, dsl=stored))
+        assert mapping["request"]["urlPattern"] == "/orders/[0-9]+"
+        assert mapping["request"]["headers"] == {"Accept": {"equalTo": "application/json", "caseInsensitive": True}}
+        assert mapping["request"]["bodyPatterns"] == [{"matchesJsonPath": "$.item"}]
+        assert mapping["response"] == {"status": 201, "body": '{"id": 1}', "fixedDelayMilliseconds": 100}
+
+    def test_body_files_outside_files_directory_are_rejected(self, tmp_path):
+        (tmp_path / "secret.txt").write_text("secret")
+        stubs = [dict(ORDER_MAPPING, response={"status": 200, "bodyFileName": name})
+                 for name in ("../secret.txt", str(tmp_path / "secret.txt"))]
+        _write_directory(tmp_path, stubs)
+
+        for index in range(len(stubs)):
+            transactions, skipped, errors = convert_mapping_file(str(tmp_path / "mappings" / f"stub-{index}.json"),
+                                                                 str(tmp_path / "__files"))
+            assert (transactions, skipped) == ([], 1)
+            assert errors == [f"stub-{index}.json: bodyFileName {stubs[index]['response']['bodyFileName']} "
+                              f"is outside __files"]
+
+
+class TestImportWireMock:
+
+    def test_uploads_converted_mappings(self, mock_api, tmp_path):
+        mappings = [dict(ORDER_MAPPING, name=f"order {i}") for i in range(3)] + ["not a mapping"]
+        directory = _write_directory(tmp_path, mappings)
+        requests = []
+
+        def handler(request):
+            transactions = json.loads(request.content)["transactions"]
+            requests.extend(transactions)
+            return httpx.Response(200, json={"result": [
+                {"id": index, "name": t["name"], "serviceId": t["serviceId"], "dsl": t["dsl"]}
+                for index, t in enumerate(transactions)]})
+
+        manager = HttpTransactionManager(BzmToken("id", "secret"), None)
+        mock_api(handler)
+        result = asyncio.run(manager.import_wiremock(1, 9, directory, batch_size=2))
+
+        summary = result.result[0]
+        assert (summary.entries, summary.created, summary.skipped) == (4, 3, 1)
+        assert len(summary.errors) == 1
+        body = requests[0]["dsl"]["requestDsl"]["body"][0]
+        assert base64.b64decode(body["matchingValue"]) == b"$.item"
+        assert requests[0]["dsl"]["responseDsl"]["responseDelay"]["duration"] == 100